@@ -0,0 +1,68 @@
+# Batch Rescaling Program
+#
+# This program rescales every physical constant and every periodic table property
+# into every unit system under ./modular/unit_scaling/ at the same time.
+#
+# Instead of calling rescale_value_by_units once per constant per system, the
+# constants are turned into a matrix of unit exponents and each unit system into
+# a row of log10 scaling factors. Rescaling everything is then one matrix product.
+
+
+import time
+
+# Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
+from load_mods import load_module, load_dataset
+
+# -----------------------------------------------------------------------
+# STEP 1: Load the datasets and the rescaling utilities
+# -----------------------------------------------------------------------
+
+constants = load_dataset("../data_sets/constants.py", "constants")
+periodic_table = load_dataset("../data_sets/periodic_table.py", "periodic_table")
+
+rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
+batch_rescale = load_module("./modular/batch_rescale.py", "batch_rescale")
+
+# -----------------------------------------------------------------------
+# STEP 2: Calculate the scaling factors for every unit system
+# -----------------------------------------------------------------------
+
+unit_system_registry = load_module("./modular/unit_system_registry.py", "unit_system_registry")
+systems = unit_system_registry.default_registry().all_factors(constants)
+
+# -----------------------------------------------------------------------
+# STEP 3: Build the exponent table and rescale it into every system at once
+# -----------------------------------------------------------------------
+
+entries = (batch_rescale.constant_entries(constants.grouped_constants)
+           + batch_rescale.periodic_table_entries(periodic_table.periodic_table))
+table = batch_rescale.build_exponent_table(entries)
+
+start = time.perf_counter()
+names, rescaled = batch_rescale.rescale_table(table, systems)
+batch_seconds = time.perf_counter() - start
+
+# -----------------------------------------------------------------------
+# STEP 4: Compare against rescaling one value at a time
+# -----------------------------------------------------------------------
+
+start = time.perf_counter()
+worst = 0.0
+for col, name in enumerate(names):
+    for row, (key, data) in enumerate(entries):
+        if data.get("value") is None:
+            continue
+        value, units_applied = rescale_units.rescale_value_by_units(data, systems[name])
+        if value != 0 and rescaled[row, col] == rescaled[row, col]:
+            worst = max(worst, abs(rescaled[row, col] - value) / abs(value))
+loop_seconds = time.perf_counter() - start
+
+print(f"\n   Rescaled {len(table)} entries over {len(table.symbols)} unit symbols into {len(names)} unit systems")
+print(f"   Batch rescale:      {batch_seconds * 1e3:10.3f} ms")
+print(f"   One at a time:      {loop_seconds * 1e3:10.3f} ms")
+print(f"   Largest relative difference: {worst:.3e}")
+
+print(f"\n   {'Symbol':<8} {'Constant Name':<32} " + " ".join(f"{name:>12}" for name in names[:6]))
+for row, ((group_name, name), data) in enumerate(entries[:12]):
+    print(f"   {data.get('symbol', ''):<8} {name:<32} " + " ".join(f"{value:12.4e}" for value in rescaled[row, :6]))
+print()
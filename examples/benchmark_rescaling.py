@@ -0,0 +1,108 @@
+# Rescaling Benchmark Program
+#
+# This program times the core of the Physics Unit Coordinate System: loading modules, calculating
+# the scaling factors of every unit system, resolving composite units, and rescaling every constant
+# and element property. It reports the time, throughput and peak memory of each, writes them as JSON,
+# and compares them against a baseline saved by an earlier run to catch regressions.
+#
+# Examples:
+#   python benchmark_rescaling.py --save-baseline        # record the baseline
+#   python benchmark_rescaling.py                        # compare against it
+#   python benchmark_rescaling.py --systems si planck --repeat 10 --threshold 0.2
+#   python benchmark_rescaling.py --synthetic 1000 10000 100000 --synthetic-composites 100 1000 --repeat 1
+
+
+import argparse
+import sys
+
+# Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
+from load_mods import load_module, load_dataset
+
+benchmark = load_module("./modular/benchmark.py", "benchmark")
+unit_system_registry = load_module("./modular/unit_system_registry.py", "unit_system_registry")
+
+registry = unit_system_registry.default_registry()
+
+parser = argparse.ArgumentParser(description="Benchmark the rescaling core.")
+parser.add_argument('--systems', nargs='+', choices=registry.names(), default=None,
+                    help='Unit systems to benchmark (default: all of them)')
+parser.add_argument('--repeat', type=int, default=5, help='Timed runs per benchmark, the best is reported')
+parser.add_argument('--output', default='./benchmark_results.json', help='Where to write the results')
+parser.add_argument('--baseline', default='./benchmark_baseline.json', help='The baseline to compare against')
+parser.add_argument('--save-baseline', action='store_true', help='Save the results as the new baseline')
+parser.add_argument('--threshold', type=float, default=0.10,
+                    help='Fraction slower than the baseline that counts as a regression (default 0.10)')
+parser.add_argument('--synthetic', nargs='+', type=int, default=[], metavar='N',
+                    help='Also benchmark rescaling synthetic catalogs of these sizes')
+parser.add_argument('--synthetic-composites', nargs='+', type=int, default=[], metavar='N',
+                    help='Also benchmark resolving synthetic composite unit graphs of these sizes')
+parser.add_argument('--composite-depth', type=int, default=4, help='Layers in the synthetic composite graphs')
+args = parser.parse_args()
+
+# -----------------------------------------------------------------------
+# STEP 1: Load the datasets and build the benchmarks
+# -----------------------------------------------------------------------
+
+constants = load_dataset("../data_sets/constants.py", "constants")
+periodic_table = load_dataset("../data_sets/periodic_table.py", "periodic_table")
+
+# Intern the units the same way the programs in this directory do
+unit_vector = load_module("./modular/unit_vector.py", "unit_vector")
+constants.grouped_constants = unit_vector.intern_units(constants.grouped_constants)
+periodic_table.periodic_table = unit_vector.intern_units(periodic_table.periodic_table)
+
+benchmarks = benchmark.core_benchmarks(constants.grouped_constants, periodic_table.periodic_table,
+                                       registry, args.systems)
+for system in (args.systems or ["si"]) if args.synthetic else []:
+    benchmarks += benchmark.scaling_benchmarks(args.synthetic, constants.grouped_constants, registry, system)
+benchmarks += benchmark.composite_scaling_benchmarks(args.synthetic_composites, constants.grouped_constants,
+                                                     registry, args.composite_depth)
+
+# -----------------------------------------------------------------------
+# STEP 2: Run them
+# -----------------------------------------------------------------------
+
+print(f"\n   {'Benchmark':<44} {'Best (ms)':>12} {'Median (ms)':>12} {'Items/s':>14} {'Peak (KiB)':>11}")
+print("   " + "-" * 97)
+
+def progress(bench, result):
+    print(f"   {bench.name:<44} {result['seconds_best'] * 1e3:12.4f} {result['seconds_median'] * 1e3:12.4f}"
+          f" {result['items_per_second']:14.1f} {result['peak_bytes'] / 1024:11.1f}")
+
+document = benchmark.run_benchmarks(benchmarks, args.repeat, progress)
+
+# Scaling curves: how the time per item changes with the size of the synthetic data
+curves = {}
+for name, result in document["results"].items():
+    if "[n=" in name:
+        curve, size = name[:-1].split("[n=")
+        curves.setdefault(curve, {})[int(size)] = result["seconds_best"] / result["items"] * 1e6
+for curve, points in curves.items():
+    print(f"\n   {curve + ' (microseconds per item)':<56} " + " ".join(f"{'n=' + str(size):>12}" for size in points))
+    print(f"   {'':<56} " + " ".join(f"{value:12.4f}" for value in points.values()))
+
+benchmark.save_results(args.output, document)
+print(f"\n   Results written to {args.output}")
+
+# -----------------------------------------------------------------------
+# STEP 3: Compare against the baseline
+# -----------------------------------------------------------------------
+
+regressions = 0
+if args.save_baseline:
+    benchmark.save_results(args.baseline, document)
+    print(f"   Baseline saved to {args.baseline}")
+else:
+    baseline = benchmark.load_results(args.baseline)
+    if baseline is None:
+        print(f"   No baseline at {args.baseline}, run with --save-baseline to record one")
+    else:
+        print(f"\n   {'Benchmark':<44} {'Baseline (ms)':>14} {'Now (ms)':>12} {'Ratio':>8}")
+        print("   " + "-" * 82)
+        for name, before, now, ratio, regressed in benchmark.compare(document, baseline, args.threshold):
+            regressions += regressed
+            print(f"   {name:<44} {before * 1e3:14.4f} {now * 1e3:12.4f} {ratio:8.3f}{'  REGRESSION' if regressed else ''}")
+        print(f"\n   {regressions} regression(s) beyond {args.threshold:.0%}")
+
+print()
+sys.exit(1 if regressions else 0)
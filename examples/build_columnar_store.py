@@ -0,0 +1,45 @@
+# Build Columnar Store
+#
+# Writes the constants and the periodic table properties into memory mapped
+# columnar files next to the datasets:
+#
+#   ../data_sets/constants.columns
+#   ../data_sets/periodic_table.columns
+#
+# Numeric programs can open these with columnar_store.open_columnar_store and get
+# NumPy arrays of values and unit exponents that are shared between every process
+# that opens the same file. The prose fields are kept in a separate section that
+# is only decoded when asked for.
+
+import os
+import time
+
+# Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
+from load_mods import load_module, load_dataset
+
+batch_rescale = load_module("./modular/batch_rescale.py", "batch_rescale")
+columnar_store = load_module("./modular/columnar_store.py", "columnar_store")
+
+constants = load_dataset("../data_sets/constants.py", "constants")
+periodic_table = load_dataset("../data_sets/periodic_table.py", "periodic_table")
+
+stores = [
+    ("../data_sets/constants.columns",
+     batch_rescale.constant_entries(constants.grouped_constants), constants.source_sha256),
+    ("../data_sets/periodic_table.columns",
+     batch_rescale.periodic_table_entries(periodic_table.periodic_table), periodic_table.source_sha256),
+]
+
+for path, entries, source_sha256 in stores:
+    start = time.perf_counter()
+    rows = columnar_store.write_columnar_store(path, entries, source_sha256)
+    elapsed = time.perf_counter() - start
+    print(f"   {path:<36} {rows:>5} rows {os.path.getsize(path):>8} bytes {elapsed * 1e3:8.2f} ms")
+
+# Open one back up and show that it rescales like the dictionaries do
+scaling = load_module("./modular/unit_scaling/natural_scaling.py", "natural_scaling")
+with columnar_store.open_columnar_store("../data_sets/constants.columns", constants.source_sha256) as store:
+    names, rescaled = batch_rescale.rescale_table(store, {"natural": scaling.calculate_scaling_factors(constants.grouped_constants)})
+    row = store.row(("Core Scaling Constants", "planck_constant_h"))
+    print(f"\n   {store.labels[row]} = {store.values[row]:.10e} -> {rescaled[row, 0]:.10e} in natural units")
+    print(f"   {store.text(row)['comment']}")
@@ -0,0 +1,21 @@
+# Build Data Snapshots
+#
+# Writes a marshal snapshot next to each dataset in ../data_sets so programs that
+# load the data with load_dataset can skip executing the large source files.
+#
+# A snapshot records the sha256 of the source it was built from, and load_dataset
+# ignores a snapshot that no longer matches its source, so rerunning this after
+# editing a dataset is optional. load_dataset rebuilds stale snapshots on its own
+# when the directory is writable.
+
+import glob
+import os
+import time
+
+from load_mods import write_snapshot
+
+for file_path in sorted(glob.glob("../data_sets/*.py")):
+    start = time.perf_counter()
+    path = write_snapshot(file_path)
+    elapsed = time.perf_counter() - start
+    print(f"   {file_path:<32} -> {path:<38} {os.path.getsize(path):>8} bytes {elapsed * 1e3:8.2f} ms")
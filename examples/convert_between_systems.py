@@ -0,0 +1,65 @@
+# Convert Between Unit Systems
+#
+# This program converts quantities directly from one PUCS unit system to another,
+# for example from imperial to atomic_electron, without going back through SI.
+#
+# The conversion tensor holds the ratio of the scaling factors of every pair of
+# unit systems for every base and composite unit, so a conversion is a lookup
+# and a multiply.
+
+import time
+
+# Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
+from load_mods import load_module, load_dataset
+
+constants = load_dataset("../data_sets/constants.py", "constants")
+
+unit_system_registry = load_module("./modular/unit_system_registry.py", "unit_system_registry")
+conversion_tensor = load_module("./modular/conversion_tensor.py", "conversion_tensor")
+rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
+
+# -----------------------------------------------------------------------
+# STEP 1: Build the tensor over every registered unit system
+# -----------------------------------------------------------------------
+
+registry = unit_system_registry.default_registry()
+systems = registry.all_factors(constants)
+
+start = time.perf_counter()
+tensor = conversion_tensor.build_conversion_tensor(systems)
+elapsed = time.perf_counter() - start
+print(f"\n   Built a {len(tensor.names)} x {len(tensor.names)} x {len(tensor.symbols)} conversion tensor in {elapsed * 1e3:.3f} ms")
+
+# -----------------------------------------------------------------------
+# STEP 2: Convert a few quantities from imperial to atomic_electron
+# -----------------------------------------------------------------------
+
+source, target = "imperial", "atomic_electron"
+quantities = [
+    ("1 ft",          1.0,   [("m", 1)]),
+    ("1 lbm",         1.0,   [("kg", 1)]),
+    ("1 J_i",         1.0,   [("J", 1)]),
+    ("60 mph",        88.0,  [("m", 1), ("s", -1)]),
+    ("1 Pa_i",        1.0,   [("Pa", 1)]),
+]
+
+print(f"\n   {'Quantity':<10} {source:>14} -> {target:<16} {'via SI':>14}  units")
+for label, value, units in quantities:
+    converted, units_applied = tensor.convert(value, units, source, target)
+
+    # The long way round, rescaling the imperial value back to SI and then out again
+    to_si = 1.0 / rescale_units.rescale_value_by_units({"value": 1.0, "units": units}, systems[source])[0]
+    via_si, _ = rescale_units.rescale_value_by_units({"value": value * to_si, "units": units}, systems[target])
+
+    print(f"   {label:<10} {value:>14.6e} -> {converted:<16.6e} {via_si:>14.6e}  {units_applied.text}")
+
+# -----------------------------------------------------------------------
+# STEP 3: Convert a whole array of values at once
+# -----------------------------------------------------------------------
+
+lengths_ft = [float(n) for n in range(1, 100001)]
+start = time.perf_counter()
+lengths = tensor.convert_array(lengths_ft, [("m", 1)], source, target)
+elapsed = time.perf_counter() - start
+print(f"\n   Converted {len(lengths)} lengths from {source} to {target} in {elapsed * 1e3:.3f} ms")
+print()
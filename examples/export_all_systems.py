@@ -0,0 +1,163 @@
+# Parallel Export Program
+#
+# This program writes the rescaled constants of every unit system under ./modular/unit_scaling/
+# in every output format of print_outputs, without editing scaling_choice by hand for each run.
+#
+# Each (unit system, output format) pair is one task. The tasks are spread over a pool of
+# worker processes, every task writes its own file, and the time each task took is reported.
+#
+# A manifest of content hashes is kept next to the files (see modular/export_manifest.py), so a
+# later run only rescales the constants whose entry or unit system changed, and only rewrites the
+# files they appear in. --full ignores the manifest and regenerates everything.
+#
+# Examples:
+#   python export_all_systems.py
+#   python export_all_systems.py --systems si planck --formats c latex --output-dir ./headers
+#   python export_all_systems.py --workers 1
+#   python export_all_systems.py --full
+
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
+from load_mods import load_module, load_dataset
+
+print_outputs = load_module("./modular/print_outputs.py", "print_outputs")
+unit_system_registry = load_module("./modular/unit_system_registry.py", "unit_system_registry")
+export_manifest = load_module("./modular/export_manifest.py", "export_manifest")
+
+registry = unit_system_registry.default_registry()
+
+parser = argparse.ArgumentParser(
+    description="Export the rescaled constants of many unit systems in many formats in parallel.")
+parser.add_argument('--systems', nargs='+', choices=registry.names(), default=registry.names(),
+                    help='Unit systems to export (default: all of them)')
+parser.add_argument('--formats', nargs='+', choices=list(print_outputs.WRITERS), default=list(print_outputs.WRITERS),
+                    help='Output formats to export (default: all of them)')
+parser.add_argument('--output-dir', default='./exported', help='Directory the files are written to')
+parser.add_argument('--workers', type=int, default=None, help='Number of worker processes (default: one per CPU)')
+parser.add_argument('--suffix', default='', help='Suffix to append to symbol names')
+parser.add_argument('--structured', action='store_true', help='Write json and xml with a real encoder')
+parser.add_argument('--full', action='store_true', help='Ignore the manifest and regenerate every file')
+
+
+def export_path(output_dir, system, output_format):
+    """Returns the file one (unit system, output format) task writes, e.g. ./exported/planck_constants.h"""
+    return os.path.join(output_dir, f"{system}_constants.{print_outputs.WRITERS[output_format].extension}")
+
+
+def export_task(system, output_format, output_dir, suffix="", structured=False, previous=None):
+    """
+    Writes the constants of one unit system in one format. Runs in a worker process.
+
+    Parameters:
+        previous (dict): The unit system's entry in the manifest of the last export, if any.
+                         Rows it holds are reused, and the file is not written at all
+                         when nothing it depends on has changed.
+
+    Returns:
+        tuple: (system, output_format, path, seconds, recomputed, record) where seconds covers
+               loading the scaling factors, rescaling and writing the file, recomputed is the
+               number of constants that had to be rescaled (None if the file was left alone),
+               and record is the unit system's new manifest entry.
+    """
+    start = time.perf_counter()
+
+    # The dataset, the scaling module and its factor table are cached per worker process,
+    # so a worker that gets several tasks for the same system only computes them once.
+    constants = load_dataset("../data_sets/constants.py", "constants")
+    unit_scaling = registry.factors(system, constants)
+    rescale_plan = registry.plan(system, constants)
+
+    path = export_path(output_dir, system, output_format)
+    record = {
+        "module_sha256": registry.module_sha256(system),
+        "code_sha256": export_manifest.code_sha256(),
+        "factors_sha256": export_manifest.factors_sha256(unit_scaling),
+        "entries": export_manifest.constant_hashes(constants.grouped_constants),
+    }
+    file_record = {"path": path, "suffix": suffix, "structured": structured}
+
+    previous = previous or {}
+    # Rows and files are only current for the module, factor table and code they were made with
+    same_factors = all(previous.get(key) == record[key]
+                       for key in ("module_sha256", "code_sha256", "factors_sha256"))
+
+    if (same_factors and previous.get("entries") == record["entries"]
+            and previous.get("files", {}).get(output_format) == file_record and os.path.exists(path)):
+        record["rows"] = previous["rows"]
+        record["files"] = {output_format: file_record}
+        return system, output_format, path, time.perf_counter() - start, None, record
+
+    # Cached rows are only valid for the factor table and code they were rescaled with
+    rescale = export_manifest.IncrementalRescale(rescale_plan, previous.get("rows") if same_factors else None)
+    with open(path, "w", encoding="utf-8") as sink:
+        writer = print_outputs.get_writer(output_format, sink, suffix, structured=structured)
+        print_outputs.write_outputs(constants.grouped_constants, unit_scaling, rescale, [writer])
+
+    record["rows"] = rescale.rows
+    record["files"] = {output_format: file_record}
+    return system, output_format, path, time.perf_counter() - start, rescale.recomputed, record
+
+
+def export_all(systems, formats, output_dir, workers=None, suffix="", structured=False, full=False):
+    """
+    Runs one export task per (unit system, output format) pair over a process pool,
+    and updates the manifest of output_dir with what was written.
+
+    Returns:
+        list: The (system, output_format, path, seconds, recomputed) result of each task,
+              in completion order.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = export_manifest.load_manifest(output_dir)
+    if full:
+        manifest["systems"] = {}
+    previous = manifest["systems"]
+
+    results = []
+    records = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        tasks = [pool.submit(export_task, system, output_format, output_dir, suffix, structured, previous.get(system))
+                 for system in systems for output_format in formats]
+        for task in as_completed(tasks):
+            system, output_format, path, seconds, recomputed, record = task.result()
+            results.append((system, output_format, path, seconds, recomputed))
+
+            # Every task of a system sees the same entries and factors, only the files differ
+            merged = records.setdefault(system, dict(record, files={}))
+            merged["files"].update(record["files"])
+
+    for system, record in records.items():
+        old = previous.get(system, {})
+        if all(old.get(key) == record[key]
+               for key in ("module_sha256", "code_sha256", "factors_sha256", "entries")):
+            # formats that were not exported this time are still current
+            record["files"] = dict(old.get("files", {}), **record["files"])
+        previous[system] = record
+    export_manifest.write_manifest(output_dir, manifest)
+
+    return results
+
+
+if __name__ == "__main__":
+    args, _ = parser.parse_known_args()
+
+    start = time.perf_counter()
+    results = export_all(args.systems, args.formats, args.output_dir,
+                         args.workers, args.suffix, args.structured, args.full)
+    total_seconds = time.perf_counter() - start
+
+    print(f"\n   {'System':<16} {'Format':<10} {'Time (ms)':>10} {'Rescaled':>9}   File")
+    for system, output_format, path, seconds, recomputed in sorted(results):
+        status = "unchanged" if recomputed is None else recomputed
+        print(f"   {system:<16} {output_format:<10} {seconds * 1e3:10.3f} {status:>9}   {path}")
+
+    task_seconds = sum(result[3] for result in results)
+    written = sum(1 for result in results if result[4] is not None)
+    print(f"\n   Exported {len(results)} files ({written} written) in {total_seconds * 1e3:.3f} ms wall time"
+          f" ({task_seconds * 1e3:.3f} ms of task time)")
+    print()
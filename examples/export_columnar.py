@@ -0,0 +1,58 @@
+# Columnar Export Program
+#
+# This program rescales every physical constant into every unit system under ./modular/unit_scaling/
+# and writes the result as one columnar table to a NumPy .npz file, ready to be loaded into a dataframe.
+#
+# Examples:
+#   python export_columnar.py
+#   python export_columnar.py --output ./exported/constants.npz
+
+
+import argparse
+import os
+import time
+
+# Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
+from load_mods import load_module, load_dataset
+
+parser = argparse.ArgumentParser(
+    description="Export the constants of every unit system as a columnar .npz table.")
+parser.add_argument('--output', default='./exported/constants.npz', help='The .npz file to write')
+args = parser.parse_args()
+
+# -----------------------------------------------------------------------
+# STEP 1: Load the constants and the scaling factors of every unit system
+# -----------------------------------------------------------------------
+
+constants = load_dataset("../data_sets/constants.py", "constants")
+
+batch_rescale = load_module("./modular/batch_rescale.py", "batch_rescale")
+columnar_export = load_module("./modular/columnar_export.py", "columnar_export")
+unit_system_registry = load_module("./modular/unit_system_registry.py", "unit_system_registry")
+
+systems = unit_system_registry.default_registry().all_factors(constants)
+
+# -----------------------------------------------------------------------
+# STEP 2: Build the cross system table and write it
+# -----------------------------------------------------------------------
+
+start = time.perf_counter()
+columns = columnar_export.build_columns(batch_rescale.constant_entries(constants.grouped_constants), systems)
+build_seconds = time.perf_counter() - start
+
+os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+columnar_export.write_npz(args.output, columns)
+
+# -----------------------------------------------------------------------
+# STEP 3: Load it back to show how long that takes
+# -----------------------------------------------------------------------
+
+start = time.perf_counter()
+loaded = columnar_export.load_npz(args.output)
+load_seconds = time.perf_counter() - start
+
+print(f"\n   Wrote {len(loaded['system'])} rows for {len(systems)} unit systems to {args.output}")
+print(f"   Columns: {', '.join(loaded)}")
+print(f"   Build:     {build_seconds * 1e3:10.3f} ms")
+print(f"   Load:      {load_seconds * 1e3:10.3f} ms")
+print()
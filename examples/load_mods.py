@@ -1,20 +1,190 @@
+import hashlib
 import importlib.util
+import marshal
 import os
+import types
 
-def load_module(file_path, module_name):
+# Modules that have already been executed, so loading the same file again is free.
+# (resolved file path, module name) -> (mtime_ns, size, sha256 of the source, module)
+_module_cache = {}
+
+# Digests of dataset sources, so a current snapshot is used without reading the source.
+# resolved file path -> (mtime_ns, size, sha256 of the source)
+_digest_cache = {}
+
+def _source_digest(path):
+    with open(path, "rb") as source:
+        return hashlib.sha256(source.read()).hexdigest()
+
+def _cached_digest(path):
+    # like load_module, a file is only hashed again when its modification time or size changed
+    stat = os.stat(path)
+    cached = _digest_cache.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    digest = _source_digest(path)
+    _digest_cache[path] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+def source_sha256(file_path):
+    """Returns the sha256 of a module or dataset source file, e.g. to tell whether it was edited."""
+    return _source_digest(os.path.realpath(file_path))
+
+def load_module(file_path, module_name, reload=False):
     """
     Dynamically loads a module from a specified file path.
-    
+
+    Each file is only executed once per process and module name. Later calls for
+    the same file and name return the module that was already loaded, as long as the file has not
+    changed. A file whose modification time or size changed is hashed, and is
+    only executed again if its contents are really different.
+
     Parameters:
         file_path (str): Path to the module file.
         module_name (str): Name to assign to the loaded module.
-    
+        reload (bool): Execute the file again even if it is cached, for
+                       interactive use where a fresh copy of the module is wanted.
+
     Returns:
         module: Loaded module object.
     """
 
+    path = os.path.realpath(file_path)
+    stat = os.stat(path)
+    key = (path, module_name)
+
+    cached = _module_cache.get(key)
+    if cached is not None and not reload:
+        mtime_ns, size, digest, module = cached
+        if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+            return module
+
+        # The file was touched, but only run it again if the contents changed
+        if _source_digest(path) == digest:
+            _module_cache[key] = (stat.st_mtime_ns, stat.st_size, digest, module)
+            return module
+
+    digest = _source_digest(path)
+
     spec = importlib.util.spec_from_file_location(module_name, file_path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
 
+    _module_cache[key] = (stat.st_mtime_ns, stat.st_size, digest, module)
+
     return module
+
+
+# -----------------------------------------------------------------------
+# Dataset snapshots
+#
+# The files in ../data_sets are large dictionary literals, and executing them
+# costs far more than the data is worth to a short program. A snapshot is the
+# data of one of those files stored with marshal, next to the source file,
+# together with the sha256 of the source it was made from. Loading a snapshot
+# skips parsing and compiling the source entirely.
+# -----------------------------------------------------------------------
+
+SNAPSHOT_FORMAT = 1
+
+# Types marshal can store and a dataset is expected to contain
+_DATA_TYPES = (dict, list, tuple, str, int, float, bool, type(None))
+
+def snapshot_path(file_path):
+    """Returns the path of the snapshot for a dataset source file, e.g. constants.py -> constants.snapshot"""
+    return os.path.splitext(file_path)[0] + ".snapshot"
+
+def _dataset_values(module):
+    values = {}
+    for name, value in vars(module).items():
+        if name.startswith("_") or isinstance(value, types.ModuleType):
+            continue
+        if not isinstance(value, _DATA_TYPES):
+            raise ValueError(f"{module.__name__}.{name} is not plain data and can not be snapshotted")
+        values[name] = value
+    return values
+
+def write_snapshot(file_path, module_name=None):
+    """
+    Executes a dataset source file and writes its snapshot.
+
+    Parameters:
+        file_path (str): Path to the dataset file, e.g. "../data_sets/constants.py".
+        module_name (str): Name to load the module under, defaults to the file name.
+
+    Returns:
+        str: Path of the snapshot that was written.
+    """
+    if module_name is None:
+        module_name = os.path.splitext(os.path.basename(file_path))[0]
+    module = load_module(file_path, module_name)
+    snapshot = {
+        "format": SNAPSHOT_FORMAT,
+        "source_sha256": _source_digest(os.path.realpath(file_path)),
+        "data": _dataset_values(module),
+    }
+
+    # write next to the final name and move it into place, so a reader never sees half a file
+    path = snapshot_path(file_path)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "wb") as output:
+            marshal.dump(snapshot, output)
+        os.replace(temporary_path, path)
+    except OSError:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+    return path
+
+def load_dataset(file_path, module_name=None):
+    """
+    Loads the data of a dataset file, from its snapshot when the snapshot is current.
+
+    The snapshot is only used if it was made from a source file with the same sha256
+    as the one on disk now; the sha256 is only worked out again when the source's
+    modification time or size changed. Otherwise the source file is executed, and
+    the snapshot is rewritten for next time if the directory is writable and the
+    dataset is plain data.
+
+    Either way the values are a fresh copy, so a caller can change them without
+    affecting other callers. A dataset with values that are not plain data can not
+    be snapshotted or copied, and its values are the module's own.
+
+    Parameters:
+        file_path (str): Path to the dataset file, e.g. "../data_sets/constants.py".
+        module_name (str): Name to load the module under, defaults to the file name.
+
+    Returns:
+        SimpleNamespace: The dataset's top level values as attributes, e.g.
+                         load_dataset("../data_sets/constants.py").grouped_constants,
+                         plus source_sha256 identifying the version of the data.
+    """
+    digest = _cached_digest(os.path.realpath(file_path))
+
+    try:
+        with open(snapshot_path(file_path), "rb") as source:
+            snapshot = marshal.load(source)
+        if snapshot["format"] == SNAPSHOT_FORMAT and snapshot["source_sha256"] == digest:
+            return types.SimpleNamespace(source_sha256=digest, **snapshot["data"])
+    except (OSError, EOFError, ValueError, TypeError, KeyError):
+        pass  # missing or unreadable snapshot, fall back to the source
+
+    if module_name is None:
+        module_name = os.path.splitext(os.path.basename(file_path))[0]
+    module = load_module(file_path, module_name)
+    try:
+        # a copy made the way a snapshot is read, so both paths hand out the same kind of data
+        values = marshal.loads(marshal.dumps(_dataset_values(module)))
+    except ValueError:
+        # not plain data, so there is no snapshot, and nothing to copy it like
+        values = {name: value for name, value in vars(module).items()
+                  if not name.startswith("_") and not isinstance(value, types.ModuleType)}
+        return types.SimpleNamespace(source_sha256=digest, **values)
+
+    try:
+        write_snapshot(file_path, module_name)
+    except (OSError, ValueError):
+        pass  # read only data directory, keep working from the source
+
+    return types.SimpleNamespace(source_sha256=digest, **values)
@@ -0,0 +1,193 @@
+'''
+ Batch rescaling of whole tables of constants
+
+ rescale_value_by_units works on one constant at a time. Rescaling every
+ constant into every unit system that way is a Python loop over
+ constants x systems x units. The arithmetic underneath is simple:
+
+     rescaled = value / prod(factor[symbol] ** power)
+
+ Taking log10 of both sides turns the product into a sum:
+
+     log10(rescaled / value) = - sum(power * log10(factor[symbol]))
+
+ If every constant is a row of exponents over the same list of unit
+ symbols, and every unit system is a row of log10 factors over that same
+ list, the sums for all constants in all systems are a single matrix
+ product. This module builds those matrices and does that product.
+
+ The values are the same as rescale_value_by_units up to floating point
+ rounding, since the factors are multiplied in log space instead of
+ divided one at a time.
+'''
+
+import numpy as np
+
+
+def constant_entries(grouped_constants):
+    """
+    Flattens the grouped constants into (key, data) pairs.
+
+    Parameters:
+        grouped_constants (dict): The grouped_constants dictionary from data_sets/constants.py.
+
+    Returns:
+        list: (group_name, constant_name) keys paired with the constant's dictionary.
+    """
+    entries = []
+    for group_name, group_data in grouped_constants.items():
+        for name, data in group_data.items():
+            if isinstance(data, dict) and "value" in data and "units" in data:
+                entries.append(((group_name, name), data))
+    return entries
+
+
+def periodic_table_entries(periodic_table):
+    """
+    Flattens the physical properties of the periodic table into (key, data) pairs.
+
+    Parameters:
+        periodic_table (dict): The periodic_table dictionary from data_sets/periodic_table.py.
+
+    Returns:
+        list: (element_symbol, property_name) keys paired with the property's dictionary.
+              Properties with no value are kept and show up as NaN.
+    """
+    entries = []
+    for atomic_number, element in periodic_table.items():
+        for property_name, property_details in element["physical_properties"].items():
+            entries.append(((element["symbol"], property_name), property_details))
+    return entries
+
+
+class ExponentTable:
+    """
+    A dense exponent matrix and value vector for a list of constants.
+
+    Attributes:
+        keys (list): One key per row, in the order the entries were given.
+        symbols (list): One unit symbol per column, in the order they were first seen.
+        column (dict): Maps a unit symbol to its column number.
+        values (ndarray): The original values, shape (rows,). Missing values are NaN.
+        exponents (ndarray): The power of each symbol in each row, shape (rows, columns).
+        present (ndarray): True where a row lists a symbol at all, even with a power of 0.
+    """
+
+    def __init__(self, entries):
+        self.keys = []
+        self.symbols = []
+        self.column = {}
+
+        values = []
+        cells = []
+        for key, data in entries:
+            row = len(self.keys)
+            self.keys.append(key)
+            value = data.get("value")
+            values.append(np.nan if value is None else value)
+            for unit_symbol, power in data.get("units", []):
+                col = self.column.get(unit_symbol)
+                if col is None:
+                    col = len(self.symbols)
+                    self.column[unit_symbol] = col
+                    self.symbols.append(unit_symbol)
+                cells.append((row, col, power))
+
+        self.values = np.array(values, dtype=np.float64)
+        self.exponents = np.zeros((len(self.keys), len(self.symbols)), dtype=np.float64)
+        self.present = np.zeros(self.exponents.shape, dtype=bool)
+        for row, col, power in cells:
+            # a symbol listed twice in one units list multiplies, so its powers add
+            self.exponents[row, col] += power
+            self.present[row, col] = True
+
+    def __len__(self):
+        return len(self.keys)
+
+
+def build_exponent_table(entries):
+    """
+    Builds an ExponentTable from (key, data) pairs, where each data dictionary
+    has a "value" and a "units" list like [("kg", 1), ("m", -2)].
+    """
+    return ExponentTable(entries)
+
+
+def factor_matrix(symbols, systems):
+    """
+    Lays out the scaling factor lists of several unit systems as rows of factors.
+
+    Parameters:
+        symbols (list): The unit symbols, one per column, usually ExponentTable.symbols.
+        systems (dict): Maps a system name to its scaling factor list, as returned by
+                        calculate_scaling_factors.
+
+    Returns:
+        tuple: (names, factors) where factors has shape (systems, columns). A symbol
+               a system does not scale gets a factor of 1, which leaves it unchanged
+               just like rescale_value_by_units does.
+    """
+    names = list(systems)
+    column = {symbol: col for col, symbol in enumerate(symbols)}
+    factors = np.ones((len(names), len(symbols)), dtype=np.float64)
+
+    for row, name in enumerate(names):
+        seen = set()
+        for mode in systems[name]:
+            col = column.get(mode["symbol"])
+            # the first entry for a symbol wins, as in rescale_value_by_units
+            if col is None or col in seen:
+                continue
+            seen.add(col)
+            factors[row, col] = mode["factor"]
+
+    if (factors < 0).any():
+        raise ValueError("Scaling factors must not be negative")
+
+    return names, factors
+
+
+def log_factor_matrix(symbols, systems):
+    """
+    Turns the scaling factor lists of several unit systems into log10 factor rows.
+
+    Parameters:
+        symbols (list): The unit symbols, one per column, usually ExponentTable.symbols.
+        systems (dict): Maps a system name to its scaling factor list.
+
+    Returns:
+        tuple: (names, log_factors, zero_factors) where log_factors has shape
+               (systems, columns) and zero_factors marks factors that are zero.
+    """
+    names, factors = factor_matrix(symbols, systems)
+    zero_factors = factors == 0
+    log_factors = np.log10(np.where(zero_factors, 1.0, factors))
+    return names, log_factors, zero_factors
+
+
+def rescale_table(table, systems):
+    """
+    Rescales every row of an ExponentTable into every unit system at once.
+
+    Parameters:
+        table (ExponentTable): The constants to rescale.
+        systems (dict): Maps a system name to its scaling factor list.
+
+    Returns:
+        tuple: (names, rescaled) where rescaled has shape (rows, systems) and
+               rescaled[i, j] is row i of the table expressed in system names[j].
+    """
+    names, log_factors, zero_factors = log_factor_matrix(table.symbols, systems)
+
+    # The whole rescale: one matrix product in log space
+    log_scale = table.exponents @ log_factors.T
+
+    with np.errstate(over="ignore", under="ignore"):
+        rescaled = table.values[:, None] * np.power(10.0, -log_scale)
+
+    if zero_factors.any():
+        # A zero factor makes any nonzero value that uses the symbol infinite
+        hits = (table.present.astype(np.int64) @ zero_factors.T.astype(np.int64)) > 0
+        rescaled[hits & (table.values[:, None] != 0)] = np.inf
+
+    return names, rescaled
@@ -0,0 +1,339 @@
+'''
+ Micro benchmarks for the rescaling core
+
+ Times the functions every program in this directory spends its time in:
+
+     load_module                  loading a module from source, and from the cache
+     calculate_scaling_factors    deriving the factor table of each unit system
+     rescale_composite_units      resolving the composite units of each unit system
+     rescale_value_by_units       rescaling every constant and element property
+
+ Each benchmark is a function of no arguments, run `number` times in a row
+ and timed `repeat` times; the best run is the one reported, since the
+ others only add noise from the rest of the machine. Peak memory is measured
+ in a separate run under tracemalloc, so its overhead does not show up in the
+ timings.
+
+ Anything the benchmarked code prints, such as the composite unit problems
+ on stderr, is sent to os.devnull while it runs.
+
+ scaling_benchmarks and composite_scaling_benchmarks run the same code over
+ synthetic catalogs and composite unit graphs of growing size (see
+ synthetic_catalog.py), for scaling curves.
+
+ Results are plain dictionaries that are written as JSON, and can be compared
+ against a baseline written by an earlier run to catch regressions.
+'''
+
+import contextlib
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
+from load_mods import load_module
+rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
+composite_units = load_module("./modular/composite_units.py", "composite_units")
+batch_rescale = load_module("./modular/batch_rescale.py", "batch_rescale")
+synthetic_catalog = load_module("./modular/synthetic_catalog.py", "synthetic_catalog")
+
+RESULTS_FORMAT = 1
+
+
+class Benchmark:
+    """
+    One thing to time.
+
+    Attributes:
+        name (str): Identifies the benchmark in results and baselines, e.g. "rescale_value_by_units/si".
+        function: Called with no arguments, once per iteration.
+        items (int): How many items (constants, modules, ...) one call processes, for throughput.
+        number (int): Calls per timed run.
+    """
+
+    def __init__(self, name, function, items=1, number=1):
+        self.name = name
+        self.function = function
+        self.items = items
+        self.number = number
+
+
+@contextlib.contextmanager
+def _quiet():
+    with open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+        yield
+
+
+def measure(benchmark, repeat=5):
+    """
+    Times a benchmark and measures its peak memory.
+
+    Returns:
+        dict: best, median and mean seconds per call, items per second, and
+              peak_bytes, the most memory allocated at once during one call.
+    """
+    function = benchmark.function
+    function()  # warm up caches the way a long running program would have them
+
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(benchmark.number):
+            function()
+        runs.append((time.perf_counter() - start) / benchmark.number)
+
+    tracemalloc.start()
+    try:
+        function()
+        current, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = min(runs)
+    return {
+        "seconds_best": best,
+        "seconds_median": statistics.median(runs),
+        "seconds_mean": statistics.fmean(runs),
+        "repeat": repeat,
+        "number": benchmark.number,
+        "items": benchmark.items,
+        "items_per_second": benchmark.items / best if best > 0 else float("inf"),
+        "peak_bytes": peak_bytes,
+    }
+
+
+def run_benchmarks(benchmarks, repeat=5, progress=None):
+    """
+    Runs a list of benchmarks.
+
+    Parameters:
+        benchmarks (list): Benchmark objects.
+        repeat (int): Timed runs per benchmark.
+        progress: Optional function called with (benchmark, result) after each one.
+
+    Returns:
+        dict: The results document, with "meta" describing the machine and
+              "results" mapping each benchmark name to its measurements.
+    """
+    results = {}
+    for benchmark in benchmarks:
+        with _quiet():
+            results[benchmark.name] = measure(benchmark, repeat)
+        if progress is not None:
+            progress(benchmark, results[benchmark.name])
+    return {
+        "format": RESULTS_FORMAT,
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def save_results(path, document):
+    """Writes a results document as JSON."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as output:
+        json.dump(document, output, indent=2)
+        output.write("\n")
+
+
+def load_results(path):
+    """Reads a results document written by save_results, or returns None if there is none."""
+    try:
+        with open(path, encoding="utf-8") as source:
+            document = json.load(source)
+    except FileNotFoundError:
+        return None
+    if document.get("format") != RESULTS_FORMAT:
+        raise ValueError(f"{path} has unsupported benchmark results format {document.get('format')}")
+    return document
+
+
+def compare(document, baseline, threshold=0.10):
+    """
+    Compares results against a baseline.
+
+    Parameters:
+        document (dict): The results of this run.
+        baseline (dict): The results of an earlier run.
+        threshold (float): How much slower than the baseline, as a fraction, counts as a regression.
+
+    Returns:
+        list: (name, baseline seconds, current seconds, ratio, regressed) for every benchmark
+              in both, where ratio is current / baseline using the best runs.
+    """
+    comparison = []
+    for name, result in document["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratio = result["seconds_best"] / before["seconds_best"] if before["seconds_best"] > 0 else float("inf")
+        comparison.append((name, before["seconds_best"], result["seconds_best"], ratio, ratio > 1 + threshold))
+    return comparison
+
+
+# -----------------------------------------------------------------------
+# The benchmarks of the rescaling core
+# -----------------------------------------------------------------------
+
+def rescale_entries(grouped_constants, periodic_table=None):
+    """Returns the constants, and the element properties that have a value, as rescale_value_by_units input."""
+    entries = [data for key, data in batch_rescale.constant_entries(grouped_constants)]
+    if periodic_table is not None:
+        entries += [data for key, data in batch_rescale.periodic_table_entries(periodic_table)
+                    if data.get("value") is not None]
+    return entries
+
+
+def _exec_source(path, module_name):
+    # What load_module does on a cache miss, without touching its cache, so the
+    # modules the registry and the other benchmarks hold are never replaced.
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def core_benchmarks(grouped_constants, periodic_table, registry, systems=None, label=""):
+    """
+    Builds the benchmarks of the rescaling core.
+
+    Parameters:
+        grouped_constants (dict): The constants to rescale and derive factors from.
+        periodic_table (dict): The periodic table whose properties are rescaled too, or None.
+        registry: A unit_system_registry.UnitSystemRegistry, for the scaling modules.
+        systems (list): Unit system names to benchmark, all of the registry's by default.
+        label (str): Appended to every benchmark name, e.g. to tell dataset sizes apart.
+
+    Returns:
+        list: Benchmark objects.
+    """
+    systems = systems or registry.names()
+    entries = rescale_entries(grouped_constants, periodic_table)
+    suffix = f"[{label}]" if label else ""
+    benchmarks = []
+
+    paths = [registry.paths[name] for name in systems]
+    benchmarks.append(Benchmark(
+        f"load_module/source{suffix}",
+        lambda: [_exec_source(path, os.path.basename(path)[:-3]) for path in paths],
+        items=len(paths)))
+    benchmarks.append(Benchmark(
+        f"load_module/cached{suffix}",
+        lambda: [load_module(path, os.path.basename(path)[:-3]) for path in paths],
+        items=len(paths), number=100))
+
+    for name in systems:
+        scaling = registry.module(name)
+        with _quiet():
+            factors = scaling.calculate_scaling_factors(grouped_constants)
+        base, postpend = registry.base_factors(name, grouped_constants)
+
+        benchmarks.append(Benchmark(
+            f"calculate_scaling_factors/{name}{suffix}",
+            lambda scaling=scaling: scaling.calculate_scaling_factors(grouped_constants)))
+
+        benchmarks.append(Benchmark(
+            f"rescale_composite_units/{name}{suffix}",
+            lambda base=base, postpend=postpend:
+                composite_units.rescale_composite_units([dict(entry) for entry in base], postpend)))
+
+        def rescale_all(factors=factors):
+            rescale = rescale_units.rescale_value_by_units
+            for data in entries:
+                rescale(data, factors)
+
+        plan = rescale_units.compile_rescale_plan(factors)
+
+        def rescale_all_with_plan(plan=plan):
+            for data in entries:
+                plan.rescale(data)
+
+        benchmarks.append(Benchmark(f"rescale_value_by_units/{name}{suffix}", rescale_all, items=len(entries)))
+        benchmarks.append(Benchmark(f"rescale_plan/{name}{suffix}", rescale_all_with_plan, items=len(entries)))
+
+    return benchmarks
+
+
+def scaling_benchmarks(sizes, grouped_constants, registry, system="si", seed=0):
+    """
+    Builds rescaling benchmarks over synthetic catalogs of each size, for scaling curves.
+
+    Parameters:
+        sizes (list): Catalog sizes, e.g. [1000, 10000, 100000].
+        grouped_constants (dict): The real constants, for the unit system's factor table.
+        registry: A unit_system_registry.UnitSystemRegistry.
+        system (str): The unit system to rescale into.
+        seed (int): Seed for the synthetic data.
+
+    Returns:
+        list: Benchmark objects, named like "rescale_value_by_units/si[n=1000]".
+    """
+    with _quiet():
+        factors = registry.module(system).calculate_scaling_factors(grouped_constants)
+    plan = rescale_units.compile_rescale_plan(factors)
+
+    benchmarks = []
+    for size in sizes:
+        suffix = f"[n={size}]"
+        # Planck and Stoney scale some units by 1e115, so a cube of one of their factors overflows a float
+        entries = rescale_entries(synthetic_catalog.synthetic_constants(size, max_power=2, text=False, seed=seed))
+
+        def rescale_all(entries=entries):
+            rescale = rescale_units.rescale_value_by_units
+            for data in entries:
+                rescale(data, factors)
+
+        def rescale_all_with_plan(entries=entries):
+            for data in entries:
+                plan.rescale(data)
+
+        benchmarks.append(Benchmark(f"rescale_value_by_units/{system}{suffix}", rescale_all, items=len(entries)))
+        benchmarks.append(Benchmark(f"rescale_plan/{system}{suffix}", rescale_all_with_plan, items=len(entries)))
+
+    return benchmarks
+
+
+def composite_scaling_benchmarks(sizes, grouped_constants, registry, depth=4, seed=0):
+    """
+    Builds rescale_composite_units benchmarks over synthetic composite graphs of each size.
+
+    The graphs are resolved against the base factors of the si system. Those are all 1,
+    so no chain of composites can overflow, and the time to resolve a graph does not
+    depend on the factor values anyway. rescale_composite_units looks each unit up in
+    a RescalePlan that it extends as it goes, so its time grows linearly with the graph size.
+
+    Parameters:
+        sizes (list): Composite unit counts, e.g. [100, 1000, 10000].
+        grouped_constants (dict): The real constants, for the si base factors.
+        registry: A unit_system_registry.UnitSystemRegistry.
+        depth (int): Layers of composites in each graph.
+        seed (int): Seed for the synthetic data.
+
+    Returns:
+        list: Benchmark objects, named like "rescale_composite_units[n=1000]".
+    """
+    base, postpend = registry.base_factors("si", grouped_constants)
+
+    benchmarks = []
+    for size in sizes:
+        composites = synthetic_catalog.synthetic_composites(size, depth, seed=seed)
+        benchmarks.append(Benchmark(
+            f"rescale_composite_units[n={size}]",
+            lambda composites=composites: composite_units.rescale_composite_units(
+                [dict(entry) for entry in base], postpend, composites),
+            items=len(composites)))
+    return benchmarks
@@ -0,0 +1,80 @@
+'''
+ Columnar export of rescaled constants
+
+ Loading the rescaled constants of every unit system into a dataframe by
+ parsing the text that print_rescaling prints is slow, and it loses
+ precision and the unit exponents along the way.
+
+ This module builds the whole cross system table as columns instead, one
+ row per (unit system, constant):
+
+     system      the unit system name, e.g. "planck"
+     group       the constant's group in grouped_constants
+     name        the constant's name
+     symbol      the constant's symbol, e.g. "c"
+     original    the SI value
+     rescaled    the value in the unit system
+     exponent_*  one column per unit symbol, e.g. exponent_kg, holding its power
+
+ and writes them to a NumPy .npz file. Text columns are stored as fixed
+ width unicode arrays, so the file loads without pickle, and the file is
+ not compressed, so loading it is a straight read of each array.
+
+ The rescaled values come from batch_rescale.rescale_table, so they match
+ rescale_value_by_units up to floating point rounding.
+'''
+
+import numpy as np
+
+from load_mods import load_module
+batch_rescale = load_module("./modular/batch_rescale.py", "batch_rescale")
+
+EXPONENT_PREFIX = "exponent_"
+
+
+def build_columns(entries, systems):
+    """
+    Rescales entries into every unit system and lays the result out as columns.
+
+    Parameters:
+        entries (list): (key, data) pairs from batch_rescale.constant_entries, whose
+                        keys are (group_name, constant_name).
+        systems (dict): Maps a system name to its scaling factor list.
+
+    Returns:
+        dict: Column name -> 1D NumPy array, all of length len(systems) * len(entries),
+              ordered by system and then by entry.
+    """
+    table = batch_rescale.build_exponent_table(entries)
+    names, rescaled = batch_rescale.rescale_table(table, systems)
+    count = len(names)
+
+    columns = {
+        "system": np.repeat(np.array(names, dtype=np.str_), len(table)),
+        "group": np.tile(np.array([key[0] for key, data in entries], dtype=np.str_), count),
+        "name": np.tile(np.array([key[1] for key, data in entries], dtype=np.str_), count),
+        "symbol": np.tile(np.array([data.get("symbol", "") for key, data in entries], dtype=np.str_), count),
+        "original": np.tile(table.values, count),
+        # rescaled is (entries, systems), so its transpose flattens system by system
+        "rescaled": rescaled.T.reshape(-1),
+    }
+    for col, unit_symbol in enumerate(table.symbols):
+        columns[EXPONENT_PREFIX + unit_symbol] = np.tile(table.exponents[:, col], count)
+
+    return columns
+
+
+def write_npz(path, columns):
+    """Writes columns to an uncompressed .npz file."""
+    np.savez(path, **columns)
+
+
+def load_npz(path):
+    """
+    Loads the columns written by write_npz.
+
+    Returns:
+        dict: Column name -> NumPy array, ready for e.g. pandas.DataFrame(columns).
+    """
+    with np.load(path, allow_pickle=False) as data:
+        return {name: data[name] for name in data.files}
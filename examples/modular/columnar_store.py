@@ -0,0 +1,250 @@
+'''
+ Memory mapped columnar store for constants and element properties
+
+ The datasets keep every constant as a dictionary that mixes the numbers
+ a rescale needs with long prose fields (origin, comment, application,
+ visualization, notes) that it never looks at. A program that only does
+ arithmetic still has to hold all of that in memory, and every worker
+ process holds its own copy.
+
+ A columnar store splits the two apart and writes them to one file:
+
+     magic       8 bytes   b"PUCSCOL1"
+     length      8 bytes   little endian size of the header
+     header      JSON      row keys, unit symbols, array layout, text location
+     arrays      raw       values, exponents and present, each 64 byte aligned
+     text        JSON      the remaining fields of every row
+
+ The file is opened with mmap and the arrays are NumPy views straight onto
+ the mapped pages, so nothing is copied and any number of processes that
+ open the same file share one physical copy. The text section is only
+ decoded the first time it is asked for.
+
+ The arrays have the same names and layout as batch_rescale.ExponentTable,
+ so an open store can be passed straight to batch_rescale.rescale_table.
+ A store holds its mapping until it is closed, with close() or by using it
+ as a context manager; the arrays can not be used after that.
+'''
+
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from load_mods import load_module
+batch_rescale = load_module("./modular/batch_rescale.py", "batch_rescale")
+
+MAGIC = b"PUCSCOL1"
+FORMAT = 1
+ALIGNMENT = 64
+
+# Fields that are stored as arrays rather than in the text section
+NUMERIC_FIELDS = ("value", "units")
+
+
+def _aligned(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_columnar_store(path, entries, source_sha256=None):
+    """
+    Writes (key, data) entries to a columnar store file.
+
+    Parameters:
+        path (str): The file to write.
+        entries (list): (key, data) pairs, e.g. from batch_rescale.constant_entries
+                        or batch_rescale.periodic_table_entries. Keys must be tuples of
+                        strings, or strings.
+        source_sha256 (str): Optional hash of the dataset the entries came from, kept
+                             in the header so readers can tell if the store is stale.
+
+    Returns:
+        int: The number of rows written.
+    """
+    table = batch_rescale.build_exponent_table(entries)
+    text = [{field: value for field, value in data.items() if field not in NUMERIC_FIELDS}
+            for key, data in entries]
+    text_bytes = json.dumps(text, ensure_ascii=False).encode("utf-8")
+
+    arrays = {
+        "values": np.ascontiguousarray(table.values, dtype="<f8"),
+        "exponents": np.ascontiguousarray(table.exponents, dtype="<f8"),
+        "present": np.ascontiguousarray(table.present, dtype="u1"),
+    }
+
+    header = {
+        "format": FORMAT,
+        "source_sha256": source_sha256,
+        "keys": [list(key) if isinstance(key, tuple) else key for key in table.keys],
+        "labels": [data.get("symbol", "") for key, data in entries],
+        "symbols": table.symbols,
+        "arrays": {},
+        "text": {},
+    }
+
+    # The header holds the offsets of the sections after it, and its own length moves
+    # those offsets, so lay the file out until the header size stops changing.
+    header_size = 0
+    while True:
+        offset = _aligned(len(MAGIC) + 8 + header_size)
+        for name, array in arrays.items():
+            header["arrays"][name] = {"offset": offset, "dtype": array.dtype.str, "shape": list(array.shape)}
+            offset = _aligned(offset + array.nbytes)
+        header["text"] = {"offset": offset, "length": len(text_bytes)}
+        header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        if len(header_bytes) == header_size:
+            break
+        header_size = len(header_bytes)
+
+    # Write next to the final name and move it into place: readers that have the old file
+    # mapped keep their pages, and a new reader never sees half a file
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as output:
+        output.write(MAGIC)
+        output.write(struct.pack("<Q", len(header_bytes)))
+        output.write(header_bytes)
+        for name, array in arrays.items():
+            output.write(b"\0" * (header["arrays"][name]["offset"] - output.tell()))
+            output.write(array.tobytes())
+        output.write(b"\0" * (header["text"]["offset"] - output.tell()))
+        output.write(text_bytes)
+    os.replace(temporary_path, path)
+
+    return len(table)
+
+
+class ColumnarStore:
+    """
+    A read only, memory mapped view of a columnar store file.
+
+    Attributes:
+        keys (list): One key per row, as tuples.
+        labels (list): The "symbol" field of each row, e.g. "c" or "h".
+        symbols (list): One unit symbol per column of the exponent matrix.
+        column (dict): Maps a unit symbol to its column number.
+        values (ndarray): The original values, shape (rows,), NaN where missing.
+        exponents (ndarray): The power of each unit symbol in each row, shape (rows, columns).
+        present (ndarray): True where a row lists a unit symbol at all.
+        source_sha256 (str): Hash of the dataset the store was built from, if recorded.
+
+    Use it in a with statement, or call close(), to release the mapping.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as source:
+            self._map = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a columnar store")
+        (header_size,) = struct.unpack_from("<Q", self._map, len(MAGIC))
+        start = len(MAGIC) + 8
+        header = json.loads(self._map[start:start + header_size].decode("utf-8"))
+        if header["format"] != FORMAT:
+            raise ValueError(f"{path} has unsupported columnar store format {header['format']}")
+
+        self.source_sha256 = header["source_sha256"]
+        self.keys = [tuple(key) if isinstance(key, list) else key for key in header["keys"]]
+        self.labels = header["labels"]
+        self.symbols = header["symbols"]
+        self.column = {symbol: col for col, symbol in enumerate(self.symbols)}
+
+        self._array_layout = header["arrays"]
+        self._view_arrays()
+
+        self._text_layout = header["text"]
+        self._text = None
+        self._rows = None
+
+    def _view_arrays(self):
+        arrays = {}
+        for name, layout in self._array_layout.items():
+            shape = tuple(layout["shape"])
+            count = int(np.prod(shape)) if shape else 1
+            arrays[name] = np.frombuffer(self._map, dtype=layout["dtype"], count=count,
+                                         offset=layout["offset"]).reshape(shape)
+        self.values = arrays["values"]
+        self.exponents = arrays["exponents"]
+        self.present = arrays["present"].view(bool)
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def closed(self):
+        return self._map is None
+
+    def close(self):
+        """
+        Releases the mapping. The values, exponents and present arrays are views
+        of it, so they are dropped too; mmap raises BufferError if arrays taken
+        from the store are still referenced elsewhere, and the store stays open.
+        """
+        if self._map is None:
+            return
+        self.values = self.exponents = self.present = None
+        try:
+            self._map.close()
+        except BufferError:
+            self._view_arrays()
+            raise
+        self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def row(self, key):
+        """Returns the row number of a key, building the key index on first use."""
+        if self._rows is None:
+            self._rows = {key: row for row, key in enumerate(self.keys)}
+        return self._rows[key]
+
+    def rows_with_label(self, label):
+        """Returns the row numbers whose "symbol" field is label. Symbols are not unique."""
+        return [row for row, row_label in enumerate(self.labels) if row_label == label]
+
+    def text(self, row):
+        """Returns the non numeric fields of a row, decoding the text section on first use."""
+        if self._text is None:
+            start = self._text_layout["offset"]
+            end = start + self._text_layout["length"]
+            self._text = json.loads(self._map[start:end].decode("utf-8"))
+        return self._text[row]
+
+    def entry(self, key):
+        """Rebuilds the dataset dictionary of one row, with its value and units."""
+        row = self.row(key)
+        data = dict(self.text(row))
+        value = float(self.values[row])
+        data["value"] = None if value != value else value
+        # units come back in column order, with float powers
+        data["units"] = [(self.symbols[col], float(self.exponents[row, col]))
+                         for col in np.flatnonzero(self.present[row])]
+        return data
+
+
+def open_columnar_store(path, source_sha256=None):
+    """
+    Opens a columnar store file written by write_columnar_store.
+
+    Parameters:
+        path (str): The store file.
+        source_sha256 (str): The hash of the dataset the caller expects, e.g. the
+                             source_sha256 of load_dataset's result. A store built from
+                             any other version of the dataset is rejected with ValueError,
+                             the way load_dataset ignores a stale snapshot.
+
+    Returns:
+        ColumnarStore: The open store, to be closed by the caller, e.g. with a with statement.
+    """
+    store = ColumnarStore(path)
+    if source_sha256 is not None and store.source_sha256 != source_sha256:
+        store.close()
+        raise ValueError(f"{path} was built from another version of its dataset; rebuild it "
+                         f"with build_columnar_store.py")
+    return store
@@ -1,51 +1,154 @@
+import sys
+from collections import deque
+
 # Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
-from load_mods import load_module
+from load_mods import load_module, load_dataset
 rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
+UnitVector = load_module("./modular/unit_vector.py", "unit_vector").UnitVector
 
-def check_deps_fails(units, unit_scaling):
-    known_symbols = {entry['symbol'] for entry in unit_scaling if 'symbol' in entry}
-    for unit, _ in units:
-        if unit not in known_symbols:
-            return 1
-    return 0
+def resolve_composite_order(composite_definitions, known_symbols):
+    """
+    Orders composite unit definitions so every composite comes after the units it is built from.
+
+    The composites form a dependency graph: a composite depends on every unit in its
+    units list that is not already a known symbol. The graph is sorted with Kahn's
+    algorithm, so each definition and each dependency is looked at a fixed number of
+    times. Composites that can not be ordered are explained in the returned problems.
+
+    Parameters:
+        composite_definitions (list): Composite unit dictionaries with "symbol" and "units",
+                                      as in data_sets/composite_units.py. It is not modified.
+        known_symbols (set): Symbols that are already scaled, usually the base units.
+
+    Returns:
+        tuple: (ordered, problems) where ordered is the list of composite definitions that
+               can be resolved, in dependency order, and problems is a list of messages
+               for the ones that can not.
+    """
+
+    # A symbol that is already known, or defined earlier in the list, would never be
+    # looked up again, so only the first definition of each new symbol takes part.
+    definitions = {}
+    for unit_definition in composite_definitions:
+        symbol = unit_definition['symbol']
+        if symbol not in known_symbols and symbol not in definitions:
+            definitions[symbol] = unit_definition
+
+    depends_on = {}
+    dependents = {symbol: [] for symbol in definitions}
+    waiting = {}
+    missing = {}
+    for symbol, unit_definition in definitions.items():
+        deps = []
+        for unit, _ in unit_definition['units']:
+            if unit in known_symbols:
+                continue
+            if unit in definitions:
+                if unit not in deps:
+                    deps.append(unit)
+            else:
+                missing.setdefault(symbol, []).append(unit)
+        depends_on[symbol] = deps
+        waiting[symbol] = len(deps)
+        for dep in deps:
+            dependents[dep].append(symbol)
+
+    # Kahn's algorithm, seeded in definition order so independent composites keep their order
+    ordered = []
+    queue = deque(symbol for symbol in definitions if waiting[symbol] == 0 and symbol not in missing)
+    while queue:
+        symbol = queue.popleft()
+        ordered.append(definitions[symbol])
+        for dependent in dependents[symbol]:
+            waiting[dependent] -= 1
+            if waiting[dependent] == 0 and dependent not in missing:
+                queue.append(dependent)
+
+    if len(ordered) == len(definitions):
+        return ordered, []
+
+    # Anything left over either uses an unknown unit, sits on a cycle, or depends on one of those
+    resolved = {unit_definition['symbol'] for unit_definition in ordered}
+    unresolved = [symbol for symbol in definitions if symbol not in resolved]
+    unresolved_set = set(unresolved)
+
+    cycles = []
+    on_cycle = set()
+    state = {}  # 1 while on the current search path, 2 once finished
+    for start in unresolved:
+        if start in state:
+            continue
+        state[start] = 1
+        path = [start]
+        stack = [iter(depends_on[start])]
+        while stack:
+            for dep in stack[-1]:
+                if dep not in unresolved_set:
+                    continue
+                if dep not in state:
+                    state[dep] = 1
+                    path.append(dep)
+                    stack.append(iter(depends_on[dep]))
+                    break
+                if state[dep] == 1:
+                    cycle = path[path.index(dep):] + [dep]
+                    cycles.append(cycle)
+                    on_cycle.update(cycle)
+            else:
+                state[path.pop()] = 2
+                stack.pop()
+
+    problems = []
+    for symbol in unresolved:
+        if symbol in missing:
+            problems.append(f"{symbol} has dependency issue in units: {definitions[symbol]['units']}"
+                            f" (unknown: {', '.join(missing[symbol])})")
+    for cycle in cycles:
+        problems.append(f"dependency cycle: {' -> '.join(cycle)}")
+    for symbol in unresolved:
+        if symbol not in missing and symbol not in on_cycle:
+            blocked_by = [dep for dep in depends_on[symbol] if dep in unresolved_set]
+            problems.append(f"{symbol} depends on unresolved units: {', '.join(blocked_by)}")
+
+    return ordered, problems
 
 # reads the composite unit list and processes them, appending to the unit scaling list which gets returned
-def rescale_composite_units(unit_scaling, postpend):
+# composite_definitions replaces data_sets/composite_units.py, e.g. with a synthetic unit graph
+def rescale_composite_units(unit_scaling, postpend, composite_definitions=None):
 
     # load the composite unit module and extract the dictionary
-    composite_unit_module = load_module("../data_sets/composite_units.py", "composite_units")
-    composite_dictionary = composite_unit_module.composite_units
+    if composite_definitions is None:
+        composite_unit_module = load_dataset("../data_sets/composite_units.py", "composite_units")
+        composite_definitions = composite_unit_module.composite_units
+    composite_dictionary = composite_definitions
+
+    known_symbols = {entry['symbol'] for entry in unit_scaling if 'symbol' in entry}
+    ordered, problems = resolve_composite_order(composite_dictionary, known_symbols)
 
-    for unit_definition  in composite_dictionary:
+    # diagnostics go to stderr, so they never mix with output written to stdout
+    for problem in problems:
+        print(f" {problem}", file=sys.stderr)
+
+    # The plan indexes unit_scaling by symbol and is extended as each composite is resolved,
+    # so a composite costs one lookup per unit instead of a scan of the whole growing list
+    plan = rescale_units.compile_rescale_plan(unit_scaling)
+
+    for unit_definition in ordered:
         symbol = unit_definition['symbol']
-        units = unit_definition['units']
-        count = unit_definition.get('count', 0)
         data = {
            "value": 1,
-           "units": units
+           "units": UnitVector.of(unit_definition['units'])
         }
 
-        if check_deps_fails(units, unit_scaling):
-            if count == 0: 
-                # defer processing for composite unit whose units have not all been processed yet.
-                deferred_entry = {
-                    "symbol": symbol,
-                    "units": units,
-                    "count": 1,
-                }
-                composite_dictionary.append(deferred_entry)
-            else:
-                print (f" {symbol} has dependency issue in units: {units}")
-            continue
-
-        # otherwise the check was good process composite unit
-        rescaled_value, units_applied = rescale_units.rescale_value_by_units(data, unit_scaling)
+        # every unit this composite is built from has already been scaled
+        rescaled_value, units_applied = plan.rescale_vector(data)
         entry = {
             "symbol": symbol,
             "factor": 1/rescaled_value,
             "swap_with": symbol + postpend,
         }
         unit_scaling.append(entry)
+        plan.add_mode(entry["symbol"], entry["factor"], entry["swap_with"])
 
     return unit_scaling
-    
+
@@ -0,0 +1,157 @@
+'''
+ Cross system conversion tensor
+
+ Every unit system is a set of scaling factors away from SI. A value in
+ system A is the SI value divided by factor_A ** power for each of its
+ units, so moving it from system A to system B multiplies it by
+
+     (factor_A[symbol] / factor_B[symbol]) ** power
+
+ for each unit. Those ratios only depend on the two systems and the unit
+ symbol, so they can all be worked out once, as a tensor indexed by
+ [source system, target system, unit symbol]. Converting a quantity in one
+ unit between any two systems is then one lookup and one multiply, with no
+ trip through SI.
+
+ Units are always named by their SI symbol ("m", "kg", "J", ...), which is
+ the symbol the scaling factor lists are keyed on, whatever name the
+ system displays them under.
+'''
+
+import numpy as np
+
+from load_mods import load_module
+batch_rescale = load_module("./modular/batch_rescale.py", "batch_rescale")
+UnitVector = load_module("./modular/unit_vector.py", "unit_vector").UnitVector
+
+
+def _scale_by_log10(values, log_ratio):
+    """
+    Returns values * 10 ** log_ratio. Where 10 ** log_ratio alone would
+    overflow or underflow, the value's own log10 is added in first, so a
+    result that fits in a float is not lost; zeros stay zero.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    with np.errstate(over="ignore", under="ignore", invalid="ignore", divide="ignore"):
+        scale = np.power(10.0, log_ratio)
+        converted = values * scale
+        outside = ((scale == 0) | np.isinf(scale)) & np.isfinite(log_ratio)
+        if not np.any(outside):
+            return converted
+        combined = np.where(values == 0, values,
+                            np.copysign(np.power(10.0, np.log10(np.abs(values)) + log_ratio), values))
+        return np.where(outside & np.isfinite(values), combined, converted)
+
+
+class ConversionTensor:
+    """
+    Precomputed conversion ratios between every pair of unit systems.
+
+    Attributes:
+        names (list): The unit systems, in tensor order.
+        symbols (list): Every unit symbol any of the systems scales, base and composite.
+        ratios (ndarray): ratios[a, b, u] multiplies a value of unit symbols[u] in system
+                          names[a] to give its value in system names[b]. Shape (N, N, U).
+        log_ratios (ndarray): log10 of ratios, for converting products of units.
+    """
+
+    def __init__(self, systems):
+        self.names = list(systems)
+        self.system = {name: row for row, name in enumerate(self.names)}
+
+        self.symbols = []
+        self.column = {}
+        self.swap_with = {}
+        for name in self.names:
+            swaps = {}
+            for mode in systems[name]:
+                if mode["symbol"] not in self.column:
+                    self.column[mode["symbol"]] = len(self.symbols)
+                    self.symbols.append(mode["symbol"])
+                swaps.setdefault(mode["symbol"], mode["swap_with"])
+            self.swap_with[name] = swaps
+
+        names, factors = batch_rescale.factor_matrix(self.symbols, systems)
+
+        # factor_A / factor_B for every pair of systems and every symbol
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.ratios = factors[:, None, :] / factors[None, :, :]
+            self.ratios[(factors == 0)[:, None, :] | (factors == 0)[None, :, :]] = np.nan
+            self.log_ratios = np.log10(self.ratios)
+
+    def factor(self, symbol, source, target):
+        """Returns the multiplier that takes a value in unit symbol from system source to system target."""
+        col = self.column.get(symbol)
+        if col is None:
+            return 1.0  # no system scales this unit
+        return self.ratios[self.system[source], self.system[target], col]
+
+    def _log_ratio(self, units, source, target):
+        a, b = self.system[source], self.system[target]
+        total = 0.0
+        for unit_symbol, power in units:
+            col = self.column.get(unit_symbol)
+            if col is not None:
+                total += power * self.log_ratios[a, b, col]
+        return total
+
+    def units_in(self, units, target):
+        """Returns a units list as a UnitVector of the names system target displays them under."""
+        return UnitVector.of(units).swapped(self.swap_with[target])
+
+    def convert(self, value, units, source, target):
+        """
+        Converts one value between two unit systems.
+
+        Parameters:
+            value (float): The value, expressed in system source.
+            units (list): Its units as SI symbols and powers, e.g. [("m", 1), ("s", -1)].
+            source (str): The system the value is in.
+            target (str): The system to convert it to.
+
+        Returns:
+            tuple: The converted value and its units as displayed in system target.
+        """
+        if len(units) == 1 and units[0][1] == 1:
+            converted = value * self.factor(units[0][0], source, target)
+        else:
+            converted = _scale_by_log10(value, self._log_ratio(units, source, target))[()]
+        return converted, self.units_in(units, target)
+
+    def convert_array(self, values, units, source, target):
+        """Converts an array of values that all have the same units. Returns a NumPy array."""
+        return _scale_by_log10(values, self._log_ratio(units, source, target))
+
+    def convert_table(self, table, source, target, values=None):
+        """
+        Converts every row of an exponent table between two unit systems at once.
+
+        Parameters:
+            table: A batch_rescale.ExponentTable or columnar_store.ColumnarStore.
+            source (str): The system the values are in.
+            target (str): The system to convert them to.
+            values (ndarray): The values to convert, defaults to table.values.
+
+        Returns:
+            ndarray: The converted values, one per row.
+        """
+        if values is None:
+            values = table.values
+        log_ratio = np.zeros(len(table.symbols))
+        a, b = self.system[source], self.system[target]
+        for col, symbol in enumerate(table.symbols):
+            tensor_col = self.column.get(symbol)
+            if tensor_col is not None:
+                log_ratio[col] = self.log_ratios[a, b, tensor_col]
+        return _scale_by_log10(values, table.exponents @ log_ratio)
+
+
+def build_conversion_tensor(systems):
+    """
+    Builds a ConversionTensor.
+
+    Parameters:
+        systems (dict): Maps a system name to its scaling factor list, for example
+                        unit_system_registry.default_registry().all_factors(constants).
+    """
+    return ConversionTensor(systems)
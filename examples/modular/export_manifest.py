@@ -0,0 +1,124 @@
+'''
+ Export manifest for incremental regeneration
+
+ Exporting every unit system in every format rescales and writes every
+ constant, even when only one entry of data_sets/constants.py was edited.
+ The manifest remembers what the last export was made from, so the next
+ one can skip the work that would give the same answer.
+
+ For each unit system it records:
+
+     module_sha256     the sha256 of the system's scaling module source
+     code_sha256       the sha256 of the code that rescales and writes (see CODE_FILES)
+     factors_sha256    the sha256 of the factor table the module computed
+     entries           [group, name, entry sha256] for every constant, in order
+     rows              entry sha256 -> [rescaled value, units applied as [unit, power] terms]
+     files             output format -> the file written and how it was written
+
+ A rescaled row only depends on the constant entry and the factor table,
+ so while the factor table and the code are unchanged a row can be looked
+ up by the hash of its entry instead of being rescaled again. Only new or edited entries
+ are rescaled, and their rows are spliced in among the cached ones when the
+ file is written. A file whose entries, factors, code and write options all
+ match the manifest is left alone.
+
+ The manifest is JSON, written next to the exported files.
+'''
+
+import hashlib
+import json
+import os
+
+from load_mods import load_module, source_sha256
+rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
+UnitVector = load_module("./modular/unit_vector.py", "unit_vector").UnitVector
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT = 3
+
+# Sources whose changes change the exported rows or files, whatever the constants and factors
+CODE_FILES = [
+    "./modular/print_outputs.py",
+    "./modular/rescale_units.py",
+    "./modular/unit_vector.py",
+    "./modular/export_manifest.py",
+]
+
+
+def entry_sha256(data):
+    """Returns the sha256 of one constant entry, covering every one of its fields."""
+    return hashlib.sha256(repr(sorted(data.items())).encode("utf-8")).hexdigest()
+
+
+def factors_sha256(unit_scaling):
+    """Returns the sha256 of a factor table, as returned by calculate_scaling_factors."""
+    table = [(unit_entry["symbol"], unit_entry["factor"], unit_entry["swap_with"]) for unit_entry in unit_scaling]
+    return hashlib.sha256(repr(table).encode("utf-8")).hexdigest()
+
+
+def code_sha256():
+    """Returns one sha256 over the sources in CODE_FILES."""
+    digests = [source_sha256(path) for path in CODE_FILES]
+    return hashlib.sha256(repr(digests).encode("utf-8")).hexdigest()
+
+
+def constant_hashes(grouped_constants):
+    """Returns [group_name, constant_name, entry sha256] for every constant, in dataset order."""
+    return [[group_name, name, entry_sha256(data)]
+            for group_name, group_data in grouped_constants.items()
+            for name, data in group_data.items() if isinstance(data, dict)]
+
+
+def load_manifest(output_dir):
+    """Returns the manifest of an export directory, or an empty one if there is none yet."""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), encoding="utf-8") as source:
+            manifest = json.load(source)
+        if manifest.get("format") == MANIFEST_FORMAT:
+            return manifest
+    except (OSError, ValueError):
+        pass  # missing or unreadable manifest, start from scratch
+    return {"format": MANIFEST_FORMAT, "systems": {}}
+
+
+def write_manifest(output_dir, manifest):
+    """Writes the manifest of an export directory, moving it into place so it is never half written."""
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as output:
+        json.dump(manifest, output)
+    os.replace(temporary_path, path)
+
+
+class IncrementalRescale:
+    """
+    Rescales constants through a cache of rows keyed by entry hash.
+
+    It has the same call signature as rescale_value_by_units, and returns the
+    units as a UnitVector like rescale_unit_vector, so it can be passed to
+    print_outputs.write_outputs in place of a RescalePlan.
+
+    Attributes:
+        rows (dict): entry sha256 -> [rescaled value, [unit, power] terms], for every entry seen.
+        recomputed (int): How many entries were rescaled because they were not cached.
+        reused (int): How many entries were taken from the cache.
+    """
+
+    def __init__(self, rescale_value_by_units, cached_rows=None):
+        self.rescale_value_by_units = rescale_units.unit_vector_rescaler(rescale_value_by_units)
+        self.cached_rows = cached_rows or {}
+        self.rows = {}
+        self.recomputed = 0
+        self.reused = 0
+
+    def __call__(self, constant_data, unit_scaling_modes=None):
+        digest = entry_sha256(constant_data)
+        row = self.cached_rows.get(digest)
+        if row is None:
+            rescaled_value, units_applied = self.rescale_value_by_units(constant_data, unit_scaling_modes)
+            row = [rescaled_value, [list(term) for term in units_applied]]
+            self.recomputed += 1
+        else:
+            self.reused += 1
+        self.rows[digest] = row
+        return row[0], UnitVector.of(row[1])
@@ -1,5 +1,14 @@
+import abc
 import argparse
+import json
+import math
 import re
+import sys
+from xml.sax.saxutils import escape, quoteattr
+
+# Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
+from load_mods import load_module
+rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
 
 # Argument parsing setup
 parser = argparse.ArgumentParser(
@@ -7,6 +16,8 @@ parser = argparse.ArgumentParser(
     epilog="Examples:\n"
            "  python converter.py --format=c\n"
            "  python converter.py --format=json\n"
+           "  python converter.py --format=json --structured\n"
+           "  python converter.py --format=ndjson\n"
            "  python converter.py --format=latex\n"
            "  python converter.py --format=markdown\n"
            "  python converter.py --format=python\n"
@@ -14,113 +25,360 @@ parser = argparse.ArgumentParser(
            "  python converter.py --format=xml\n"
 
 )
-parser.add_argument('--format', choices=['json', 'xml', 'python', 'text', 'c', 'latex', 'markdown'], default='json',
+parser.add_argument('--format', choices=['json', 'xml', 'python', 'text', 'c', 'latex', 'markdown', 'ndjson'], default='json',
 #parser.add_argument('--format', choices=['json', 'xml', 'python', 'text', 'c'], default='json',
                    help='Output format (json, xml, python, text, or c)')
 parser.add_argument('--suffix', default='', help='Suffix to append to symbol names')
-args = parser.parse_args()
-
-
-def print_outputs(grouped_constants, rescale_factors, rescale_value_by_units):
-    """Process and stream out constants one line at a time"""
-    first = True
-    symbols=[]
-    
-    # JSON needs opening/closing braces
-    if args.format == 'json':
-        print("{")
-    
-    # XML needs root element
-    elif args.format == 'xml':
-        print("<constants>")
-
-    elif args.format == 'python':
-        print("\n#   --- Output from Physics Unit Coordinate System ---")
-        print("\n#   --- Scaling Factors Used ---")
-        for unit_entry in rescale_factors:
-            print(f"# {unit_entry['symbol']:<10} -> {unit_entry['factor']:.20e} -> {unit_entry['swap_with']:<10}")
-        print()
-        print()
-    
-    elif args.format == 'c':
-        print("/* PHYSICS_UNIT_COORDINATE_SYSTEM.h */")
-        print("#ifndef PUCS_PHYSICS_CONSTANTS_H")
-        print("#define PUCS_PHYSICS_CONSTANTS_H")
-        print("\n/*   --- Scaling Factors Used ---")
+parser.add_argument('--structured', action='store_true',
+                   help='Write json and xml with a real encoder, so the output always parses')
+# parse_known_args so drivers with arguments of their own can import this module too
+args, _ = parser.parse_known_args()
+
+
+# Writers collect their output in memory and hand it to the sink in chunks of at least this many characters
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+
+class OutputWriter(abc.ABC):
+    """
+    Streams rescaled constants to a file-like sink in one output format.
+
+    A writer is made of three pieces of text: a header, one row per constant
+    and a footer, with the separator written between rows. Everything goes
+    through an in-memory buffer that is handed to the sink in large chunks,
+    so writing a whole table costs a handful of write() calls.
+
+    Subclasses must define row; a writer without one can not be instantiated.
+    """
+
+    format = None
+    extension = "txt"
+    separator = ""
+
+    def __init__(self, sink=None, suffix="", buffer_size=DEFAULT_BUFFER_SIZE):
+        self.sink = sys.stdout if sink is None else sink
+        self.suffix = suffix
+        self.buffer_size = buffer_size
+        self._buffer = []
+        self._buffered = 0
+        self._rows = 0
+
+    def write(self, text):
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Hands everything buffered so far to the sink."""
+        if self._buffer:
+            self.sink.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+
+    def header(self, rescale_factors):
+        return ""
+
+    @abc.abstractmethod
+    def row(self, name, symbol, rescaled_value, units_applied, units_str):
+        """Returns the text of one rescaled constant."""
+
+    def footer(self):
+        return ""
+
+    def begin(self, rescale_factors):
+        self._rows = 0
+        self.write(self.header(rescale_factors))
+
+    def write_constant(self, name, data, rescaled_value, units_applied, group_name=None):
+        """Writes one rescaled constant."""
+        if self._rows:
+            self.write(self.separator)
+        self._rows += 1
+        self.write(self.row(name, data['symbol'] + self.suffix, rescaled_value, units_applied, units_applied.text))
+
+    def end(self):
+        self.write(self.footer())
+        self.flush()
+
+
+def _scaling_factor_lines(rescale_factors, prefix=""):
+    return "".join(f"{prefix}{unit_entry['symbol']:<10} -> {unit_entry['factor']:.20e} -> {unit_entry['swap_with']:<10}\n"
+                   for unit_entry in rescale_factors)
+
+
+class JsonWriter(OutputWriter):
+    format = 'json'
+    extension = 'json'
+    separator = ",\n"
+
+    def header(self, rescale_factors):
+        return "{\n"
+
+    def row(self, name, symbol, rescaled_value, units_applied, units_str):
+        return f'  "{symbol}": {{"name": "{name}", "value": {rescaled_value}, "units": "{list(units_applied.rendered)}"}}'
+
+    def footer(self):
+        return "\n}\n"
+
+
+class XmlWriter(OutputWriter):
+    format = 'xml'
+    extension = 'xml'
+
+    def header(self, rescale_factors):
+        return "<constants>\n"
+
+    def row(self, name, symbol, rescaled_value, units_applied, units_str):
+        return f'  <constant name="{name}" value="{rescaled_value}" units="{units_str}"/>\n'
+
+    def footer(self):
+        return "</constants>\n"
+
+
+class PythonWriter(OutputWriter):
+    format = 'python'
+    extension = 'py'
+
+    def header(self, rescale_factors):
+        self.symbols = []
+        return ("\n#   --- Output from Physics Unit Coordinate System ---\n"
+                "\n#   --- Scaling Factors Used ---\n"
+                + _scaling_factor_lines(rescale_factors, "# ")
+                + "\n\n")
+
+    def row(self, name, symbol, rescaled_value, units_applied, units_str):
+        self.symbols.append(symbol)  # Accumulate for the import line in the footer
+        return f"{symbol:<8} = {rescaled_value:<25}# {name:<30} {units_str}\n"
+
+    def footer(self):
+        return ("\n# Import all constants:\n"
+                f"# from your_module import {', '.join(self.symbols)}\n")
+
+
+class TextWriter(OutputWriter):
+    format = 'text'
+
+    def row(self, name, symbol, rescaled_value, units_applied, units_str):
+        return f"{symbol} {rescaled_value} {units_str}\n"
+
+
+class CWriter(OutputWriter):
+    format = 'c'
+    extension = 'h'
+
+    def header(self, rescale_factors):
+        return ("/* PHYSICS_UNIT_COORDINATE_SYSTEM.h */\n"
+                "#ifndef PUCS_PHYSICS_CONSTANTS_H\n"
+                "#define PUCS_PHYSICS_CONSTANTS_H\n"
+                "\n/*   --- Scaling Factors Used ---\n"
+                + _scaling_factor_lines(rescale_factors)
+                + "*/\n\n\n")
+
+    def row(self, name, symbol, rescaled_value, units_applied, units_str):
+        return f"#define {symbol:<8}  {rescaled_value:30} /* {name:<30} {units_str} */\n"
+
+    def footer(self):
+        return "\n#endif /* PUCS PHYSICS_CONSTANTS_H */\n"
+
+
+class LatexWriter(OutputWriter):
+    format = 'latex'
+    extension = 'tex'
+
+    def header(self, rescale_factors):
+        return (r"\documentclass{article}" "\n"
+                r"\usepackage{amsmath, amssymb, geometry}" "\n"
+                r"\begin{document}" "\n"
+                r"\section*{Physics Unit Coordinate System Constants}" "\n")
+
+    def row(self, name, symbol, rescaled_value, units_applied, units_str):
+        safe_units = re.sub(r"\^(-?\d+)", r"^{\1}", units_str.replace(" ", r" \cdot "))
+        return rf"\[{symbol} = {rescaled_value} \quad \text{{({name})}} \quad \mathrm{{{safe_units}}}\]" "\n"
+
+    def footer(self):
+        return r"\end{document}" "\n"
+
+
+class MarkdownWriter(OutputWriter):
+    format = 'markdown'
+    extension = 'md'
+
+    def header(self, rescale_factors):
+        return "# Physics Unit Coordinate System Constants\n```\n"
+
+    def row(self, name, symbol, rescaled_value, units_applied, units_str):
+        return f"{symbol} = {rescaled_value}   # {name} {units_str}\n"
+
+    def footer(self):
+        return "```\n"
+
+
+'''
+ Structured writers
+
+ The json and xml writers above assemble their output with f-strings, the
+ same way the other formats do. The units come out as a Python list repr and
+ nothing is escaped, so the result is not always valid JSON or XML.
+
+ The structured writers build one record per constant and pass it through a
+ real encoder: json.JSONEncoder for JSON and NDJSON, and the xml.sax escaping
+ helpers for XML. Each record is encoded on its own as it streams past, so the
+ whole document never has to be held in memory, and the result loads with
+ json.load, a line by line NDJSON reader, or any XML parser.
+
+ Values that JSON cannot represent (inf and NaN) are written as null.
+ XML uses the xs:double spellings INF, -INF and NaN.
+'''
+
+class StructuredWriter(OutputWriter):
+    """
+    Base for writers that encode one record per constant instead of formatting a line of text.
+
+    Subclasses must define record; a writer without one can not be instantiated.
+    """
+
+    def __init__(self, sink=None, suffix="", buffer_size=DEFAULT_BUFFER_SIZE):
+        super().__init__(sink, suffix, buffer_size)
+        self.encoder = json.JSONEncoder(ensure_ascii=False, allow_nan=False)
+
+    def row(self, name, symbol, rescaled_value, units_applied, units_str, group_name=None):
+        return self.record({
+            "symbol": symbol,
+            "name": name,
+            "group": group_name,
+            "value": rescaled_value,
+            "units": list(units_applied.rendered),
+        })
+
+    def write_constant(self, name, data, rescaled_value, units_applied, group_name=None):
+        if self._rows:
+            self.write(self.separator)
+        self._rows += 1
+        self.write(self.row(name, data['symbol'] + self.suffix, rescaled_value, units_applied,
+                            units_applied.text, group_name))
+
+    @abc.abstractmethod
+    def record(self, fields):
+        """Returns the encoded text of one record, a dictionary of symbol, name, group, value and units."""
+
+
+def _json_number(value):
+    return value if math.isfinite(value) else None
+
+
+def _scaling_factor_records(rescale_factors):
+    return [{"symbol": unit_entry['symbol'], "factor": _json_number(unit_entry['factor']),
+             "swap_with": unit_entry['swap_with']} for unit_entry in rescale_factors]
+
+
+class StructuredJsonWriter(StructuredWriter):
+    """Writes {"scaling_factors": [...], "constants": [...]}, one constant per line."""
+    format = 'json'
+    extension = 'json'
+    separator = ",\n"
+
+    def header(self, rescale_factors):
+        return ('{"scaling_factors": ' + self.encoder.encode(_scaling_factor_records(rescale_factors))
+                + ',\n "constants": [\n')
+
+    def record(self, fields):
+        fields["value"] = _json_number(fields["value"])
+        return "  " + self.encoder.encode(fields)
+
+    def footer(self):
+        return "\n]}\n"
+
+
+class NdjsonWriter(StructuredWriter):
+    """Writes one JSON object per line and nothing else."""
+    format = 'ndjson'
+    extension = 'ndjson'
+
+    def record(self, fields):
+        fields["value"] = _json_number(fields["value"])
+        return self.encoder.encode(fields) + "\n"
+
+
+def _xml_number(value):
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "INF" if value > 0 else "-INF"
+    return repr(float(value))
+
+
+class StructuredXmlWriter(StructuredWriter):
+    format = 'xml'
+    extension = 'xml'
+
+    def header(self, rescale_factors):
+        lines = ['<?xml version="1.0" encoding="utf-8"?>\n<constants>\n  <scaling_factors>\n']
         for unit_entry in rescale_factors:
-            print(f"{unit_entry['symbol']:<10} -> {unit_entry['factor']:.20e} -> {unit_entry['swap_with']:<10}")
-        print("*/")
-        print()
-        print()
-
-    elif args.format == 'latex':
-        print(r"\documentclass{article}")
-        print(r"\usepackage{amsmath, amssymb, geometry}")
-        print(r"\begin{document}")
-        print(r"\section*{Physics Unit Coordinate System Constants}")
-    
-    elif args.format == 'markdown':
-        print("# Physics Unit Coordinate System Constants")
-        print("```")
-    
+            lines.append(f"    <factor symbol={quoteattr(unit_entry['symbol'])} value=\"{_xml_number(unit_entry['factor'])}\""
+                         f" swap_with={quoteattr(unit_entry['swap_with'])}/>\n")
+        lines.append("  </scaling_factors>\n")
+        return "".join(lines)
+
+    def record(self, fields):
+        units = "".join(f"<unit>{escape(unit)}</unit>" for unit in fields["units"])
+        return (f"  <constant symbol={quoteattr(fields['symbol'])} name={quoteattr(fields['name'])}"
+                f" group={quoteattr(fields['group'] or '')} value=\"{_xml_number(fields['value'])}\">{units}</constant>\n")
+
+    def footer(self):
+        return "</constants>\n"
+
+
+# Output format name -> writer class
+WRITERS = {writer.format: writer for writer in
+           (JsonWriter, XmlWriter, PythonWriter, TextWriter, CWriter, LatexWriter, MarkdownWriter, NdjsonWriter)}
+
+# The writers used in place of WRITERS when structured output is asked for
+STRUCTURED_WRITERS = {writer.format: writer for writer in (StructuredJsonWriter, StructuredXmlWriter, NdjsonWriter)}
+
+
+def get_writer(output_format, sink=None, suffix="", buffer_size=DEFAULT_BUFFER_SIZE, structured=False):
+    """
+    Returns a writer for one of the output formats in WRITERS, writing to sink (stdout by default).
+    With structured=True the json and xml formats use the encoder based writers in STRUCTURED_WRITERS.
+    """
+    if output_format not in WRITERS:
+        raise ValueError(f"Unknown output format '{output_format}', expected one of: {', '.join(WRITERS)}")
+    if structured and output_format in STRUCTURED_WRITERS:
+        return STRUCTURED_WRITERS[output_format](sink, suffix, buffer_size)
+    return WRITERS[output_format](sink, suffix, buffer_size)
+
+
+def write_outputs(grouped_constants, rescale_factors, rescale_value_by_units, writers):
+    """
+    Rescales every constant once and streams it to every writer.
+
+    Parameters:
+        grouped_constants (dict): The grouped constants dataset.
+        rescale_factors (list): The scaling factors of one unit system.
+        rescale_value_by_units: rescale_units.rescale_value_by_units or a compiled RescalePlan;
+                                the writers are given its units as a UnitVector.
+        writers (list): OutputWriter instances, e.g. one per format, each with its own sink.
+    """
+    rescale_value_by_units = rescale_units.unit_vector_rescaler(rescale_value_by_units)
+    for writer in writers:
+        writer.begin(rescale_factors)
+
     for group_name, group_data in grouped_constants.items():
         for name, data in group_data.items():
             if not isinstance(data, dict):
                 continue
-            
+
             # Process one constant
             rescaled_value, units_applied = rescale_value_by_units(data, rescale_factors)
-            symbol = data['symbol'] + args.suffix
-            units_str = " ".join(units_applied)
-            
-            # Handle JSON commas
-            if args.format == 'json' and not first:
-                print(",")
-            first = False
-            
-            # Stream output immediately
-            if args.format == 'text':
-                print(f"{symbol} {rescaled_value} {units_str}")
-            
-            elif args.format == 'json':
-                print(f'  "{symbol}": {{"name": "{name}", "value": {rescaled_value}, "units": "{units_applied}"}}', end='')
-            
-            elif args.format == 'xml':
-                print(f'  <constant name="{name}" value="{rescaled_value}" units="{units_str}"/>')
-            
-            elif args.format == 'python':
-                print(f"{symbol:<8} = {rescaled_value:<25}# {name:<30} {units_str}")
-                symbols.append(symbol)  # Accumulate for later
-    
-            elif args.format == 'c':
-                print(f"#define {symbol:<8}  {rescaled_value:30} /* {name:<30} {units_str} */")
-
-            elif args.format == 'latex':
-                safe_units = re.sub(r"\^(-?\d+)", r"^{\1}", units_str.replace(" ", r" \cdot "))
-                print(rf"\[{symbol} = {rescaled_value} \quad \text{{({name})}} \quad \mathrm{{{safe_units}}}\]")
-            
-            elif args.format == 'markdown':
-                print(f"{symbol} = {rescaled_value}   # {name} {units_str}")
-    
-    # Close structured formats
-    if args.format == 'json':
-        print("\n}")
-
-    elif args.format == 'xml':
-        print("</constants>")
-
-    elif args.format == 'python':
-        print("\n# Import all constants:")
-        print(f"# from your_module import {', '.join(symbols)}")
-
-    elif args.format == 'c':
-        print("\n#endif /* PUCS PHYSICS_CONSTANTS_H */")
-
-    elif args.format == 'latex':
-        print(r"\end{document}")
-
-    elif args.format == 'markdown':
-        print("```")
+            for writer in writers:
+                writer.write_constant(name, data, rescaled_value, units_applied, group_name)
 
+    for writer in writers:
+        writer.end()
 
 
+def print_outputs(grouped_constants, rescale_factors, rescale_value_by_units, output_format=None, sink=None):
+    """Process and stream out constants in the format chosen on the command line"""
+    writer = get_writer(output_format or args.format, sink, args.suffix, structured=args.structured)
+    write_outputs(grouped_constants, rescale_factors, rescale_value_by_units, [writer])
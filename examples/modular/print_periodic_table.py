@@ -1,6 +1,10 @@
 import argparse 
 from pprint import pprint  # Import pprint for better formatting
 
+# Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
+from load_mods import load_module
+rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
+
 parser = argparse.ArgumentParser(
     description="Rescale physical constants and optionally show comments.",  # Main description
     epilog=(
@@ -72,28 +76,6 @@ def format_units_with_ascii_exponents(units):
             formatted_units.append(f"{base}{superscript}")
     return ' '.join(formatted_units)
 
-def promote_exponents(unit_string):
-    # Mapping for ASCII superscripts
-    superscripts = { "0": "⁰", "1": "¹", "2": "²", "3": "³", "4": "⁴", "5": "⁵", "6": "⁶", "7": "⁷", "8": "⁸", "9": "⁹", "-": "⁻"
-    }
-    
-    # Split the string into parts to process
-    parts = unit_string.split(" ")
-    formatted_parts = []
-    
-    for part in parts:
-        if "^" in part:
-            # Split the unit from its exponent
-            base, exponent = part.split("^")
-            # Convert the exponent to superscript
-            superscript = "".join(superscripts[char] for char in exponent)
-            formatted_parts.append(f"{base}{superscript}")
-        else:
-            formatted_parts.append(part)
-    
-    # Join the processed parts back into a single string
-    return " ".join(formatted_parts)
-
 def get_group_name(group_number):
     """Returns the group name for a given group number in the periodic table."""
     group_names = {
@@ -121,6 +103,9 @@ def get_group_name(group_number):
     return group_names.get(group_number, "Unknown")
 
 def print_periodic_table(periodic_table, rescale_factors, rescale_value_by_units):
+    # the units are printed with superscripts, so take them as a UnitVector
+    rescale_value_by_units = rescale_units.unit_vector_rescaler(rescale_value_by_units)
+
     # Handle debug option
     if args.debug:
         print("\n--- Debugging Information ---")
@@ -139,8 +124,7 @@ def print_periodic_table(periodic_table, rescale_factors, rescale_value_by_units
             #print (f"{property_name} {value} {units} {notes}")
             if value:
                 scaled_value,  units_applied = rescale_value_by_units( {"value": value, "units": units}, rescale_factors)
-                units_str = " ".join(units_applied)
-                print (f"{property_name:<14} {scaled_value:<18.8} {promote_exponents(units_str):<13} {notes}")
+                print (f"{property_name:<14} {scaled_value:<18.8} {units_applied.superscript:<13} {notes}")
 
         #print("\nInspecting `physical_properties`:")
         #pprint(element['physical_properties'])
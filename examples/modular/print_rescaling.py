@@ -1,5 +1,9 @@
 import argparse 
 
+# Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
+from load_mods import load_module
+rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
+
 parser = argparse.ArgumentParser(
     description="Rescale physical constants and optionally show comments.",  # Main description
     epilog=(
@@ -39,30 +43,9 @@ def format_units_with_ascii_exponents(units):
             formatted_units.append(f"{base}{superscript}")
     return ' '.join(formatted_units)
 
-def promote_exponents(unit_string):
-    # Mapping for ASCII superscripts
-    superscripts = { "0": "⁰", "1": "¹", "2": "²", "3": "³", "4": "⁴", "5": "⁵", "6": "⁶", "7": "⁷", "8": "⁸", "9": "⁹", "-": "⁻", ".": "⋅"
-    }
-    
-    # Split the string into parts to process
-    parts = unit_string.split(" ")
-    formatted_parts = []
-    
-    for part in parts:
-        if "^" in part:
-            # Split the unit from its exponent
-            base, exponent = part.split("^")
-            # Convert the exponent to superscript
-            superscript = "".join(superscripts[char] for char in exponent)
-            formatted_parts.append(f"{base}{superscript}")
-        else:
-            formatted_parts.append(part)
-    
-    # Join the processed parts back into a single string
-    return " ".join(formatted_parts)
-
-
 def print_rescaling (grouped_constants, rescale_factors, rescale_value_by_units):
+    # the units are printed with superscripts, so take them as a UnitVector
+    rescale_value_by_units = rescale_units.unit_vector_rescaler(rescale_value_by_units)
 
     # --- Display Original and Rescaled Constants Side-by-Side ---
     # Adjusted to iterate through groups
@@ -86,12 +69,11 @@ def print_rescaling (grouped_constants, rescale_factors, rescale_value_by_units)
                  original_value_str = f"{original_value:.10e}"
                  rescaled_value, units_applied = rescale_value_by_units(data, rescale_factors)
                  rescaled_value_str = f"{rescaled_value:.10e}" # Use scientific notation here too
-                 units_applied_str = " ".join(units_applied)
     
                  if rescaled_value == 0 :
-                     print(f"   {data['symbol']:<8} {name:<32} {original_value_str:<16} {rescaled_value_str:<16} {promote_exponents(units_applied_str):<29} ERROR 0")
+                     print(f"   {data['symbol']:<8} {name:<32} {original_value_str:<16} {rescaled_value_str:<16} {units_applied.superscript:<29} ERROR 0")
                  else:
-                     print(f"   {data['symbol']:<8} {name:<32} {original_value_str:<16} {rescaled_value_str:<16} {promote_exponents(units_applied_str):<29} {original_value/ rescaled_value:8.8e}")
+                     print(f"   {data['symbol']:<8} {name:<32} {original_value_str:<16} {rescaled_value_str:<16} {units_applied.superscript:<29} {original_value/ rescaled_value:8.8e}")
 
                  # Loop through fields dynamically based on args or print all if --all flag is present
                  indent = " " * 11 
@@ -19,10 +19,75 @@
  and accessible.
 '''
 
-def rescale_value_by_units(constant_data, unit_scaling_modes):
+import math
+import sys
+
+# Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
+from load_mods import load_module
+unit_vector = load_module("./modular/unit_vector.py", "unit_vector")
+UnitVector = unit_vector.UnitVector
+
+'''
+ Numeric backends
+
+ The default "float" backend divides the value by rescale_factor ** power
+ for each unit, one after the other. For extreme unit systems such as
+ galactic or planck, those intermediate powers can overflow or underflow
+ even when the final answer is an ordinary number.
+
+ The "log" backend adds up power * log10(rescale_factor) over the units
+ instead, and exponentiates once at the end. The "mantissa" backend does
+ the same but never exponentiates the whole thing; it returns a
+ (mantissa, exponent) pair with value = mantissa * 10 ** exponent, so no
+ result is ever out of range.
+'''
+
+BACKENDS = ("float", "log", "mantissa")
+
+def _check_backend(backend):
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown rescale backend '{backend}', expected one of: {', '.join(BACKENDS)}")
+
+def _finish_log10(value, log_scale, backend):
+    """Divides value by 10 ** log_scale, as a float for "log" or a (mantissa, exponent) pair for "mantissa"."""
+    if value == 0 or math.isinf(value) or math.isnan(value) or math.isnan(log_scale):
+        if backend == "log":
+            return value if not math.isnan(log_scale) else math.nan
+        return (value if not math.isnan(log_scale) else math.nan, 0)
+
+    log_value = math.log10(abs(value)) - log_scale
+    if backend == "log":
+        try:
+            return math.copysign(10.0 ** log_value, value)
+        except OverflowError:
+            return math.copysign(math.inf, value)
+
+    exponent = math.floor(log_value)
+    mantissa = 10.0 ** (log_value - exponent)
+    if mantissa >= 10.0:  # rounding can land exactly on the next decade
+        mantissa /= 10.0
+        exponent += 1
+    return math.copysign(mantissa, value), exponent
+
+def rescale_value_by_units(constant_data, unit_scaling_modes, backend="float"):
     """
     Rescales the value of a physical constant based on unit scaling factors
     and returns the rescaled value along with the updated units.
+
+    The units come back as a list of strings, e.g. ["m_P^-2", "kg_P"]; use
+    rescale_unit_vector for the same result with the units as a UnitVector.
+    Parameters and backends are the same for both.
+
+    Returns:
+        tuple: A tuple containing the rescaled value and a list of the updated unit strings.
+    """
+    rescaled_value, units_applied = rescale_unit_vector(constant_data, unit_scaling_modes, backend)
+    return rescaled_value, list(units_applied.rendered)
+
+def rescale_unit_vector(constant_data, unit_scaling_modes, backend="float"):
+    """
+    Rescales the value of a physical constant based on unit scaling factors
+    and returns the rescaled value along with the updated units as a UnitVector.
     
     Parameters:
         constant_data (dict): A dictionary containing the value of the constant 
@@ -30,11 +95,16 @@ def rescale_value_by_units(constant_data, unit_scaling_modes):
         unit_scaling_modes (list): A list of scaling factor dictionaries, where each entry
                                    contains "symbol" (original unit), "factor" (scaling factor), 
                                    and "swap_with" (target unit).
+        backend (str): "float" (the default) divides by each factor ** power in turn,
+                       "log" sums the powers of the factors in log space and exponentiates once,
+                       "mantissa" does the same and returns a (mantissa, exponent) pair.
 
     Returns:
-        tuple: A tuple containing the rescaled value and a list of updated unit representations.
+        tuple: A tuple containing the rescaled value and a UnitVector of the updated units.
+               With the "mantissa" backend the rescaled value is a (mantissa, exponent) pair.
     """
-    
+    _check_backend(backend)
+
     # Extract the original value of the constant
     original_value = constant_data["value"]
 
@@ -45,7 +115,10 @@ def rescale_value_by_units(constant_data, unit_scaling_modes):
     # Initialize the rescaled value to the original value
     rescaled_value = original_value
 
-    # List to store the new units after applying scaling
+    # The log and mantissa backends collect sum(power * log10(factor)) here instead of dividing
+    log_scale = 0.0
+
+    # List to store the new units after applying scaling, as (unit, power) terms
     units_applied_list = []
 
     # Iterate over each unit symbol and its associated power
@@ -59,30 +132,220 @@ def rescale_value_by_units(constant_data, unit_scaling_modes):
                 # Apply the scaling factor to rescale the value
                 rescale_factor = mode["factor"]
                 if rescale_factor != 0:
-                    # Adjust the rescaled value by dividing by (rescale_factor^power)
-                    rescaled_value /= (rescale_factor ** power)
+                    if backend == "float":
+                        # Adjust the rescaled value by dividing by (rescale_factor^power)
+                        rescaled_value /= (rescale_factor ** power)
+                    else:
+                        log_scale += power * math.log10(rescale_factor)
                 elif original_value != 0:
                     # Handle edge case where the rescale factor is zero (invalid)
-                    print(f"Warning: Rescale factor for {unit_symbol} is zero!")
+                    print(f"Warning: Rescale factor for {unit_symbol} is zero!", file=sys.stderr)
                     rescaled_value = float('inf')  # Set value to infinity to indicate a problem
 
                 # Replace the current unit with its corresponding "swap_with" unit
                 swapped_unit = mode["swap_with"]
                 #print (f"*** {unit_symbol} {rescale_factor} {power} {swapped_unit}")
-                if power != 1:  # Include the power if it's not 1
-                    units_applied_list.append(f"{swapped_unit}^{power}")
-                else:
-                    units_applied_list.append(f"{swapped_unit}")
+                units_applied_list.append((swapped_unit, power))
 
                 matched = True  # Mark the unit as successfully matched and scaled
                 break  # No need to check further modes for this unit symbol
 
         # If no scaling factor was found for the unit, preserve the original unit and power
         if not matched:
-            if power != 1:
-                units_applied_list.append(f"{unit_symbol}^{power}")
+            units_applied_list.append((unit_symbol, power))
+
+    if backend != "float":
+        rescaled_value = _finish_log10(rescaled_value, log_scale, backend)
+
+    # Return the rescaled value and the updated units
+    return rescaled_value, UnitVector.of(units_applied_list)
+
+
+'''
+ Compiled rescale plans
+
+ rescale_value_by_units scans the whole list of scaling modes for every
+ unit of every constant and renders the unit strings as it goes.  When
+ the same table of constants is rescaled over and over with the same
+ scaling factors that work is identical every time, so it can be done
+ once up front.
+
+ A RescalePlan indexes the scaling modes by symbol and remembers, for each
+ distinct units list it has seen, the divisors to apply (or, for the log
+ and mantissa backends, the log scale) and the updated UnitVector.  After
+ the first time a units list is seen, rescaling a value costs a dictionary
+ lookup plus the divisions themselves, and the result is identical to
+ rescale_value_by_units (RescalePlan.rescale) or to rescale_unit_vector
+ (RescalePlan.rescale_vector).
+'''
+
+class RescalePlan:
+    """
+    A precompiled form of a scaling factor list.
+
+    Attributes:
+        index (dict): Maps each original unit symbol to a (factor, swap_with) tuple.
+                      When a symbol appears more than once the first entry wins,
+                      the same as the linear search in rescale_value_by_units.
+    """
+
+    def __init__(self, unit_scaling_modes):
+        self.index = {}
+        for mode in unit_scaling_modes:
+            self.index.setdefault(mode["symbol"], (mode["factor"], mode["swap_with"]))
+
+        # UnitVector -> (divisors, updated UnitVector, sum of power * log10(factor)),
+        # one table for the "float" backend and one for "log" and "mantissa"
+        self._compiled = {}
+        self._compiled_log = {}
+
+        # Symbols compile_units has kept unscaled, which add_mode must not leave cached that way
+        self._unscaled = set()
+
+    def add_mode(self, symbol, factor, swap_with):
+        """
+        Adds one scaling mode, like appending it to the scaling factor list the
+        plan was compiled from: a symbol that already has a mode keeps it.
+        Compiled units lists are only dropped if one of them has used the
+        symbol unscaled.
+        """
+        if symbol in self.index:
+            return
+        self.index[symbol] = (factor, swap_with)
+        if symbol in self._unscaled:
+            self._unscaled.discard(symbol)
+            self._compiled.clear()
+            self._compiled_log.clear()
+
+    def compile_units(self, unit_list, backend="float"):
+        """
+        Returns the cached (divisors, updated units, log scale) for a units list,
+        compiling it on first use. Units that are already a UnitVector are looked
+        up directly, anything else is interned first.
+
+        For the "float" backend each divisor is rescale_factor ** power, applied
+        in the same order as rescale_value_by_units applies them, and the log
+        scale is 0. For "log" and "mantissa" only the log scale, the sum of
+        power * log10(rescale_factor), is compiled, never the float power that
+        those backends exist to avoid. Either way a zero scaling factor is kept
+        as a divisor holding the unit symbol (a str), so the warning can be
+        raised at rescale time, and a negative one raises ValueError on the log
+        path, the same as rescale_value_by_units.
+        """
+        in_log = backend != "float"
+        table = self._compiled_log if in_log else self._compiled
+        key = UnitVector.of(unit_list)
+        compiled = table.get(key)
+        if compiled is not None:
+            return compiled
+
+        divisors = []
+        swap_with = {}
+        log_scale = 0.0
+        for unit_symbol, power in key:
+            mode = self.index.get(unit_symbol)
+            if mode is None:
+                # No scaling factor for this unit, preserve the original unit and power
+                swapped_unit = unit_symbol
+                self._unscaled.add(unit_symbol)
             else:
-                units_applied_list.append(f"{unit_symbol}")
+                rescale_factor, swapped_unit = mode
+                if rescale_factor == 0:
+                    divisors.append(unit_symbol)
+                elif in_log:
+                    log_scale += power * math.log10(rescale_factor)
+                else:
+                    divisors.append(rescale_factor ** power)
+                swap_with[unit_symbol] = swapped_unit
+
+        compiled = (tuple(divisors), key.swapped(swap_with), log_scale)
+        table[key] = compiled
+        return compiled
+
+    def rescale(self, constant_data, backend="float"):
+        """
+        Rescales a constant exactly like rescale_value_by_units does with the
+        scaling factors this plan was compiled from.
+
+        Parameters:
+            constant_data (dict): A dictionary with a "value" and optional "units" list.
+            backend (str): "float", "log" or "mantissa", as for rescale_value_by_units.
+
+        Returns:
+            tuple: The rescaled value and a list of the updated unit strings.
+        """
+        rescaled_value, units_applied = self.rescale_vector(constant_data, backend)
+        return rescaled_value, list(units_applied.rendered)
+
+    def rescale_vector(self, constant_data, backend="float"):
+        """Rescales a constant like rescale, returning the updated units as a UnitVector."""
+        original_value = constant_data["value"]
+
+        if backend == "float":
+            divisors, units_applied, log_scale = self.compile_units(constant_data.get("units", []))
+            rescaled_value = original_value
+            for divisor in divisors:
+                if divisor.__class__ is str:
+                    if original_value != 0:
+                        print(f"Warning: Rescale factor for {divisor} is zero!", file=sys.stderr)
+                        rescaled_value = float('inf')
+                else:
+                    rescaled_value /= divisor
+            return rescaled_value, units_applied
+
+        _check_backend(backend)
+        divisors, units_applied, log_scale = self.compile_units(constant_data.get("units", []), backend)
+        rescaled_value = original_value
+        for divisor in divisors:  # only the zero factors, on this path
+            if original_value != 0:
+                print(f"Warning: Rescale factor for {divisor} is zero!", file=sys.stderr)
+                rescaled_value = float('inf')
+        return _finish_log10(rescaled_value, log_scale, backend), units_applied
+
+    def __call__(self, constant_data, unit_scaling_modes=None, backend="float"):
+        # Same call signature as rescale_value_by_units so a plan can be passed
+        # anywhere the function is expected. The scaling modes were fixed when
+        # the plan was compiled, so the second argument is ignored.
+        return self.rescale(constant_data, backend)
+
+    def vector_call(self, constant_data, unit_scaling_modes=None, backend="float"):
+        # rescale_unit_vector's call signature, for unit_vector_rescaler
+        return self.rescale_vector(constant_data, backend)
+
+
+def compile_rescale_plan(unit_scaling_modes):
+    """
+    Compiles a list of scaling factors into a RescalePlan.
+
+    Parameters:
+        unit_scaling_modes (list): A list of scaling factor dictionaries, as passed
+                                   to rescale_value_by_units.
+
+    Returns:
+        RescalePlan: A callable that can be used in place of rescale_value_by_units.
+    """
+    return RescalePlan(unit_scaling_modes)
+
+
+def unit_vector_rescaler(rescaler):
+    """
+    Returns a callable with the call signature of rescale_value_by_units that
+    gives the updated units as a UnitVector, for code that renders them.
+
+    Parameters:
+        rescaler: rescale_value_by_units, rescale_unit_vector, a RescalePlan, or any
+                  callable with the same signature. Units it returns as strings are
+                  turned back into a UnitVector by unit_vector.as_unit_vector.
+
+    Returns:
+        The callable: rescale_unit_vector, the plan's vector_call, or a wrapper.
+    """
+    if rescaler is rescale_value_by_units or rescaler is rescale_unit_vector:
+        return rescale_unit_vector
+    if isinstance(rescaler, RescalePlan):
+        return rescaler.vector_call
 
-    # Return the rescaled value and the updated unit list
-    return rescaled_value, units_applied_list
+    def rescale(constant_data, unit_scaling_modes, *args, **kwargs):
+        rescaled_value, units_applied = rescaler(constant_data, unit_scaling_modes, *args, **kwargs)
+        return rescaled_value, unit_vector.as_unit_vector(units_applied)
+    return rescale
@@ -0,0 +1,122 @@
+'''
+ Synthetic constant catalogs and composite unit graphs
+
+ The datasets in ../data_sets hold about a hundred constants and a few
+ dozen composite units, which says little about how the rescaler behaves
+ on catalogs of millions of measured quantities with all sorts of unit
+ signatures, or on deep graphs of composite units.
+
+ The generators here build data of any size in exactly the same shape as
+ the real datasets:
+
+     synthetic_constants     a grouped_constants dictionary, like data_sets/constants.py
+     synthetic_composites    a composite_units list, like data_sets/composite_units.py
+
+ so anything that takes the real data takes the synthetic data too. Both
+ are driven by a seed, so the same arguments always give the same data.
+'''
+
+import random
+
+# Units the real constants use, including ones that some unit systems do not scale
+CONSTANT_UNITS = ["m", "s", "kg", "K", "C", "mol", "pi", "A", "J", "Hz", "N", "W", "Pa", "V"]
+
+# Units every unit system scales before it resolves the composites
+BASE_UNITS = ["s", "m", "kg", "K", "C", "mol", "pi"]
+
+
+def _power(rng, max_power, fractional, zero):
+    roll = rng.random()
+    if roll < zero:
+        return 0
+    if roll < zero + fractional:
+        return rng.choice((-1, 1)) * rng.choice((0.5, 1.5))
+    return rng.choice([power for power in range(-max_power, max_power + 1) if power != 0])
+
+
+def synthetic_constants(count, group_size=100, unit_symbols=None, max_units=5, max_power=4,
+                        fractional=0.05, zero=0.01, text=True, seed=0):
+    """
+    Generates a catalog of constants in the schema of data_sets/constants.py.
+
+    Parameters:
+        count (int): How many constants to generate.
+        group_size (int): Constants per group.
+        unit_symbols (list): Units to draw from, CONSTANT_UNITS by default.
+        max_units (int): Most units in one constant's units list.
+        max_power (int): Largest power, in either direction.
+        fractional (float): Share of powers that are fractional, like m^-0.5.
+        zero (float): Share of powers that are 0, which some real entries have.
+        text (bool): Also fill in the prose fields (formula, comment, reference).
+        seed (int): Seed for the random numbers.
+
+    Returns:
+        dict: group name -> {constant name -> constant dictionary}.
+    """
+    rng = random.Random(seed)
+    unit_symbols = unit_symbols or CONSTANT_UNITS
+    max_units = min(max_units, len(unit_symbols))
+
+    grouped_constants = {}
+    for index in range(count):
+        group = grouped_constants.setdefault(f"Synthetic Group {index // group_size}", {})
+        units = [(symbol, _power(rng, max_power, fractional, zero))
+                 for symbol in rng.sample(unit_symbols, rng.randint(1, max_units))]
+        data = {
+            "value": rng.uniform(1.0, 10.0) * 10.0 ** rng.randint(-60, 60),
+            "units": units,
+            "symbol": f"X_{index}",
+        }
+        if text:
+            data["formula"] = " ".join(f"{symbol}**{power}" for symbol, power in units)
+            data["comment"] = f"Synthetic constant number {index}."
+            data["reference"] = "Generated by synthetic_catalog.py"
+        group[f"synthetic_constant_{index}"] = data
+
+    return grouped_constants
+
+
+def synthetic_composites(count, depth=3, base_units=None, max_units=4, max_power=3, shuffle=True, seed=0):
+    """
+    Generates a composite unit graph in the schema of data_sets/composite_units.py.
+
+    The composites are split evenly over depth layers. Every composite in layer d is
+    built from at least one composite of layer d - 1 plus some base units, so the
+    longest dependency chain is depth composites long.
+
+    Parameters:
+        count (int): How many composite units to generate.
+        depth (int): How many layers of composites build on each other.
+        base_units (list): The units the first layer is built from, BASE_UNITS by default.
+        max_units (int): Most units in one composite's units list.
+        max_power (int): Largest power, in either direction.
+        shuffle (bool): Shuffle the list so definitions come before the units they use,
+                        which makes the resolver do the ordering.
+        seed (int): Seed for the random numbers.
+
+    Returns:
+        list: Composite unit dictionaries with "symbol" and "units".
+    """
+    rng = random.Random(seed)
+    base_units = base_units or BASE_UNITS
+    depth = max(1, min(depth, count)) if count else 1
+
+    composites = []
+    previous_layer = []
+    for layer in range(depth):
+        size = count // depth + (1 if layer < count % depth else 0)
+        current_layer = []
+        for index in range(size):
+            symbol = f"U{layer}_{index}"
+            units = []
+            if previous_layer:
+                units.append((rng.choice(previous_layer), rng.choice((-1, 1))))
+            extra = rng.sample(base_units, rng.randint(0 if units else 1, min(max_units - len(units), len(base_units))))
+            units += [(unit, rng.choice([p for p in range(-max_power, max_power + 1) if p != 0])) for unit in extra]
+            composites.append({"symbol": symbol, "units": units})
+            current_layer.append(symbol)
+        previous_layer = current_layer
+
+    if shuffle:
+        rng.shuffle(composites)
+    return composites
@@ -3,7 +3,7 @@ import math
 # Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
 from load_mods import load_module
 
-def calculate_scaling_factors(constants):
+def base_scaling_factors(constants):
     c = constants["Core Scaling Constants"]["speed_of_light_c"]["value"]
     h = constants["Core Scaling Constants"]["planck_constant_h"]["value"]
     k = constants["Core Scaling Constants"]["boltzmann_constant_k"]["value"]
@@ -35,6 +35,12 @@ def calculate_scaling_factors(constants):
         # The definition of 'amu' would need to be revisited in the context of Msun_g.
     ]
 
+    return rescale_factors, "_g"
+
+
+def calculate_scaling_factors(constants):
+    rescale_factors, postpend = base_scaling_factors(constants)
+
     composite_unit_module = load_module("./modular/composite_units.py", "composite_units")
 
-    return composite_unit_module.rescale_composite_units(rescale_factors, "_g")
+    return composite_unit_module.rescale_composite_units(rescale_factors, postpend)
@@ -3,7 +3,7 @@ import math
 # Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
 from load_mods import load_module
 
-def calculate_scaling_factors(constants):
+def base_scaling_factors(constants):
     rescale_factors = [
         {"symbol": "s",  "factor": 1.0,                "swap_with": "s"},
         {"symbol": "m",  "factor": 1/3.28084,          "swap_with": "ft"},
@@ -15,9 +15,15 @@ def calculate_scaling_factors(constants):
         {"symbol": "pi", "factor": 1.0,                "swap_with": "pi"},
     ]
 
+    return rescale_factors, "_i"
+
+
+def calculate_scaling_factors(constants):
+    rescale_factors, postpend = base_scaling_factors(constants)
+
     composite_unit_module = load_module("./modular/composite_units.py", "composite_units")
 
-    return composite_unit_module.rescale_composite_units(rescale_factors, "_i")
+    return composite_unit_module.rescale_composite_units(rescale_factors, postpend)
 
 
 ''' Some conceptual ideas to properly handle composite unit scaling to imperial properly
@@ -25,7 +25,7 @@ e_scaling = (  1e7 * Hz_kg * c  )**(1/2)
 e_scaling = (  1e7 * Hz_kg * c  )**(1/2) / 3.4079462030e-02 
 e_scaling = 1.6021766340e-19
 
-def calculate_scaling_factors(constants):
+def base_scaling_factors(constants):
 
     rescale_factors = [
         {"symbol": "s",  "factor": t_P,             "swap_with": "t_Ph"},
@@ -39,9 +39,15 @@ def calculate_scaling_factors(constants):
         {"symbol": "amu","factor": 1.0,             "swap_with": "amu"},
     ]
 
+    return rescale_factors, "_Ph"
+
+
+def calculate_scaling_factors(constants):
+    rescale_factors, postpend = base_scaling_factors(constants)
+
     composite_unit_module = load_module("./modular/composite_units.py", "composite_units")
 
-    return composite_unit_module.rescale_composite_units(rescale_factors, "_Ph")
+    return composite_unit_module.rescale_composite_units(rescale_factors, postpend)
 
 
 
@@ -19,7 +19,7 @@ t_P   = (G_n )**(1/2)
 e_scaling = (  1e7 * Hz_kg * c  )**(1/2)
 tps = (2*pi) ** (1/2)
 
-def calculate_scaling_factors(constants):
+def base_scaling_factors(constants):
 
     rescale_factors = [
         {"symbol": "s",  "factor": t_P/tps,               "swap_with": "t_P"},
@@ -33,6 +33,12 @@ def calculate_scaling_factors(constants):
         {"symbol": "amu","factor": 1.0,                   "swap_with": "amu"},
     ]
 
+    return rescale_factors, "_P"
+
+
+def calculate_scaling_factors(constants):
+    rescale_factors, postpend = base_scaling_factors(constants)
+
     composite_unit_module = load_module("./modular/composite_units.py", "composite_units")
 
-    return composite_unit_module.rescale_composite_units(rescale_factors, "_P")
+    return composite_unit_module.rescale_composite_units(rescale_factors, postpend)
@@ -11,7 +11,7 @@ Numerically the equivalent properties only change power as they convert between
 Also both G and k_e are numerically 1, but scaled in power.
 '''
 
-def calculate_scaling_factors(constants):
+def base_scaling_factors(constants):
     c = constants["Core Scaling Constants"]["speed_of_light_c"]["value"]
     h = constants["Core Scaling Constants"]["planck_constant_h"]["value"]
     k = constants["Core Scaling Constants"]["boltzmann_constant_k"]["value"]
@@ -39,7 +39,13 @@ def calculate_scaling_factors(constants):
         {"symbol": "amu", "factor": Hz_kg/(1e-50 * time), "swap_with": "amu_r"},
     ]
 
+    return rescale_factors, "_r"
+
+
+def calculate_scaling_factors(constants):
+    rescale_factors, postpend = base_scaling_factors(constants)
+
     composite_unit_module = load_module("./modular/composite_units.py", "composite_units")
 
-    return composite_unit_module.rescale_composite_units(rescale_factors, "_r")
+    return composite_unit_module.rescale_composite_units(rescale_factors, postpend)
 
@@ -3,7 +3,7 @@ import math
 # Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
 from load_mods import load_module
 
-def calculate_scaling_factors(constants):
+def base_scaling_factors(constants):
     c = constants["Core Scaling Constants"]["speed_of_light_c"]["value"]
     h = constants["Core Scaling Constants"]["planck_constant_h"]["value"]
 
@@ -18,6 +18,12 @@ def calculate_scaling_factors(constants):
         {"symbol": "amu", "factor": 1/1.66053906660e-27 , "swap_with": "kg"},
     ]
 
+    return rescale_factors, ""
+
+
+def calculate_scaling_factors(constants):
+    rescale_factors, postpend = base_scaling_factors(constants)
+
     composite_unit_module = load_module("./modular/composite_units.py", "composite_units")
 
-    return composite_unit_module.rescale_composite_units(rescale_factors, "")
+    return composite_unit_module.rescale_composite_units(rescale_factors, postpend)
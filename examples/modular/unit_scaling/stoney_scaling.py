@@ -27,7 +27,7 @@ E_S_SI = m_S_SI * c_SI**2 # 1.667103...e-10 J
 T_S_SI = E_S_SI / k_B_SI # 1.207520...e33 K
 A_S_SI = Q_S_SI / t_S_SI # 3.478911...e10 A
 
-def calculate_scaling_factors(constants):
+def base_scaling_factors(constants):
 
     """
     Calculates scaling factors for Stoney Units (c=e=G=ke=1).
@@ -46,6 +46,12 @@ def calculate_scaling_factors(constants):
     ]
 
     # load the composite unit module and extract the dictionary
+    return rescale_factors, "_S"
+
+
+def calculate_scaling_factors(constants):
+    rescale_factors, postpend = base_scaling_factors(constants)
+
     composite_unit_module = load_module("./modular/composite_units.py", "composite_units")
 
-    return composite_unit_module.rescale_composite_units(rescale_factors, "_S")
+    return composite_unit_module.rescale_composite_units(rescale_factors, postpend)
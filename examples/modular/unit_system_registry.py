@@ -0,0 +1,162 @@
+'''
+ Unit system registry
+
+ Every module in ./modular/unit_scaling/ defines one unit system through its
+ calculate_scaling_factors(constants) function. Calling it derives the base
+ scalings from the constants with base_scaling_factors(constants), and then
+ resolves every composite unit, which is the same work every time for the
+ same constants.
+
+ The registry finds all of the scaling modules once, and computes a unit
+ system's factor table the first time it is asked for. The result is kept
+ for that system and that version of the constants dataset, so switching
+ back and forth between systems costs a dictionary lookup. The compiled
+ RescalePlan for each system is kept the same way.
+'''
+
+import glob
+import hashlib
+import os
+from collections import OrderedDict
+
+# Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
+from load_mods import load_module, source_sha256
+rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
+
+SCALING_SUFFIX = "_scaling"
+
+
+# id(grouped_constants) -> (grouped_constants, version), least recently used first.
+# Holding the dictionary keeps its id from being reused while the entry exists,
+# so only the last DATASET_VERSION_CACHE_SIZE dictionaries are kept.
+DATASET_VERSION_CACHE_SIZE = 8
+_dataset_versions = OrderedDict()
+
+
+def dataset_version(constants):
+    """
+    Returns a string that identifies the version of a constants dataset.
+
+    Parameters:
+        constants: A dataset loaded with load_dataset, whose source_sha256 is used
+                   directly, or a grouped_constants dictionary, which is hashed once
+                   while it is among the DATASET_VERSION_CACHE_SIZE most recently seen. Replace such a dictionary rather than changing
+                   it in place, or its version will not change.
+    """
+    source_sha256 = getattr(constants, "source_sha256", None)
+    if source_sha256 is not None:
+        return source_sha256
+    grouped_constants = getattr(constants, "grouped_constants", constants)
+    key = id(grouped_constants)
+    cached = _dataset_versions.get(key)
+    if cached is not None and cached[0] is grouped_constants:
+        _dataset_versions.move_to_end(key)
+        return cached[1]
+    version = hashlib.sha256(repr(grouped_constants).encode("utf-8")).hexdigest()
+    _dataset_versions[key] = (grouped_constants, version)
+    _dataset_versions.move_to_end(key)
+    while len(_dataset_versions) > DATASET_VERSION_CACHE_SIZE:
+        _dataset_versions.popitem(last=False)
+    return version
+
+
+class UnitSystemRegistry:
+    """
+    Finds the unit scaling modules and memoizes their factor tables.
+
+    Attributes:
+        paths (dict): Maps a unit system name, e.g. "planck_h", to its scaling module path.
+    """
+
+    def __init__(self, scaling_directory="./modular/unit_scaling"):
+        self.paths = {}
+        for path in sorted(glob.glob(os.path.join(scaling_directory, f"*{SCALING_SUFFIX}.py"))):
+            name = os.path.basename(path)[:-len(SCALING_SUFFIX) - 3]
+            self.paths[name] = path
+
+        # (name, dataset version) -> factor list, and -> RescalePlan
+        self._factors = {}
+        self._plans = {}
+
+    def names(self):
+        """Returns the names of every registered unit system."""
+        return list(self.paths)
+
+    def __contains__(self, name):
+        return name in self.paths
+
+    def module(self, name):
+        """Returns the scaling module of a unit system."""
+        if name not in self.paths:
+            raise KeyError(f"Unknown unit system '{name}', expected one of: {', '.join(self.paths)}")
+        return load_module(self.paths[name], f"{name}{SCALING_SUFFIX}")
+
+    def module_sha256(self, name):
+        """Returns the sha256 of a unit system's scaling module source."""
+        if name not in self.paths:
+            raise KeyError(f"Unknown unit system '{name}', expected one of: {', '.join(self.paths)}")
+        return source_sha256(self.paths[name])
+
+    def factors(self, name, constants):
+        """
+        Returns the scaling factor list of a unit system, computing it on first use.
+
+        Parameters:
+            name (str): The unit system, e.g. "si" or "planck".
+            constants: The constants dataset from load_dataset("../data_sets/constants.py").
+
+        Returns:
+            list: The list calculate_scaling_factors returned. It is shared between
+                  callers, so it must not be modified.
+        """
+        key = (name, dataset_version(constants))
+        factors = self._factors.get(key)
+        if factors is None:
+            grouped_constants = getattr(constants, "grouped_constants", constants)
+            factors = self.module(name).calculate_scaling_factors(grouped_constants)
+            self._factors[key] = factors
+        return factors
+
+    def base_factors(self, name, constants):
+        """
+        Returns the base scalings of a unit system, before its composite units are resolved.
+
+        Parameters:
+            name (str): The unit system, e.g. "si" or "planck".
+            constants: The constants dataset from load_dataset("../data_sets/constants.py").
+
+        Returns:
+            tuple: (factor list, postpend) as the module's base_scaling_factors returned them,
+                   the arguments its calculate_scaling_factors hands to rescale_composite_units.
+                   They are not cached, so the list may be modified.
+        """
+        grouped_constants = getattr(constants, "grouped_constants", constants)
+        return self.module(name).base_scaling_factors(grouped_constants)
+
+    def plan(self, name, constants):
+        """Returns the compiled RescalePlan of a unit system, compiling it on first use."""
+        key = (name, dataset_version(constants))
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = rescale_units.compile_rescale_plan(self.factors(name, constants))
+            self._plans[key] = plan
+        return plan
+
+    def all_factors(self, constants, names=None):
+        """Returns a dictionary of unit system name to factor list, for every system or just names."""
+        return {name: self.factors(name, constants) for name in (names or self.paths)}
+
+    def clear(self):
+        """Forgets every computed factor table and plan."""
+        self._factors.clear()
+        self._plans.clear()
+
+
+_default_registry = None
+
+def default_registry():
+    """Returns the registry of ./modular/unit_scaling shared by the whole process."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = UnitSystemRegistry()
+    return _default_registry
@@ -0,0 +1,184 @@
+'''
+ Interned unit vectors
+
+ Units travel through the datasets as lists of (symbol, power) pairs, and
+ come back out of rescale_value_by_units as strings like "m_P^-2" that the
+ printers join together and then split apart again to turn the powers into
+ superscripts.
+
+ A UnitVector holds one units list as a tuple of (symbol, power) terms, in
+ the order they were given, since that is the order they are displayed in.
+ Vectors are interned: UnitVector.of returns the same object for the same
+ terms, so two vectors are equal exactly when they are the same object and
+ can be used as dictionary keys at the cost of an identity check. The
+ intern table only holds its vectors weakly, so a vector nothing else uses
+ any more is freed, and a later UnitVector.of builds it afresh. The hash
+ and the rendered forms (plain text and superscripts) are worked out once
+ per distinct vector and kept on it.
+
+ Iterating a vector gives its (symbol, power) terms, so a vector can be
+ used anywhere a units list is read. A vector also equals a list or tuple
+ of its terms, or of its rendered strings, so comparisons written against
+ units lists and against what rescale_value_by_units returns keep working.
+
+ rescale_value_by_units still returns the rendered strings, as a list;
+ rescale_unit_vector and RescalePlan.rescale_vector return the vector.
+'''
+
+import weakref
+
+# Superscripts for rendering powers, "." is used by fractional powers like 0.5
+SUPERSCRIPTS = str.maketrans({"0": "⁰", "1": "¹", "2": "²", "3": "³", "4": "⁴", "5": "⁵",
+                              "6": "⁶", "7": "⁷", "8": "⁸", "9": "⁹", "-": "⁻", ".": "⋅"})
+
+
+def _render(symbol, power):
+    return f"{symbol}^{power}" if power != 1 else f"{symbol}"
+
+
+class UnitVector:
+    """
+    An immutable, interned units list.
+
+    Attributes:
+        terms (tuple): The (symbol, power) pairs, in display order.
+    """
+
+    __slots__ = ("terms", "_hash", "_rendered", "_text", "_superscript", "__weakref__")
+
+    # (terms, power types) -> UnitVector, for every vector still in use in this process
+    _interned = weakref.WeakValueDictionary()
+
+    def __init__(self, terms):
+        # use UnitVector.of, which interns; this only builds the object
+        self.terms = terms
+        self._hash = hash(terms)
+        self._rendered = None
+        self._text = None
+        self._superscript = None
+
+    @classmethod
+    def of(cls, units):
+        """
+        Returns the interned vector for a units list like [("kg", 1), ("m", -2)].
+        A UnitVector is returned as it is.
+        """
+        if units.__class__ is cls:
+            return units
+        terms = tuple((symbol, power) for symbol, power in units)
+        # 2 and 2.0 are equal but render differently, so the power's type is part of the key
+        key = (terms, tuple(power.__class__ for symbol, power in terms))
+        vector = cls._interned.get(key)
+        if vector is None:
+            vector = cls._interned.setdefault(key, cls(terms))
+        return vector
+
+    def __iter__(self):
+        return iter(self.terms)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def __getitem__(self, index):
+        return self.terms[index]
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        # interned, so equal vectors are the same object
+        if other.__class__ is UnitVector:
+            return self is other
+        if isinstance(other, (list, tuple)):
+            # only a tuple of the terms also hashes the same
+            other = tuple(tuple(item) if isinstance(item, list) else item for item in other)
+            return other == self.terms or other == self.rendered
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __repr__(self):
+        return f"UnitVector({list(self.terms)!r})"
+
+    @property
+    def rendered(self):
+        """The terms as strings, e.g. ("m_P^2", "s_P^-1"), the form rescale_value_by_units used to return."""
+        if self._rendered is None:
+            self._rendered = tuple(_render(symbol, power) for symbol, power in self.terms)
+        return self._rendered
+
+    @property
+    def text(self):
+        """The terms joined by spaces, e.g. "m_P^2 s_P^-1"."""
+        if self._text is None:
+            self._text = " ".join(self.rendered)
+        return self._text
+
+    @property
+    def superscript(self):
+        """The terms with their powers as superscripts, e.g. "m_P² s_P⁻¹"."""
+        if self._superscript is None:
+            self._superscript = " ".join(
+                f"{symbol}{str(power).translate(SUPERSCRIPTS)}" if power != 1 else f"{symbol}"
+                for symbol, power in self.terms)
+        return self._superscript
+
+    def swapped(self, swap_with):
+        """Returns the vector with each symbol renamed through swap_with, a dictionary; other symbols are kept."""
+        return UnitVector.of((swap_with.get(symbol, symbol), power) for symbol, power in self.terms)
+
+
+def _parse_rendered(text):
+    symbol, caret, power = text.rpartition("^")
+    if not caret:
+        return text, 1
+    try:
+        return symbol, int(power)
+    except ValueError:
+        return symbol, float(power)
+
+
+# tuple of rendered strings -> UnitVector, for units that only come as strings; weak like _interned
+_parsed = weakref.WeakValueDictionary()
+
+
+def as_unit_vector(units):
+    """
+    Returns units as a UnitVector: a UnitVector as it is, a units list of
+    (symbol, power) pairs interned, and rendered strings like ["m_P^2", "s_P^-1"],
+    as rescale_value_by_units returns them, parsed once per distinct list.
+    """
+    if units.__class__ is UnitVector:
+        return units
+    units = tuple(units)
+    if not units or not isinstance(units[0], str):
+        return UnitVector.of(units)
+    vector = _parsed.get(units)
+    if vector is None:
+        vector = _parsed.setdefault(units, UnitVector.of(_parse_rendered(text) for text in units))
+    return vector
+
+
+def intern_units(data):
+    """
+    Returns a copy of a dataset with every "units" list replaced by its interned UnitVector.
+
+    The dictionaries and lists are copied, the values in them are shared. The dataset
+    itself is left as it is, since load_dataset can hand the same one to other callers.
+
+    Parameters:
+        data: A dataset dictionary such as grouped_constants or periodic_table, or a list
+              such as composite_units. Nested dictionaries and lists are walked.
+
+    Returns:
+        The interned copy.
+    """
+    if isinstance(data, dict):
+        copy = {key: intern_units(value) if isinstance(value, (dict, list)) else value
+                for key, value in data.items()}
+        if isinstance(copy.get("units"), (list, tuple)):
+            copy["units"] = UnitVector.of(copy["units"])
+        return copy
+    return [intern_units(item) if isinstance(item, (dict, list)) else item for item in data]
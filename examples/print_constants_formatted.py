@@ -10,7 +10,7 @@
 
 
 # Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
-from load_mods import load_module
+from load_mods import load_module, load_dataset
 
 # -----------------------------------------------------------------------
 # STEP 1: Define the unit system to use
@@ -57,7 +57,11 @@ scaling_module_name = f"{scaling_choice}_scaling"
 # -----------------------------------------------------------------------
 
 # Load the constants dataset
-constants = load_module("../data_sets/constants.py", "constants") 
+constants = load_dataset("../data_sets/constants.py", "constants") 
+
+# Share one interned UnitVector between every constant with the same units
+unit_vector = load_module("./modular/unit_vector.py", "unit_vector")
+constants.grouped_constants = unit_vector.intern_units(constants.grouped_constants)
 
 # Load the scaling module for the chosen unit system
 scaling = load_module(scaling_module_path, scaling_module_name)
@@ -82,11 +86,14 @@ rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
 # This programs purpose is to generate output in various formats for use in other programs.
 # -----------------------------------------------------------------------
 
-process = load_module("./modular/print_outputs.py", "print_output")
+# Compile the scaling factors once so each constant is rescaled with a dictionary lookup
+rescale_plan = rescale_units.compile_rescale_plan(unit_scaling)
+
+process = load_module("./modular/print_outputs.py", "print_outputs")
 process.print_outputs(
          constants.grouped_constants,
          unit_scaling,
-         rescale_units.rescale_value_by_units)
+         rescale_plan)
 
 #
 # -----------------------------------------------------------------------
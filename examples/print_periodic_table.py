@@ -7,7 +7,7 @@
 # to explore rescaled unit systems such as SI, Imperial, Natural Units, and others.
 
 # Dynamically loads reusable modules from specified file paths to keep the program modular and extensible.
-from load_mods import load_module
+from load_mods import load_module, load_dataset
 
 # -----------------------------------------------------------------------
 # STEP 1: Define the unit system to use
@@ -50,10 +50,14 @@ scaling_module_name = f"{scaling_choice}_scaling"
 # -----------------------------------------------------------------------
 
 # Load the constants dataset
-constants = load_module("../data_sets/constants.py", "constants") 
+constants = load_dataset("../data_sets/constants.py", "constants") 
 
 # Load the periodic table dataset
-periodic_table = load_module("../data_sets/periodic_table.py", "periodic_table") 
+periodic_table = load_dataset("../data_sets/periodic_table.py", "periodic_table") 
+
+# Share one interned UnitVector between every property with the same units
+unit_vector = load_module("./modular/unit_vector.py", "unit_vector")
+periodic_table.periodic_table = unit_vector.intern_units(periodic_table.periodic_table)
 
 # -----------------------------------------------------------------------
 # STEP 4: Load the scaling module and calculate scaling factors
@@ -84,11 +88,14 @@ rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
 # This process showcases how unit systems transform atomic and physical properties of elements.
 # -----------------------------------------------------------------------
 
+# Compile the scaling factors once so each constant is rescaled with a dictionary lookup
+rescale_plan = rescale_units.compile_rescale_plan(unit_scaling)
+
 process = load_module("./modular/print_periodic_table.py", "print_periodic_table")
 process.print_periodic_table(
          periodic_table.periodic_table,
          unit_scaling,
-         rescale_units.rescale_value_by_units)
+         rescale_plan)
 
 # -----------------------------------------------------------------------
 # STEP 7: Print the scaling factors used
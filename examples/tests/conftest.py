@@ -0,0 +1,14 @@
+"""
+Shared setup of the example tests.
+
+The examples load their modules and datasets by paths relative to examples/,
+so the tests import load_mods from there and run from there.
+"""
+
+import os
+import sys
+
+EXAMPLES = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, EXAMPLES)
+os.chdir(EXAMPLES)
@@ -0,0 +1,48 @@
+"""
+Checks that batch rescaling agrees with rescaling one constant at a time.
+
+Run from examples/ with: python -m pytest tests
+"""
+
+import math
+
+import numpy as np
+
+from load_mods import load_dataset, load_module
+
+rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
+batch_rescale = load_module("./modular/batch_rescale.py", "batch_rescale")
+unit_system_registry = load_module("./modular/unit_system_registry.py", "unit_system_registry")
+
+
+def test_rescale_table_matches_each_constant_in_each_system(capsys):
+    constants = load_dataset("../data_sets/constants.py", "constants")
+    periodic_table = load_dataset("../data_sets/periodic_table.py", "periodic_table")
+    entries = (batch_rescale.constant_entries(constants.grouped_constants)
+               + batch_rescale.periodic_table_entries(periodic_table.periodic_table))
+    systems = unit_system_registry.UnitSystemRegistry().all_factors(constants)
+    capsys.readouterr()
+
+    table = batch_rescale.build_exponent_table(entries)
+    names, rescaled = batch_rescale.rescale_table(table, systems)
+    assert names == list(systems) and rescaled.shape == (len(entries), len(systems))
+
+    for row, (key, data) in enumerate(entries):
+        for col, name in enumerate(names):
+            if data.get("value") is None:
+                assert math.isnan(rescaled[row, col])
+                continue
+            # the batch works in log space, so it agrees with the log backend to rounding
+            expected, _ = rescale_units.rescale_value_by_units(data, systems[name], backend="log")
+            assert rescaled[row, col] == expected or math.isclose(rescaled[row, col], expected, rel_tol=1e-12), (key, name)
+
+
+def test_repeated_symbols_multiply_and_zero_factors_give_infinity():
+    entries = [(("g", "twice"), {"value": 8.0, "units": [("m", 1), ("m", 2)]}),
+               (("g", "mass"), {"value": 1.0, "units": [("kg", 1)]}),
+               (("g", "none"), {"value": 0.0, "units": [("kg", 1)]})]
+    systems = {"test": [{"symbol": "m", "factor": 2.0, "swap_with": "m2"},
+                        {"symbol": "kg", "factor": 0, "swap_with": "kg0"}]}
+    names, rescaled = batch_rescale.rescale_table(batch_rescale.build_exponent_table(entries), systems)
+    np.testing.assert_allclose(rescaled[0], [1.0])
+    assert rescaled[1, 0] == math.inf and rescaled[2, 0] == 0.0
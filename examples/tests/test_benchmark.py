@@ -0,0 +1,26 @@
+"""
+Checks that the benchmarks leave the modules they time as they found them.
+
+Run from examples/ with: python -m pytest tests
+"""
+
+import load_mods
+from load_mods import load_dataset, load_module
+
+benchmark = load_module("./modular/benchmark.py", "benchmark")
+unit_system_registry = load_module("./modular/unit_system_registry.py", "unit_system_registry")
+
+
+def test_timing_modules_from_source_does_not_replace_the_cached_ones():
+    constants = load_dataset("../data_sets/constants.py", "constants")
+    registry = unit_system_registry.UnitSystemRegistry()
+    benchmarks = benchmark.core_benchmarks(constants.grouped_constants, None, registry, systems=["si"])
+    module = registry.module("si")
+    cache = dict(load_mods._module_cache)
+
+    source = next(entry for entry in benchmarks if entry.name == "load_module/source")
+    fresh = source.function()[0]
+
+    assert fresh is not module
+    assert registry.module("si") is module
+    assert load_mods._module_cache == cache
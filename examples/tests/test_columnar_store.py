@@ -0,0 +1,60 @@
+"""
+Checks of the memory mapped columnar store.
+
+Run from examples/ with: python -m pytest tests
+"""
+
+import numpy as np
+import pytest
+
+from load_mods import load_module
+
+columnar_store = load_module("./modular/columnar_store.py", "columnar_store")
+
+ENTRIES = [
+    (("Group", "speed"), {"symbol": "c", "value": 299792458.0, "units": [("m", 1), ("s", -1)], "comment": "exact"}),
+    (("Group", "unknown"), {"symbol": "x", "value": None, "units": [("kg", 2)], "comment": "no value"}),
+]
+
+
+def test_round_trip_through_a_store(tmp_path):
+    path = str(tmp_path / "entries.columns")
+    assert columnar_store.write_columnar_store(path, ENTRIES, "v1") == 2
+    with columnar_store.open_columnar_store(path, "v1") as store:
+        assert store.labels == ["c", "x"]
+        assert store.entry(("Group", "speed")) == {"symbol": "c", "value": 299792458.0, "comment": "exact",
+                                                  "units": [("m", 1.0), ("s", -1.0)]}
+        assert store.entry(("Group", "unknown"))["value"] is None
+        assert np.isnan(store.values[1])
+    assert store.closed and store.values is None
+
+
+def test_stale_store_is_rejected(tmp_path):
+    path = str(tmp_path / "entries.columns")
+    columnar_store.write_columnar_store(path, ENTRIES, "v1")
+    with pytest.raises(ValueError):
+        columnar_store.open_columnar_store(path, "v2")
+
+
+def test_closed_store_can_be_rewritten_and_reopened(tmp_path):
+    path = str(tmp_path / "entries.columns")
+    columnar_store.write_columnar_store(path, ENTRIES, "v1")
+    store = columnar_store.open_columnar_store(path)
+    store.close()
+    store.close()   # closing twice is harmless
+    columnar_store.write_columnar_store(path, ENTRIES[:1], "v2")
+    with columnar_store.open_columnar_store(path, "v2") as store:
+        assert len(store) == 1
+
+
+def test_close_refuses_while_arrays_are_in_use(tmp_path):
+    path = str(tmp_path / "entries.columns")
+    columnar_store.write_columnar_store(path, ENTRIES, "v1")
+    store = columnar_store.open_columnar_store(path)
+    values = store.values
+    with pytest.raises(BufferError):
+        store.close()
+    assert not store.closed and store.values[0] == values[0]
+    del values
+    store.close()
+    assert store.closed
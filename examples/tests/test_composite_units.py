@@ -0,0 +1,51 @@
+"""
+Checks of the composite unit resolver's ordering and problem reports.
+
+Run from examples/ with: python -m pytest tests
+"""
+
+from load_mods import load_module
+
+composite_units = load_module("./modular/composite_units.py", "composite_units")
+
+
+def _unit(symbol, *units):
+    return {"symbol": symbol, "units": [(unit, 1) for unit in units]}
+
+
+def _symbols(ordered):
+    return [unit_definition["symbol"] for unit_definition in ordered]
+
+
+def test_composites_come_after_what_they_are_built_from():
+    definitions = [_unit("J", "N", "m"), _unit("W", "J", "s"), _unit("N", "kg", "m", "s"), _unit("Hz", "s")]
+    ordered, problems = composite_units.resolve_composite_order(definitions, {"kg", "m", "s"})
+    assert problems == []
+    assert _symbols(ordered) == ["N", "Hz", "J", "W"]
+
+
+def test_known_and_repeated_symbols_are_skipped():
+    definitions = [_unit("m", "s"), _unit("N", "kg"), _unit("N", "s")]
+    ordered, problems = composite_units.resolve_composite_order(definitions, {"kg", "m", "s"})
+    assert ordered == [definitions[1]] and problems == []
+
+
+def test_cycles_missing_units_and_what_they_block_are_reported():
+    definitions = [_unit("A", "B"), _unit("B", "A"), _unit("C", "A"), _unit("D", "X"), _unit("E", "s")]
+    ordered, problems = composite_units.resolve_composite_order(definitions, {"s"})
+    assert _symbols(ordered) == ["E"]
+    assert problems == [
+        "D has dependency issue in units: [('X', 1)] (unknown: X)",
+        "dependency cycle: A -> B -> A",
+        "C depends on unresolved units: A",
+    ]
+
+
+def test_rescale_composite_units_reports_on_stderr_and_scales_the_rest(capsys):
+    base = [{"symbol": "m", "factor": 2.0, "swap_with": "m_x"}, {"symbol": "s", "factor": 4.0, "swap_with": "s_x"}]
+    definitions = [{"symbol": "v", "units": [("m", 1), ("s", -1)]}, _unit("L", "L")]
+    scaling = composite_units.rescale_composite_units(base, "_x", definitions)
+    assert scaling[2] == {"symbol": "v", "factor": 0.5, "swap_with": "v_x"}
+    assert len(scaling) == 3
+    captured = capsys.readouterr()
+    assert captured.out == "" and "dependency cycle: L -> L" in captured.err
@@ -0,0 +1,61 @@
+"""
+Checks that the conversion tensor agrees with rescaling through SI.
+
+Run from examples/ with: python -m pytest tests
+"""
+
+import math
+import sys
+
+import numpy as np
+
+from load_mods import load_dataset, load_module
+
+rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
+batch_rescale = load_module("./modular/batch_rescale.py", "batch_rescale")
+conversion_tensor = load_module("./modular/conversion_tensor.py", "conversion_tensor")
+unit_system_registry = load_module("./modular/unit_system_registry.py", "unit_system_registry")
+
+SYSTEMS = ["si", "imperial", "natural", "planck_h", "galactic"]
+
+
+def _setup(capsys):
+    constants = load_dataset("../data_sets/constants.py", "constants")
+    systems = unit_system_registry.UnitSystemRegistry().all_factors(constants, SYSTEMS)
+    capsys.readouterr()
+    return batch_rescale.constant_entries(constants.grouped_constants), systems
+
+
+def test_converting_between_systems_matches_rescaling_from_si(capsys):
+    entries, systems = _setup(capsys)
+    tensor = conversion_tensor.build_conversion_tensor(systems)
+    for key, data in entries:
+        for source in SYSTEMS:
+            value, _ = rescale_units.rescale_value_by_units(data, systems[source], backend="log")
+            if not sys.float_info.min <= abs(value) <= sys.float_info.max:
+                continue  # the value itself is out of range in this system, nothing can recover it
+            for target in SYSTEMS:
+                expected, units = rescale_units.rescale_unit_vector(data, systems[target], backend="log")
+                converted, converted_units = tensor.convert(value, data["units"], source, target)
+                assert converted_units == units
+                assert math.isclose(converted, expected, rel_tol=1e-9), (key, source, target)
+
+
+def test_convert_table_matches_convert_row_by_row(capsys):
+    entries, systems = _setup(capsys)
+    tensor = conversion_tensor.build_conversion_tensor(systems)
+    table = batch_rescale.build_exponent_table(entries)
+    converted = tensor.convert_table(table, "si", "planck_h")
+    expected = [tensor.convert(data["value"], data["units"], "si", "planck_h")[0] for key, data in entries]
+    np.testing.assert_allclose(converted, expected, rtol=1e-12)
+
+
+def test_values_survive_ratios_outside_the_float_range():
+    systems = {"small": [{"symbol": "m", "factor": 1e-100, "swap_with": "m_s"}],
+               "large": [{"symbol": "m", "factor": 1e100, "swap_with": "m_l"}]}
+    tensor = conversion_tensor.build_conversion_tensor(systems)
+    units = [("m", 2)]   # a ratio of 1e400 between the two systems, but a result of 1e100
+    converted, _ = tensor.convert(-1e-300, units, "large", "small")
+    assert math.isclose(converted, -1e100, rel_tol=1e-9)
+    np.testing.assert_allclose(tensor.convert_array([1e-300, 0.0, 2e-300], units, "large", "small"),
+                               [1e100, 0.0, 2e100], rtol=1e-9)
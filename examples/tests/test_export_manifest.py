@@ -0,0 +1,58 @@
+"""
+Checks that incremental exports write what a --full export writes, and only what changed.
+
+Run from examples/ with: python -m pytest tests
+"""
+
+import os
+
+import export_all_systems
+
+SYSTEMS = ["si", "planck_h"]
+FORMATS = ["text", "c"]
+
+
+def _export(output_dir, full=False):
+    results = export_all_systems.export_all(SYSTEMS, FORMATS, str(output_dir), workers=1, full=full)
+    return {(system, output_format): recomputed for system, output_format, path, seconds, recomputed in results}
+
+
+def _files(output_dir):
+    return {name: (output_dir / name).read_text(encoding="utf-8")
+            for name in sorted(os.listdir(output_dir)) if name != "manifest.json"}
+
+
+def test_a_second_export_writes_nothing_and_full_writes_everything_again(tmp_path):
+    first = _export(tmp_path)
+    assert all(recomputed for recomputed in first.values())
+    files = _files(tmp_path)
+    assert len(files) == len(SYSTEMS) * len(FORMATS)
+
+    assert set(_export(tmp_path).values()) == {None}
+    assert _files(tmp_path) == files
+
+    assert _export(tmp_path, full=True) == first
+    assert _files(tmp_path) == files
+
+
+def test_only_edited_entries_are_rescaled_and_the_file_matches_a_full_export(tmp_path):
+    _export(tmp_path)
+    full = _files(tmp_path)
+    path = export_all_systems.export_path(str(tmp_path), "si", "text")
+    manifest = export_all_systems.export_manifest.load_manifest(str(tmp_path))
+    previous = manifest["systems"]["si"]
+
+    # As if one constant had been edited since: its old row is gone and its hash is new
+    group, name, digest = previous["entries"][3]
+    previous["rows"].pop(digest)
+    previous["entries"][3] = [group, name, "edited"]
+
+    system, output_format, written, seconds, recomputed, record = export_all_systems.export_task(
+        "si", "text", str(tmp_path), previous=previous)
+    assert written == path and recomputed == 1
+    assert _files(tmp_path) == full
+
+    # A deleted file is written again, from the cached rows alone
+    os.remove(path)
+    recomputed = export_all_systems.export_task("si", "text", str(tmp_path), previous=record)[4]
+    assert recomputed == 0 and _files(tmp_path) == full
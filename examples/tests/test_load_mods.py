@@ -0,0 +1,83 @@
+"""
+Checks of load_mods: the module cache and dataset snapshots.
+
+Run from examples/ with: python -m pytest tests
+"""
+
+import os
+
+import load_mods
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_modules_are_cached_per_file_and_name(tmp_path):
+    source = _write(tmp_path / "cached.py", "loads = []\n")
+    module = load_mods.load_module(source, "cached")
+    assert load_mods.load_module(source, "cached") is module
+    assert load_mods.load_module(source, "other_name") is not module
+    assert load_mods.load_module(source, "cached", reload=True) is not module
+
+
+def test_edited_modules_are_executed_again(tmp_path):
+    source = _write(tmp_path / "edited.py", "x = 1\n")
+    module = load_mods.load_module(source, "edited")
+    stat = os.stat(source)
+
+    # touched but unchanged: the contents are hashed and the cached module kept
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert load_mods.load_module(source, "edited") is module
+
+    # same size, new contents
+    _write(tmp_path / "edited.py", "x = 2\n")
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    edited = load_mods.load_module(source, "edited")
+    assert edited is not module and edited.x == 2
+
+
+def test_stale_snapshot_falls_back_to_the_source(tmp_path):
+    source = _write(tmp_path / "numbers.py", "numbers = {'one': 1}\n")
+    assert load_mods.load_dataset(source).numbers == {"one": 1}
+    assert os.path.exists(load_mods.snapshot_path(source))
+
+    _write(tmp_path / "numbers.py", "numbers = {'one': 1, 'two': 2}\n")
+    dataset = load_mods.load_dataset(source)
+    assert dataset.numbers == {"one": 1, "two": 2}
+    assert dataset.source_sha256 == load_mods.source_sha256(source)
+
+
+def test_current_snapshot_does_not_rehash_the_source(tmp_path, monkeypatch):
+    source = _write(tmp_path / "hashed.py", "values = [1, 2, 3]\n")
+    load_mods.load_dataset(source)
+
+    def fail(path):
+        raise AssertionError(f"{path} hashed again")
+    monkeypatch.setattr(load_mods, "_source_digest", fail)
+    assert load_mods.load_dataset(source).values == [1, 2, 3]
+
+
+def test_unwritable_snapshot_keeps_working_from_the_source(tmp_path):
+    source = _write(tmp_path / "readonly.py", "table = {'a': [1.5]}\n")
+    os.mkdir(load_mods.snapshot_path(source))   # a snapshot can never be written here
+    assert load_mods.load_dataset(source).table == {"a": [1.5]}
+    assert load_mods.load_dataset(source).table == {"a": [1.5]}
+    assert sorted(os.listdir(tmp_path)) == ["readonly.py", "readonly.snapshot"]
+
+
+def test_datasets_that_are_not_plain_data_still_load(tmp_path):
+    source = _write(tmp_path / "computed.py", "def scale(x):\n    return 2 * x\n\nfactor = scale(3)\n")
+    dataset = load_mods.load_dataset(source)
+    assert dataset.factor == 6 and dataset.scale(2) == 4
+    assert not os.path.exists(load_mods.snapshot_path(source))
+
+
+def test_every_load_is_a_fresh_copy(tmp_path):
+    source = _write(tmp_path / "copied.py", "groups = {'g': {'x': 1}}\n")
+    from_source = load_mods.load_dataset(source)
+    from_snapshot = load_mods.load_dataset(source)
+    from_source.groups["g"]["x"] = 2
+    from_snapshot.groups["g"]["y"] = 3
+    assert load_mods.load_dataset(source).groups == {"g": {"x": 1}}
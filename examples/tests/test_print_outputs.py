@@ -0,0 +1,110 @@
+"""
+Checks of the output writers: their output parses and carries the rescaled values,
+whatever the buffer size, and writers must define their rows.
+
+Run from examples/ with: python -m pytest tests
+"""
+
+import io
+import json
+import math
+import subprocess
+import sys
+import xml.etree.ElementTree as ElementTree
+
+import pytest
+
+from load_mods import load_dataset, load_module
+
+print_outputs = load_module("./modular/print_outputs.py", "print_outputs")
+rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
+unit_system_registry = load_module("./modular/unit_system_registry.py", "unit_system_registry")
+
+
+def _print_constants(output_format):
+    result = subprocess.run([sys.executable, "print_constants_formatted.py", f"--format={output_format}", "--structured"],
+                            capture_output=True, text=True, encoding="utf-8", check=True)
+    return result.stdout, result.stderr
+
+
+def test_structured_json_stdout_parses():
+    stdout, stderr = _print_constants("json")
+    document = json.loads(stdout)
+    assert document["scaling_factors"] and document["constants"]
+    assert all(set(record) == {"symbol", "name", "group", "value", "units"} for record in document["constants"])
+    # the composite unit problems of the shipped dataset are reported on stderr
+    assert "dependency cycle" in stderr
+
+
+def test_ndjson_stdout_is_one_object_per_line():
+    stdout, _ = _print_constants("ndjson")
+    records = [json.loads(line) for line in stdout.splitlines()]
+    assert records and all("symbol" in record for record in records)
+
+
+def test_structured_xml_stdout_parses():
+    stdout, _ = _print_constants("xml")
+    root = ElementTree.fromstring(stdout)
+    assert root.tag == "constants"
+    assert root.find("scaling_factors") is not None and root.findall("constant")
+
+
+def test_writers_without_a_row_or_record_can_not_be_instantiated():
+    class NoRow(print_outputs.OutputWriter):
+        pass
+
+    class NoRecord(print_outputs.StructuredWriter):
+        pass
+
+    for incomplete in (print_outputs.OutputWriter, NoRow, print_outputs.StructuredWriter, NoRecord):
+        with pytest.raises(TypeError):
+            incomplete()
+
+
+def _write(factors, writers):
+    constants = load_dataset("../data_sets/constants.py", "constants")
+    print_outputs.write_outputs(constants.grouped_constants, factors, rescale_units.compile_rescale_plan(factors), writers)
+    return constants.grouped_constants
+
+
+def _factors(capsys):
+    constants = load_dataset("../data_sets/constants.py", "constants")
+    factors = unit_system_registry.UnitSystemRegistry().factors("planck_h", constants)
+    capsys.readouterr()
+    return factors
+
+
+def test_every_format_is_the_same_through_any_buffer_and_alongside_other_writers(capsys):
+    factors = _factors(capsys)
+    for output_format in print_outputs.WRITERS:
+        alone, unbuffered = io.StringIO(), io.StringIO()
+        _write(factors, [print_outputs.get_writer(output_format, alone, "_x")])
+        _write(factors, [print_outputs.get_writer(output_format, unbuffered, "_x", buffer_size=1)])
+        assert unbuffered.getvalue() == alone.getvalue()
+
+    sinks = {output_format: io.StringIO() for output_format in print_outputs.WRITERS}
+    _write(factors, [print_outputs.get_writer(output_format, sink) for output_format, sink in sinks.items()])
+    for output_format, sink in sinks.items():
+        alone = io.StringIO()
+        _write(factors, [print_outputs.get_writer(output_format, alone)])
+        assert sink.getvalue() == alone.getvalue(), output_format
+
+
+def test_text_and_structured_rows_carry_the_rescaled_values(capsys):
+    factors = _factors(capsys)
+    plan = rescale_units.compile_rescale_plan(factors)
+    text, structured = io.StringIO(), io.StringIO()
+    grouped_constants = _write(factors, [print_outputs.get_writer("text", text, "_x"),
+                                         print_outputs.get_writer("json", structured, "_x", structured=True)])
+
+    expected = [(data["symbol"] + "_x", name, group_name) + plan.rescale(data)
+                for group_name, group_data in grouped_constants.items()
+                for name, data in group_data.items() if isinstance(data, dict)]
+
+    lines = text.getvalue().splitlines()
+    records = json.loads(structured.getvalue())["constants"]
+    assert len(lines) == len(records) == len(expected)
+    for line, record, (symbol, name, group_name, value, units) in zip(lines, records, expected):
+        assert line == f"{symbol} {value} {' '.join(units)}"
+        assert record == {"symbol": symbol, "name": name, "group": group_name,
+                          "value": value if math.isfinite(value) else None, "units": units}
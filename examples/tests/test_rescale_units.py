@@ -0,0 +1,97 @@
+"""
+Checks that compiled rescale plans give what rescale_value_by_units gives, in every backend.
+
+Run from examples/ with: python -m pytest tests
+"""
+
+import math
+
+import pytest
+
+from load_mods import load_dataset, load_module
+
+rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
+batch_rescale = load_module("./modular/batch_rescale.py", "batch_rescale")
+unit_system_registry = load_module("./modular/unit_system_registry.py", "unit_system_registry")
+
+constants = load_dataset("../data_sets/constants.py", "constants")
+periodic_table = load_dataset("../data_sets/periodic_table.py", "periodic_table")
+registry = unit_system_registry.UnitSystemRegistry()
+
+
+def _entries():
+    entries = [data for key, data in batch_rescale.constant_entries(constants.grouped_constants)]
+    return entries + [data for key, data in batch_rescale.periodic_table_entries(periodic_table.periodic_table)
+                      if data.get("value") is not None]
+
+
+def _same(a, b):
+    return a == b or (isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b))
+
+
+@pytest.mark.parametrize("system", registry.names())
+def test_plan_matches_rescale_value_by_units_for_every_entry(system, capsys):
+    factors = registry.factors(system, constants)
+    plan = rescale_units.compile_rescale_plan(factors)
+    for data in _entries():
+        value, units = rescale_units.rescale_value_by_units(data, factors)
+        plan_value, plan_units = plan.rescale(data)
+        assert _same(plan_value, value) and plan_units == units
+        # a second call is served from the compiled units
+        assert plan(data, factors) == (plan_value, plan_units)
+    capsys.readouterr()
+
+
+def test_first_mode_wins_and_added_modes_reach_compiled_units():
+    modes = [{"symbol": "m", "factor": 2.0, "swap_with": "m2"},
+             {"symbol": "m", "factor": 3.0, "swap_with": "m3"}]
+    data = {"value": 12.0, "units": [("m", 1), ("s", -1)]}
+    plan = rescale_units.compile_rescale_plan(modes)
+    assert plan.rescale(data) == rescale_units.rescale_value_by_units(data, modes) == (6.0, ["m2", "s^-1"])
+
+    # s was compiled unscaled, so adding it must not leave the cached units stale
+    plan.add_mode("s", 4.0, "s4")
+    modes.append({"symbol": "s", "factor": 4.0, "swap_with": "s4"})
+    assert plan.rescale(data) == rescale_units.rescale_value_by_units(data, modes) == (24.0, ["m2", "s4^-1"])
+
+
+def test_zero_factors_warn_and_give_infinity_on_both_paths(capsys):
+    modes = [{"symbol": "kg", "factor": 0, "swap_with": "kg0"}]
+    data = {"value": 1.0, "units": [("kg", 1)]}
+    assert rescale_units.compile_rescale_plan(modes).rescale(data) == (math.inf, ["kg0"])
+    assert rescale_units.rescale_value_by_units(data, modes) == (math.inf, ["kg0"])
+    assert capsys.readouterr().err.count("Rescale factor for kg is zero") == 2
+
+
+@pytest.mark.parametrize("backend", ["log", "mantissa"])
+def test_log_backends_agree_with_float_and_between_plan_and_function(backend, capsys):
+    for system in ("si", "planck_h", "galactic"):
+        factors = registry.factors(system, constants)
+        plan = rescale_units.compile_rescale_plan(factors)
+        for data in _entries():
+            result = rescale_units.rescale_value_by_units(data, factors, backend)
+            assert plan.rescale(data, backend) == result
+            value, _ = rescale_units.rescale_value_by_units(data, factors)
+            if value == 0 or not math.isfinite(value):
+                continue
+            if backend == "mantissa":
+                mantissa, exponent = result[0]
+                assert 1 <= abs(mantissa) < 10
+                result = (mantissa * 10.0 ** exponent, result[1])
+            assert math.isclose(result[0], value, rel_tol=1e-9)
+    capsys.readouterr()
+
+
+def test_log_backends_keep_values_whose_factors_leave_the_float_range():
+    modes = [{"symbol": "m", "factor": 1e200, "swap_with": "m_x"},
+             {"symbol": "s", "factor": 1e200, "swap_with": "s_x"}]
+    balanced = {"value": 3.0, "units": [("m", 2), ("s", -2)]}
+    assert math.isclose(rescale_units.rescale_value_by_units(balanced, modes, "log")[0], 3.0, rel_tol=1e-12)
+
+    huge = {"value": 2.0, "units": [("m", -3)]}
+    assert rescale_units.rescale_value_by_units(huge, modes, "log")[0] == math.inf
+    mantissa, exponent = rescale_units.rescale_value_by_units(huge, modes, "mantissa")[0]
+    assert math.isclose(mantissa, 2.0, rel_tol=1e-12) and exponent == 600
+
+    with pytest.raises(ValueError):
+        rescale_units.rescale_value_by_units(huge, modes, "decimal")
@@ -0,0 +1,38 @@
+"""
+Checks of the unit system registry's dataset versions and base factors.
+
+Run from examples/ with: python -m pytest tests
+"""
+
+from load_mods import load_dataset, load_module
+
+unit_system_registry = load_module("./modular/unit_system_registry.py", "unit_system_registry")
+composite_units = load_module("./modular/composite_units.py", "composite_units")
+
+
+def test_loaded_datasets_are_versioned_by_their_source_hash():
+    constants = load_dataset("../data_sets/constants.py", "constants")
+    assert unit_system_registry.dataset_version(constants) == constants.source_sha256
+
+
+def test_plain_dictionaries_are_hashed_once_and_not_pinned_forever():
+    first = {"group": {"c": {"value": 1.0}}}
+    version = unit_system_registry.dataset_version(first)
+    assert unit_system_registry.dataset_version(first) == version
+    assert unit_system_registry.dataset_version({"group": {"c": {"value": 2.0}}}) != version
+
+    for value in range(2 * unit_system_registry.DATASET_VERSION_CACHE_SIZE):
+        unit_system_registry.dataset_version({"group": {"c": {"value": float(value)}}})
+    cached = unit_system_registry._dataset_versions
+    assert len(cached) == unit_system_registry.DATASET_VERSION_CACHE_SIZE
+    assert all(entry[0] is not first for entry in cached.values())
+    assert unit_system_registry.dataset_version(first) == version
+
+
+def test_base_factors_are_what_calculate_scaling_factors_resolves(capsys):
+    constants = load_dataset("../data_sets/constants.py", "constants")
+    registry = unit_system_registry.UnitSystemRegistry()
+    for name in registry.names():
+        base, postpend = registry.base_factors(name, constants)
+        assert composite_units.rescale_composite_units(base, postpend) == registry.factors(name, constants)
+    capsys.readouterr()
@@ -0,0 +1,73 @@
+"""
+Checks of the interned UnitVector and of the units rescale_value_by_units returns.
+
+Run from examples/ with: python -m pytest tests
+"""
+
+import gc
+
+from load_mods import load_module
+
+unit_vector = load_module("./modular/unit_vector.py", "unit_vector")
+rescale_units = load_module("./modular/rescale_units.py", "rescale_units")
+UnitVector = unit_vector.UnitVector
+
+MODES = [
+    {"symbol": "m", "factor": 2.0, "swap_with": "m_P"},
+    {"symbol": "s", "factor": 4.0, "swap_with": "s_P"},
+]
+
+
+def test_equal_units_lists_intern_to_one_vector():
+    vector = UnitVector.of([("m", 1), ("s", -1)])
+    assert UnitVector.of((("m", 1), ("s", -1))) is vector
+    assert UnitVector.of(vector) is vector
+    # 2 and 2.0 render differently, so they are different vectors
+    assert UnitVector.of([("m", 2)]) is not UnitVector.of([("m", 2.0)])
+    assert hash(vector) == hash((("m", 1), ("s", -1)))
+
+
+def test_unused_vectors_are_evicted():
+    key = ((("evicted_unit", 3),), (int,))
+    vector = UnitVector.of([("evicted_unit", 3)])
+    assert UnitVector._interned[key] is vector
+    del vector
+    gc.collect()
+    assert key not in UnitVector._interned
+
+
+def test_swapped_renames_only_the_given_symbols():
+    vector = UnitVector.of([("m", 2), ("kg", 1), ("s", -1)])
+    swapped = vector.swapped({"m": "m_P", "s": "s_P"})
+    assert swapped is UnitVector.of([("m_P", 2), ("kg", 1), ("s_P", -1)])
+    assert swapped.text == "m_P^2 kg s_P^-1"
+    assert swapped.superscript == "m_P² kg s_P⁻¹"
+
+
+def test_vectors_compare_with_units_lists_and_rendered_strings():
+    vector = UnitVector.of([("m", 1), ("s", -1)])
+    assert vector == [("m", 1), ("s", -1)]
+    assert vector == ["m", "s^-1"]
+    assert vector != ["m", "s^-2"]
+    assert vector != "m s^-1"
+
+
+def test_rescale_value_by_units_returns_unit_strings():
+    data = {"value": 8.0, "units": [("m", 1), ("s", -1)]}
+    value, units = rescale_units.rescale_value_by_units(data, MODES)
+    assert (value, units) == (16.0, ["m_P", "s_P^-1"])
+    assert rescale_units.compile_rescale_plan(MODES)(data) == (value, units)
+
+    value, vector = rescale_units.rescale_unit_vector(data, MODES)
+    assert vector is UnitVector.of([("m_P", 1), ("s_P", -1)])
+    assert rescale_units.compile_rescale_plan(MODES).rescale_vector(data) == (value, vector)
+
+
+def test_unit_vector_rescaler_accepts_string_rescalers():
+    def rescale(constant_data, unit_scaling_modes):
+        return rescale_units.rescale_value_by_units(constant_data, unit_scaling_modes)
+
+    data = {"value": 1.0, "units": [("m", -0.5), ("s", 0)]}
+    value, vector = rescale_units.unit_vector_rescaler(rescale)(data, MODES)
+    assert vector is UnitVector.of([("m_P", -0.5), ("s_P", 0)])
+    assert value == rescale_units.rescale_value_by_units(data, MODES)[0]
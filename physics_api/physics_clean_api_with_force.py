@@ -11,423 +11,19 @@ Novel aspects:
 2. All "constants" derived from geometric ratios
 3. Forces emerge from discrete integer counts, not continuous charges/masses
 4. Geometry is first-class, allowing exploration of hypothetical interactions
-"""
-
-import math
-from typing import Dict, NamedTuple, List, Tuple
-
-# ============================================================================
-# LAYER 2: COORDINATE SYSTEM - Unit Systems & Particle Data
-# ============================================================================
-
-class UnitSystem(NamedTuple):
-    name: str
-    c: float
-    h: float
-    G: float
-    k_B: float
-    
-    @property
-    def m_planck(self) -> float:
-        return math.sqrt(self.h * self.c / self.G)
-    
-    @property
-    def E_planck(self) -> float:
-        return self.m_planck * self.c ** 2
-    
-    @property
-    def p_planck(self) -> float:
-        return self.m_planck * self.c
-    
-    @property
-    def l_planck(self) -> float:
-        return self.h / self.p_planck
-    
-    @property
-    def F_planck(self) -> float:
-        return self.E_planck / self.l_planck
-
-SI = UnitSystem("SI", 299792458.0, 6.62607015e-34, 6.67430e-11, 1.380649e-23)
-
-class ParticleData(NamedTuple):
-    rest_mass_natural: float
-    charge_state: int
-
-PARTICLE_ZOO: Dict[str, ParticleData] = {
-    "electron": ParticleData(9.1093837e-31 / SI.m_planck, -1),
-    "proton":   ParticleData(1.6726219e-27 / SI.m_planck, +1),
-    "neutron":  ParticleData(1.6749274e-27 / SI.m_planck,  0),
-}
-
-COMPOSITE_BODIES: Dict[str, ParticleData] = {
-    "earth": ParticleData(5.972e24 / SI.m_planck, 0),
-    "sun":   ParticleData(1.989e30 / SI.m_planck, 0)
-}
-
-# ============================================================================
-# LAYER 1: BUSINESS LOGIC - The Unified Physics
-# ============================================================================
-
-class Physics:
-    @staticmethod
-    def relativistic_energy(rest_mass_natural: float, momentum_natural: float) -> float:
-        """E² = m² + p² in natural units"""
-        return math.sqrt(rest_mass_natural**2 + momentum_natural**2)
-    
-    @staticmethod
-    def velocity_beta(energy_natural: float, momentum_natural: float) -> float:
-        """β = p/E (velocity as fraction of c)"""
-        if energy_natural == 0:
-            return 0.0
-        return momentum_natural / energy_natural
-    
-    @staticmethod
-    def calculate_force(count1: int, count2: int, geometry: float, r_nat: float) -> float:
-        """
-        THE SINGLE INVARIANT LAW
-        
-        Force = Intensity_1 × Intensity_2
-        Intensity = (Integer_Count × Geometry) / r
-        
-        This is the only interaction law in the universe.
-        """
-        if r_nat == 0:
-            return 0.0
-        
-        I1 = (float(count1) * geometry) / r_nat
-        I2 = (float(count2) * geometry) / r_nat
-        
-        return I1 * I2
-
-# ============================================================================
-# LAYER 3: PRESENTATION - Pure Data Objects
-# ============================================================================
 
-class QuantumObject:
-    """Pure data object - knows nothing about units"""
-    def __init__(self, momentum_natural: float):
-        self.momentum_natural = momentum_natural
-    
-    @property
-    def charge_state(self) -> int:
-        raise NotImplementedError
-    
-    def total_energy_natural(self) -> float:
-        raise NotImplementedError
-
-class Photon(QuantumObject):
-    @property
-    def charge_state(self) -> int:
-        return 0
-    
-    def total_energy_natural(self) -> float:
-        return self.momentum_natural
-    
-    def __repr__(self) -> str:
-        return f"<Photon p_nat={self.momentum_natural:.2e}>"
-
-class MassiveObject(QuantumObject):
-    def __init__(self, identity_key: str, momentum_natural: float, data_source: Dict):
-        super().__init__(momentum_natural)
-        self._key = identity_key
-        self._data_source = data_source
-    
-    @property
-    def name(self) -> str:
-        return self._key
-    
-    @property
-    def charge_state(self) -> int:
-        return self._data_source[self._key].charge_state
-    
-    @property
-    def rest_mass_natural(self) -> float:
-        return self._data_source[self._key].rest_mass_natural
-    
-    def total_energy_natural(self) -> float:
-        return Physics.relativistic_energy(self.rest_mass_natural, self.momentum_natural)
-    
-    def __repr__(self) -> str:
-        obj_type = "Particle" if self._data_source is PARTICLE_ZOO else "Body"
-        return f"<{obj_type} name='{self.name}' p_nat={self.momentum_natural:.2e}>"
-
-# ============================================================================
-# LAYER 3: PRESENTATION - Output Format
-# ============================================================================
+The API lives in the pucs_physics package, where each geometry is one of
+its pluggable force laws; this script validates and demonstrates it.
+"""
 
-class Quantity:
-    """Human-readable measurement result"""
-    def __init__(self, si_value: float, unit: str):
-        self.si_value = si_value
-        self.unit = unit
-    
-    def __str__(self) -> str:
-        return f"{self.si_value:.6e} {self.unit}"
-    
-    def __repr__(self) -> str:
-        return f"Quantity({self.si_value:.6e}, '{self.unit}')"
+import os
+import sys
 
-# ============================================================================
-# LAYER 3: THE UNIFIED API - Novel Geometric Framework
-# ============================================================================
+# The package lives next to this file; make it importable however this file is run
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-class PhysicsAPI:
-    """
-    The Presenter - converts dimensionless physics to human-readable SI.
-    
-    Novel features:
-    - Single unified force law with four geometric configurations
-    - Intensities superpose before interaction
-    - All coupling constants derived from geometry
-    - Discrete integer counts, not continuous parameters
-    """
-    
-    def __init__(self, unit_system: UnitSystem = SI, 
-                 particle_zoo: Dict = PARTICLE_ZOO, 
-                 composite_bodies: Dict = COMPOSITE_BODIES):
-        self.unit_system = unit_system
-        self.particle_zoo = particle_zoo
-        self.composite_bodies = composite_bodies
-        self.physics = Physics()
-        
-        # --- THE FOUR GEOMETRIES (Substrate Configurations) ---
-        # 1. Strong: Direct Gear Mesh
-        self.GEOM_STRONG = 1.0
-        
-        # 2. EM: The Lever Arm
-        # From: alpha = (EM_GEOM)² × 2π
-        # Therefore: EM_GEOM = sqrt(alpha / (2π))
-        alpha = 1 / 137.036
-        self.GEOM_EM = math.sqrt(alpha / (2 * math.pi))
-        
-        # 3. Weak: Torsion Spring
-        self.GEOM_WEAK = 1.0e-6
-        
-        # 4. Gravity: The Sparse Mesh (Nucleon Mass / Planck Mass)
-        m_nucleon_si = 1.6726e-27  # proton mass in kg
-        self.GEOM_GRAVITY = m_nucleon_si / self.unit_system.m_planck
-    
-    # ========================================================================
-    # Factory Methods
-    # ========================================================================
-    
-    def create_object(self, name: str, momentum_si: float = 0.0) -> QuantumObject:
-        """Create a pure data object"""
-        momentum_natural = momentum_si / self.unit_system.p_planck
-        
-        if name.lower() == "photon":
-            return Photon(momentum_natural)
-        elif name in self.particle_zoo:
-            return MassiveObject(name, momentum_natural, self.particle_zoo)
-        elif name in self.composite_bodies:
-            return MassiveObject(name, momentum_natural, self.composite_bodies)
-        else:
-            raise ValueError(f"Object '{name}' not found.")
-    
-    # ========================================================================
-    # Property Access Methods
-    # ========================================================================
-    
-    def get_total_energy(self, obj: QuantumObject) -> Quantity:
-        e_nat = obj.total_energy_natural()
-        return Quantity(e_nat * self.unit_system.E_planck, "J")
-    
-    def get_momentum(self, obj: QuantumObject) -> Quantity:
-        p_si = obj.momentum_natural * self.unit_system.p_planck
-        return Quantity(p_si, "kg·m/s")
-    
-    def get_velocity(self, obj: QuantumObject) -> Quantity:
-        e_nat = obj.total_energy_natural()
-        p_nat = obj.momentum_natural
-        beta = self.physics.velocity_beta(e_nat, p_nat)
-        return Quantity(beta * self.unit_system.c, "m/s")
-    
-    def get_rest_mass(self, obj: MassiveObject) -> Quantity:
-        if not isinstance(obj, MassiveObject):
-            raise TypeError("Only MassiveObjects have rest mass.")
-        m_si = obj.rest_mass_natural * self.unit_system.m_planck
-        return Quantity(m_si, "kg")
-    
-    # ========================================================================
-    # Helper Methods
-    # ========================================================================
-    
-    def _get_nucleon_count(self, obj: QuantumObject) -> int:
-        """Derive integer nucleon count from object's mass"""
-        if not isinstance(obj, MassiveObject):
-            return 0
-        # Count = Total_Mass / Nucleon_Mass
-        return int(round(obj.rest_mass_natural / self.GEOM_GRAVITY))
-    
-    # ========================================================================
-    # Standard Force Methods (Four Geometries, One Engine)
-    # ========================================================================
-    
-    def gravitational_force(self, obj1: QuantumObject, obj2: QuantumObject, 
-                           distance_si: float) -> Quantity:
-        """Gravity: sparse mesh geometry with nucleon counts"""
-        r_nat = distance_si / self.unit_system.l_planck
-        c1 = self._get_nucleon_count(obj1)
-        c2 = self._get_nucleon_count(obj2)
-        F_nat = self.physics.calculate_force(c1, c2, self.GEOM_GRAVITY, r_nat)
-        return Quantity(F_nat * self.unit_system.F_planck, "N")
-    
-    def coulomb_force(self, obj1: QuantumObject, obj2: QuantumObject, 
-                     distance_si: float) -> Quantity:
-        """EM: lever arm geometry with charge counts"""
-        r_nat = distance_si / self.unit_system.l_planck
-        
-        # Get signed integer charge counts (±1 for electron/proton, 0 for neutral)
-        c1 = obj1.charge_state
-        c2 = obj2.charge_state
-        
-        # Calculate force with signed counts
-        F_nat = self.physics.calculate_force(c1, c2, self.GEOM_EM, r_nat)
-        
-        # Flip sign: standard convention is attraction = positive
-        return Quantity(-F_nat * self.unit_system.F_planck, "N")
-    
-    def strong_force(self, obj1: QuantumObject, obj2: QuantumObject, 
-                    distance_si: float) -> Quantity:
-        """Strong: direct mesh geometry with baryon counts"""
-        r_nat = distance_si / self.unit_system.l_planck
-        c1 = self._get_nucleon_count(obj1)
-        c2 = self._get_nucleon_count(obj2)
-        F_nat = self.physics.calculate_force(c1, c2, self.GEOM_STRONG, r_nat)
-        return Quantity(F_nat * self.unit_system.F_planck, "N")
-    
-    def weak_force(self, obj1: QuantumObject, obj2: QuantumObject, 
-                  distance_si: float) -> Quantity:
-        """Weak: torsion spring geometry"""
-        r_nat = distance_si / self.unit_system.l_planck
-        c1 = 1
-        c2 = 1
-        F_nat = self.physics.calculate_force(c1, c2, self.GEOM_WEAK, r_nat)
-        return Quantity(F_nat * self.unit_system.F_planck, "N")
-    
-    # ========================================================================
-    # NOVEL METHODS - Geometric Framework Extensions
-    # ========================================================================
-    
-    def net_interaction(self, obj1: QuantumObject, obj2: QuantumObject, 
-                       distance_si: float) -> Quantity:
-        """
-        NOVEL: All interactions happen simultaneously.
-        Intensities superpose BEFORE multiplying.
-        
-        Standard: F_total = F_grav + F_em + ...
-        Novel: F_total = (I1_grav + I1_em + ...) × (I2_grav + I2_em + ...)
-        """
-        r_nat = distance_si / self.unit_system.l_planck
-        
-        # Get all counts
-        nucleon1 = self._get_nucleon_count(obj1)
-        nucleon2 = self._get_nucleon_count(obj2)
-        charge1 = obj1.charge_state
-        charge2 = obj2.charge_state
-        
-        # Calculate intensities for each geometry
-        I1_grav = (nucleon1 * self.GEOM_GRAVITY) / r_nat
-        I2_grav = (nucleon2 * self.GEOM_GRAVITY) / r_nat
-        
-        I1_em = (charge1 * self.GEOM_EM) / r_nat
-        I2_em = (charge2 * self.GEOM_EM) / r_nat
-        
-        # Total field intensity is the superposition
-        I1_total = I1_grav + I1_em
-        I2_total = I2_grav + I2_em
-        
-        # Multiply total intensities
-        F_nat = I1_total * I2_total
-        return Quantity(F_nat * self.unit_system.F_planck, "N")
-    
-    def interference_term(self, obj1: QuantumObject, obj2: QuantumObject, 
-                         distance_si: float) -> Quantity:
-        """
-        NOVEL: Cross-term when intensities add before multiplying.
-        
-        This is the difference between:
-        - Standard: F_grav + F_em (forces add)
-        - Novel: (I_grav + I_em)² (intensities add, then interact)
-        
-        The cross-term is: 2 × I1_grav × I2_em + 2 × I1_em × I2_grav
-        """
-        r_nat = distance_si / self.unit_system.l_planck
-        
-        nucleon1 = self._get_nucleon_count(obj1)
-        nucleon2 = self._get_nucleon_count(obj2)
-        charge1 = obj1.charge_state
-        charge2 = obj2.charge_state
-        
-        I1_grav = (nucleon1 * self.GEOM_GRAVITY) / r_nat
-        I2_grav = (nucleon2 * self.GEOM_GRAVITY) / r_nat
-        I1_em = (charge1 * self.GEOM_EM) / r_nat
-        I2_em = (charge2 * self.GEOM_EM) / r_nat
-        
-        # Standard: forces add separately
-        standard = (I1_grav * I2_grav) + (I1_em * I2_em)
-        
-        # Novel: intensities superpose, then interact
-        novel = (I1_grav + I1_em) * (I2_grav + I2_em)
-        
-        # Cross-term is the difference
-        cross_term = novel - standard
-        return Quantity(cross_term * self.unit_system.F_planck, "N")
-    
-    def compare_geometries(self) -> Dict[str, float]:
-        """Show the force hierarchy as pure geometric ratios"""
-        return {
-            "strong/em": self.GEOM_STRONG / self.GEOM_EM,
-            "em/weak": self.GEOM_EM / self.GEOM_WEAK,
-            "em/gravity": self.GEOM_EM / self.GEOM_GRAVITY,
-            "strong/gravity": self.GEOM_STRONG / self.GEOM_GRAVITY,
-            "strong_squared/gravity_squared": (self.GEOM_STRONG / self.GEOM_GRAVITY) ** 2
-        }
-    
-    def interaction_strength_by_count(self, geometry: float, count_range: range, 
-                                     distance_si: float) -> List[Tuple[int, float]]:
-        """
-        NOVEL: Show how force scales with discrete integer count.
-        
-        Standard framework treats mass/charge as continuous.
-        This shows force emerges from integer counts.
-        """
-        r_nat = distance_si / self.unit_system.l_planck
-        results = []
-        for count in count_range:
-            F_nat = self.physics.calculate_force(count, count, geometry, r_nat)
-            results.append((count, F_nat * self.unit_system.F_planck))
-        return results
-    
-    def hypothetical_force(self, geometry: float, obj1: QuantumObject, 
-                          obj2: QuantumObject, distance_si: float) -> Quantity:
-        """
-        NOVEL: Explore hypothetical 5th, 6th, ... interactions.
-        
-        What if the substrate had another geometric configuration?
-        Standard framework can't do this - you can't "make up" a coupling constant.
-        """
-        r_nat = distance_si / self.unit_system.l_planck
-        c1 = self._get_nucleon_count(obj1)
-        c2 = self._get_nucleon_count(obj2)
-        F_nat = self.physics.calculate_force(c1, c2, geometry, r_nat)
-        return Quantity(F_nat * self.unit_system.F_planck, "N")
-    
-    def fine_structure_from_geometry(self) -> Dict[str, float]:
-        """
-        NOVEL: Derive α from substrate geometry.
-        
-        Standard: α ≈ 1/137 is a measured fundamental constant.
-        Novel: α = (GEOM_EM)² × 2π is derived from lever arm geometry.
-        """
-        alpha_derived = (self.GEOM_EM ** 2) * 2 * math.pi
-        alpha_measured = 1 / 137.036
-        return {
-            "from_geometry": alpha_derived,
-            "measured": alpha_measured,
-            "error": abs(alpha_derived - alpha_measured),
-            "match": abs(alpha_derived - alpha_measured) / alpha_measured < 0.01
-        }
+from pucs_physics import (COMPOSITE_BODIES, PARTICLE_ZOO, SI, MassiveObject, ParticleData, 
+                          Photon, Physics, PhysicsAPI, Quantity, QuantumObject, UnitSystem)
 
 # ============================================================================
 # VALIDATION TESTS - Compare against standard framework
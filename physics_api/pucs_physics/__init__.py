@@ -0,0 +1,49 @@
+"""
+pucs_physics - One Physics API
+==============================
+
+The single, importable home of the physics API that used to be copied
+across physics_clean_api.py, physics_clean_api_with_force.py and
+"Physics API with Particles.py". Those scripts are now thin demos over
+this package.
+
+Layer 1: Business Logic (physics.py - natural ratios, the actual physics)
+Layer 2: Coordinate System (units.py - Jacobians, cached per unit system)
+Layer 3: Presentation (quantities.py, objects.py, api.py - SI for humans)
+
+Interactions are pluggable force laws (force_laws.py), looked up by name.
+Large populations of objects live as rows of a ParticleTable (particle_table.py).
+Whole particle systems are evaluated pairwise by the N-body engine (nbody.py),
+or with far cells aggregated by the Barnes-Hut tree code (tree.py), and
+stepped through time by the leapfrog of simulation.py.
+"""
+
+from .units import (DIMENSIONS, SI, UnitSystem, get_unit_system, jacobian, 
+                    jacobian_table)
+from .physics import Physics
+from .quantities import Quantity, QuantityArray
+from .objects import (COMPOSITE_BODIES, PARTICLE_ZOO, MassiveObject, ParticleData, 
+                      Photon, QuantumObject)
+from .force_laws import (ALPHA, CLASSICAL_FORCE_LAWS, FORCE_LAWS, GEOM_EM, GEOM_STRONG, 
+                         GEOM_WEAK, ForceLaw, IntensityLaw, InverseSquareLaw, 
+                         gravity_geometry)
+from .particle_table import MassiveParticleView, ParticleTable, PhotonView
+from .api import PhysicsAPI
+from .nbody import NBodyEngine
+from .tree import DEFAULT_THETA, MAX_THETA, BarnesHutEngine, Octree, check_theta, compare_with_exact, error_bound
+from .simulation import Simulation, SimulationState
+
+__all__ = [
+    "DIMENSIONS", "SI", "UnitSystem", "get_unit_system", "jacobian", "jacobian_table",
+    "Physics",
+    "Quantity", "QuantityArray",
+    "COMPOSITE_BODIES", "PARTICLE_ZOO", "MassiveObject", "ParticleData", "Photon", 
+    "QuantumObject",
+    "ALPHA", "CLASSICAL_FORCE_LAWS", "FORCE_LAWS", "GEOM_EM", "GEOM_STRONG", "GEOM_WEAK", 
+    "ForceLaw", "IntensityLaw", "InverseSquareLaw", "gravity_geometry",
+    "MassiveParticleView", "ParticleTable", "PhotonView",
+    "PhysicsAPI",
+    "NBodyEngine",
+    "DEFAULT_THETA", "MAX_THETA", "BarnesHutEngine", "Octree", "check_theta", "compare_with_exact", "error_bound",
+    "Simulation", "SimulationState",
+]
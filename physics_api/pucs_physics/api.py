@@ -0,0 +1,427 @@
+"""
+Public API - Clean interface hiding architectural complexity
+============================================================
+
+PhysicsAPI is the Presenter: the only class that knows about both the pure
+QuantumObjects and the UnitSystem. It converts SI inputs to natural
+coordinates, runs the physics, and returns Quantities that present the
+result in SI.
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .force_laws import (ALPHA, FORCE_LAWS, GEOM_EM, GEOM_STRONG, GEOM_WEAK, ForceLaw, 
+                         IntensityLaw, gravity_geometry, nucleon_count)
+from .nbody import DEFAULT_BLOCK_SIZE, NBodyEngine
+from .objects import COMPOSITE_BODIES, PARTICLE_ZOO, MassiveObject, Photon, QuantumObject
+from .particle_table import ParticleTable
+from .physics import Physics
+from .quantities import Quantity, QuantityArray, _natural
+from .tree import DEFAULT_LEAF_SIZE, BarnesHutEngine
+from .units import SI, UnitSystem
+
+
+class PhysicsAPI:
+    """
+    Public API for physics calculations.
+    Uses proper architectural separation:
+    - Business logic in natural coordinates
+    - Presentation layer handles unit conversion
+    - Interactions come from pluggable force laws, looked up by name
+    """
+    
+    def __init__(self, unit_system: UnitSystem = SI, 
+                 particle_zoo: Optional[Dict] = None, 
+                 composite_bodies: Optional[Dict] = None, 
+                 force_laws: Optional[Dict[str, ForceLaw]] = None):
+        self.unit_system = unit_system
+        self.particle_zoo = PARTICLE_ZOO if particle_zoo is None else particle_zoo
+        self.composite_bodies = COMPOSITE_BODIES if composite_bodies is None else composite_bodies
+        self.force_laws = dict(FORCE_LAWS if force_laws is None else force_laws)
+        self.physics = Physics()
+        
+        # The four geometries, in this unit system
+        self.GEOM_STRONG = GEOM_STRONG
+        self.GEOM_EM = GEOM_EM
+        self.GEOM_WEAK = GEOM_WEAK
+        self.GEOM_GRAVITY = gravity_geometry(unit_system)
+    
+    # ========================================================================
+    # Factory Methods
+    # ========================================================================
+    
+    def create_object(self, name: str, momentum_si: float = 0.0) -> QuantumObject:
+        """Create a pure data object"""
+        momentum_natural = momentum_si / self.unit_system.p_planck
+        
+        if name.lower() == "photon":
+            return Photon(momentum_natural)
+        elif name in self.particle_zoo:
+            return MassiveObject(name, momentum_natural, self.particle_zoo)
+        elif name in self.composite_bodies:
+            return MassiveObject(name, momentum_natural, self.composite_bodies)
+        else:
+            raise ValueError(f"Object '{name}' not found.")
+    
+    def create_object_array(self, names: Sequence[str], 
+                            momenta_si: Union[float, Sequence[float]] = 0.0) -> ParticleTable:
+        """
+        Vectorized create_object: one row per name, with momenta in SI (one
+        per name, or one for all). Each distinct name is resolved once.
+        """
+        table = ParticleTable(self.particle_zoo, self.composite_bodies)
+        momenta_natural = np.asarray(momenta_si, dtype=float) / self.unit_system.p_planck
+        table.extend(names, momenta_natural)
+        return table
+    
+    # ========================================================================
+    # Property Access Methods
+    # ========================================================================
+    
+    def get_total_energy(self, obj: QuantumObject) -> Quantity:
+        e_nat = obj.total_energy_natural()
+        return Quantity(e_nat, "energy", self.unit_system)
+    
+    def get_momentum(self, obj: QuantumObject) -> Quantity:
+        return Quantity(obj.momentum_natural, "momentum", self.unit_system)
+    
+    def get_velocity(self, obj: QuantumObject) -> Quantity:
+        e_nat = obj.total_energy_natural()
+        p_nat = obj.momentum_natural
+        beta = self.physics.velocity_beta(e_nat, p_nat)
+        return Quantity(beta, "velocity", self.unit_system)
+    
+    def get_rest_mass(self, obj: MassiveObject) -> Quantity:
+        if not isinstance(obj, MassiveObject):
+            raise TypeError("Only MassiveObjects have rest mass.")
+        return Quantity(obj.rest_mass_natural, "mass", self.unit_system)
+    
+    # Arrays of objects: a ParticleTable is read column by column, any other
+    # sequence of QuantumObjects object by object.
+    
+    def get_total_energy_array(self, objects: Union[ParticleTable, Sequence[QuantumObject]]) -> QuantityArray:
+        """Vectorized get_total_energy."""
+        if isinstance(objects, ParticleTable):
+            e_nat = objects.total_energies_natural()
+        else:
+            e_nat = [obj.total_energy_natural() for obj in objects]
+        return QuantityArray(e_nat, "energy", self.unit_system)
+    
+    def get_momentum_array(self, objects: Union[ParticleTable, Sequence[QuantumObject]]) -> QuantityArray:
+        """Vectorized get_momentum."""
+        if isinstance(objects, ParticleTable):
+            p_nat = objects.momenta_natural
+        else:
+            p_nat = [obj.momentum_natural for obj in objects]
+        return QuantityArray(p_nat, "momentum", self.unit_system)
+    
+    def get_velocity_array(self, objects: Union[ParticleTable, Sequence[QuantumObject]]) -> QuantityArray:
+        """Vectorized get_velocity."""
+        if isinstance(objects, ParticleTable):
+            beta = objects.velocities_beta()
+        else:
+            e_nat = np.array([obj.total_energy_natural() for obj in objects], dtype=float)
+            p_nat = np.array([obj.momentum_natural for obj in objects], dtype=float)
+            beta = self.physics.velocity_beta(e_nat, p_nat)
+        return QuantityArray(beta, "velocity", self.unit_system)
+    
+    def get_rest_mass_array(self, objects: Union[ParticleTable, Sequence[QuantumObject]]) -> QuantityArray:
+        """Vectorized get_rest_mass; every object must be a MassiveObject."""
+        if isinstance(objects, ParticleTable):
+            if not objects.massive().all():
+                raise TypeError("Only MassiveObjects have rest mass.")
+            m_nat = objects.rest_masses_natural()
+        else:
+            objects = list(objects)
+            if not all(isinstance(obj, MassiveObject) for obj in objects):
+                raise TypeError("Only MassiveObjects have rest mass.")
+            m_nat = [obj.rest_mass_natural for obj in objects]
+        return QuantityArray(m_nat, "mass", self.unit_system)
+    
+    # ========================================================================
+    # Natural-Scale Calculations: Quantity in, Quantity out
+    # ========================================================================
+    
+    def mass_energy_equivalence(self, mass: Quantity) -> Quantity:
+        """E = mc² (in SI) or E ~ m (in natural units)."""
+        E_natural = self.physics.energy_mass_equivalence(mass.natural_value)
+        return Quantity(E_natural, "energy", self.unit_system)
+    
+    def time_dilation(self, mass: Quantity, radius: Quantity) -> Quantity:
+        """Dimensionless time field: Δt/t = (G/c²)(m/r) = (m/r)_natural"""
+        tf_natural = self.physics.time_dilation_potential(
+            mass.natural_value, radius.natural_value
+        )
+        return Quantity(tf_natural, "dimensionless", self.unit_system)
+    
+    def escape_velocity(self, mass: Quantity, radius: Quantity) -> Quantity:
+        """v_e = β*c where β = sqrt(2m/r) in natural units."""
+        beta = self.physics.escape_velocity_beta(
+            mass.natural_value, radius.natural_value
+        )
+        return Quantity(beta, "velocity", self.unit_system)
+    
+    def schwarzschild_radius(self, mass: Quantity) -> Quantity:
+        """r_s = 2GM/c² (SI) or r_s = 2m (natural)."""
+        r_natural = self.physics.schwarzschild_condition(mass.natural_value)
+        return Quantity(r_natural, "length", self.unit_system)
+    
+    def hawking_temperature(self, mass: Quantity) -> Quantity:
+        """T ~ 1/M in natural units."""
+        T_natural = self.physics.hawking_temperature(mass.natural_value)
+        return Quantity(T_natural, "temperature", self.unit_system)
+    
+    # ========================================================================
+    # Vectorized methods: QuantityArray in, QuantityArray out
+    # ========================================================================
+    # Arguments may mix QuantityArrays and plain Quantities; they broadcast
+    # like NumPy arrays, so a sweep over radii at one mass is one call.
+    
+    def mass_energy_equivalence_array(self, mass: QuantityArray) -> QuantityArray:
+        """Vectorized mass_energy_equivalence."""
+        E_natural = self.physics.energy_mass_equivalence(_natural(mass))
+        return QuantityArray(E_natural, "energy", self.unit_system)
+    
+    def gravitational_force_array(self, m1: QuantityArray, m2: QuantityArray, 
+                                  r: QuantityArray) -> QuantityArray:
+        """Vectorized gravitational_force, over masses and distances."""
+        F_natural = self.physics.gravitational_force(
+            _natural(m1), _natural(m2), _natural(r)
+        )
+        return QuantityArray(F_natural, "force", self.unit_system)
+    
+    def time_dilation_array(self, mass: QuantityArray, 
+                            radius: QuantityArray) -> QuantityArray:
+        """Vectorized time_dilation."""
+        tf_natural = self.physics.time_dilation_potential(
+            _natural(mass), _natural(radius)
+        )
+        return QuantityArray(tf_natural, "dimensionless", self.unit_system)
+    
+    def escape_velocity_array(self, mass: QuantityArray, 
+                              radius: QuantityArray) -> QuantityArray:
+        """Vectorized escape_velocity."""
+        beta = self.physics.escape_velocity_beta(_natural(mass), _natural(radius))
+        return QuantityArray(beta, "velocity", self.unit_system)
+    
+    def schwarzschild_radius_array(self, mass: QuantityArray) -> QuantityArray:
+        """Vectorized schwarzschild_radius."""
+        r_natural = self.physics.schwarzschild_condition(_natural(mass))
+        return QuantityArray(r_natural, "length", self.unit_system)
+    
+    def hawking_temperature_array(self, mass: QuantityArray) -> QuantityArray:
+        """Vectorized hawking_temperature."""
+        T_natural = self.physics.hawking_temperature(_natural(mass))
+        return QuantityArray(T_natural, "temperature", self.unit_system)
+    
+    # ========================================================================
+    # Helper Methods
+    # ========================================================================
+    
+    def _get_nucleon_count(self, obj: QuantumObject) -> int:
+        """Derive integer nucleon count from object's mass"""
+        return nucleon_count(obj, self.unit_system)
+    
+    def _intensity_law(self, name: str) -> IntensityLaw:
+        law = self.force_laws[name]
+        if not isinstance(law, IntensityLaw):
+            raise TypeError(f"The '{name}' force law has no intensity to superpose.")
+        return law
+    
+    # ========================================================================
+    # Force Methods (Pluggable Laws, One Engine)
+    # ========================================================================
+    
+    def nbody_engine(self, theta: Optional[float] = None, 
+                     block_size: int = DEFAULT_BLOCK_SIZE, 
+                     leaf_size: int = DEFAULT_LEAF_SIZE) -> NBodyEngine:
+        """
+        An N-body engine over this API's unit system and force laws: exact,
+        pair by pair, when theta is None, else the Barnes-Hut tree code with
+        opening angle theta (at most MAX_THETA; see tree.error_bound).
+        """
+        if theta is None:
+            return NBodyEngine(self.unit_system, self.force_laws, block_size)
+        return BarnesHutEngine(self.unit_system, self.force_laws, block_size, theta, leaf_size)
+    
+    def force(self, name: str, obj1: QuantumObject, obj2: QuantumObject, 
+              distance_si: float) -> Quantity:
+        """The force between two objects under the force law called name"""
+        try:
+            law = self.force_laws[name]
+        except KeyError:
+            raise ValueError(f"Force law '{name}' not found.") from None
+        r_nat = distance_si / self.unit_system.l_planck
+        F_nat = law.natural_force(obj1, obj2, r_nat, self.unit_system)
+        return Quantity(F_nat, "force", self.unit_system)
+    
+    def gravitational_force(self, obj1: Union[QuantumObject, Quantity], 
+                            obj2: Union[QuantumObject, Quantity], 
+                            distance: Union[float, Quantity]) -> Quantity:
+        """
+        Gravity between two objects distance_si metres apart, through the
+        "gravity" force law. Given two mass Quantities and a length Quantity
+        instead, Newton's law: F = GMm/r² (SI) or F ~ mm/r² (natural).
+        """
+        if isinstance(obj1, Quantity):
+            F_natural = self.physics.gravitational_force(
+                obj1.natural_value, obj2.natural_value, distance.natural_value
+            )
+            return Quantity(F_natural, "force", self.unit_system)
+        return self.force("gravity", obj1, obj2, distance)
+    
+    def coulomb_force(self, obj1: QuantumObject, obj2: QuantumObject, 
+                     distance_si: float) -> Quantity:
+        """EM: the "em" force law over charge states"""
+        return self.force("em", obj1, obj2, distance_si)
+    
+    def strong_force(self, obj1: QuantumObject, obj2: QuantumObject, 
+                    distance_si: float) -> Quantity:
+        """Strong: the "strong" force law over baryon counts"""
+        return self.force("strong", obj1, obj2, distance_si)
+    
+    def weak_force(self, obj1: QuantumObject, obj2: QuantumObject, 
+                  distance_si: float) -> Quantity:
+        """Weak: the "weak" force law"""
+        return self.force("weak", obj1, obj2, distance_si)
+    
+    # ========================================================================
+    # NOVEL METHODS - Geometric Framework Extensions
+    # ========================================================================
+    
+    def net_interaction(self, obj1: QuantumObject, obj2: QuantumObject, 
+                       distance_si: float) -> Quantity:
+        """
+        NOVEL: All interactions happen simultaneously.
+        Intensities superpose BEFORE multiplying.
+        
+        Standard: F_total = F_grav + F_em + ...
+        Novel: F_total = (I1_grav + I1_em + ...) × (I2_grav + I2_em + ...)
+        """
+        r_nat = distance_si / self.unit_system.l_planck
+        gravity = self._intensity_law("gravity")
+        em = self._intensity_law("em")
+        
+        # Total field intensity is the superposition
+        I1_total = gravity.intensity(obj1, r_nat, self.unit_system) + em.intensity(obj1, r_nat, self.unit_system)
+        I2_total = gravity.intensity(obj2, r_nat, self.unit_system) + em.intensity(obj2, r_nat, self.unit_system)
+        
+        # Multiply total intensities
+        F_nat = I1_total * I2_total
+        return Quantity(F_nat, "force", self.unit_system)
+    
+    def interference_term(self, obj1: QuantumObject, obj2: QuantumObject, 
+                         distance_si: float) -> Quantity:
+        """
+        NOVEL: Cross-term when intensities add before multiplying.
+        
+        This is the difference between:
+        - Standard: F_grav + F_em (forces add)
+        - Novel: (I_grav + I_em)² (intensities add, then interact)
+        
+        The cross-term is: 2 × I1_grav × I2_em + 2 × I1_em × I2_grav
+        """
+        r_nat = distance_si / self.unit_system.l_planck
+        gravity = self._intensity_law("gravity")
+        em = self._intensity_law("em")
+        
+        I1_grav = gravity.intensity(obj1, r_nat, self.unit_system)
+        I2_grav = gravity.intensity(obj2, r_nat, self.unit_system)
+        I1_em = em.intensity(obj1, r_nat, self.unit_system)
+        I2_em = em.intensity(obj2, r_nat, self.unit_system)
+        
+        # Standard: forces add separately
+        standard = (I1_grav * I2_grav) + (I1_em * I2_em)
+        
+        # Novel: intensities superpose, then interact
+        novel = (I1_grav + I1_em) * (I2_grav + I2_em)
+        
+        # Cross-term is the difference
+        cross_term = novel - standard
+        return Quantity(cross_term, "force", self.unit_system)
+    
+    def compare_geometries(self) -> Dict[str, float]:
+        """Show the force hierarchy as pure geometric ratios"""
+        return {
+            "strong/em": self.GEOM_STRONG / self.GEOM_EM,
+            "em/weak": self.GEOM_EM / self.GEOM_WEAK,
+            "em/gravity": self.GEOM_EM / self.GEOM_GRAVITY,
+            "strong/gravity": self.GEOM_STRONG / self.GEOM_GRAVITY,
+            "strong_squared/gravity_squared": (self.GEOM_STRONG / self.GEOM_GRAVITY) ** 2
+        }
+    
+    def interaction_strength_by_count(self, geometry: float, count_range: range, 
+                                     distance_si: float) -> List[Tuple[int, float]]:
+        """
+        NOVEL: Show how force scales with discrete integer count.
+        
+        Standard framework treats mass/charge as continuous.
+        This shows force emerges from integer counts.
+        """
+        r_nat = distance_si / self.unit_system.l_planck
+        results = []
+        for count in count_range:
+            F_nat = self.physics.calculate_force(count, count, geometry, r_nat)
+            results.append((count, F_nat * self.unit_system.F_planck))
+        return results
+    
+    def hypothetical_force(self, geometry: float, obj1: QuantumObject, 
+                          obj2: QuantumObject, distance_si: float) -> Quantity:
+        """
+        NOVEL: Explore hypothetical 5th, 6th, ... interactions.
+        
+        What if the substrate had another geometric configuration?
+        Standard framework can't do this - you can't "make up" a coupling constant.
+        To keep one around, add an IntensityLaw to force_laws instead.
+        """
+        r_nat = distance_si / self.unit_system.l_planck
+        law = IntensityLaw("hypothetical", geometry, nucleon_count)
+        F_nat = law.natural_force(obj1, obj2, r_nat, self.unit_system)
+        return Quantity(F_nat, "force", self.unit_system)
+    
+    def fine_structure_from_geometry(self) -> Dict[str, float]:
+        """
+        NOVEL: Derive α from substrate geometry.
+        
+        Standard: α ≈ 1/137 is a measured fundamental constant.
+        Novel: α = (GEOM_EM)² × 2π is derived from lever arm geometry.
+        """
+        alpha_derived = (self.GEOM_EM ** 2) * 2 * math.pi
+        alpha_measured = ALPHA
+        return {
+            "from_geometry": alpha_derived,
+            "measured": alpha_measured,
+            "error": abs(alpha_derived - alpha_measured),
+            "match": abs(alpha_derived - alpha_measured) / alpha_measured < 0.01
+        }
+    
+    # ========================================================================
+    # Coordinate System Info
+    # ========================================================================
+    
+    def show_unit_system_info(self):
+        """Display the Jacobian structure of current coordinate system."""
+        print(f"\n{'='*70}")
+        print(f"COORDINATE SYSTEM: {self.unit_system.name}")
+        print(f"{'='*70}")
+        print("\nBase Jacobians (the 'constants'):")
+        print(f"  c   = {self.unit_system.c:.10e} m/s")
+        print(f"  h   = {self.unit_system.h:.10e} J·s")
+        print(f"  G   = {self.unit_system.G:.10e} m³/(kg·s²)")
+        print(f"  k_B = {self.unit_system.k_B:.10e} J/K")
+        
+        print("\nDerived Jacobians:")
+        print(f"  Hz_kg = h/c²  = {self.unit_system.Hz_kg:.10e} kg/Hz")
+        print(f"  K_Hz  = k_B/h = {self.unit_system.K_Hz:.10e} Hz/K")
+        
+        print("\nNatural Scale References (Planck units):")
+        print(f"  t_P = {self.unit_system.t_planck:.10e} s")
+        print(f"  l_P = {self.unit_system.l_planck:.10e} m")
+        print(f"  m_P = {self.unit_system.m_planck:.10e} kg")
+        print(f"  E_P = {self.unit_system.E_planck:.10e} J")
+        print(f"  T_P = {self.unit_system.T_planck:.10e} K")
+        print(f"  F_P = {self.unit_system.F_planck:.10e} N")
+        print(f"{'='*70}\n")
@@ -0,0 +1,159 @@
+"""
+Pluggable Force Laws
+====================
+
+A force law turns two QuantumObjects at a natural distance into a natural
+force. PhysicsAPI looks its laws up by name ("gravity", "em", "strong",
+"weak", or any other), so a different law, or a hypothetical new one, is a
+dictionary entry rather than another copy of the API.
+
+Two families are provided:
+
+    IntensityLaw      F = (n₁·g/r)(n₂·g/r), the single invariant law with one
+                      geometry g and integer counts n (FORCE_LAWS)
+    InverseSquareLaw  F = k·s₁·s₂/r², the classical laws over a source property
+                      such as rest mass or charge state (CLASSICAL_FORCE_LAWS)
+"""
+
+import abc
+import math
+from typing import Callable, Dict, Union
+
+from .objects import MassiveObject, QuantumObject
+from .physics import Physics
+from .units import UnitSystem
+
+# Fine structure constant, measured
+ALPHA = 1 / 137.036
+
+# Proton mass in kg, the unit of the gravity geometry
+M_NUCLEON_SI = 1.6726e-27
+
+# --- THE FOUR GEOMETRIES (Substrate Configurations) ---
+# 1. Strong: Direct Gear Mesh
+GEOM_STRONG = 1.0
+
+# 2. EM: The Lever Arm
+# From: alpha = (EM_GEOM)² × 2π
+# Therefore: EM_GEOM = sqrt(alpha / (2π))
+GEOM_EM = math.sqrt(ALPHA / (2 * math.pi))
+
+# 3. Weak: Torsion Spring
+GEOM_WEAK = 1.0e-6
+
+
+# 4. Gravity: The Sparse Mesh (Nucleon Mass / Planck Mass)
+def gravity_geometry(unit_system: UnitSystem) -> float:
+    """GEOM_GRAVITY, which depends on the unit system's Planck mass"""
+    return M_NUCLEON_SI / unit_system.m_planck
+
+
+# ============================================================================
+# Counts and sources: what a law reads off each object
+# ============================================================================
+
+def nucleon_count(obj: QuantumObject, unit_system: UnitSystem) -> int:
+    """Derive integer nucleon count from object's mass"""
+    if not isinstance(obj, MassiveObject):
+        return 0
+    # Count = Total_Mass / Nucleon_Mass
+    return int(round(obj.rest_mass_natural / gravity_geometry(unit_system)))
+
+
+def charge_count(obj: QuantumObject, unit_system: UnitSystem) -> int:
+    """Signed integer charge count (±1 for electron/proton, 0 for neutral)"""
+    return obj.charge_state
+
+
+def unit_count(obj: QuantumObject, unit_system: UnitSystem) -> int:
+    """Every object counts once"""
+    return 1
+
+
+def rest_mass(obj: QuantumObject, unit_system: UnitSystem) -> float:
+    """Natural rest mass, 0 for massless objects"""
+    return obj.rest_mass_natural if isinstance(obj, MassiveObject) else 0.0
+
+
+# ============================================================================
+# The laws
+# ============================================================================
+
+class ForceLaw(abc.ABC):
+    """
+    An interaction between two objects. Subclasses define natural_force;
+    a law without one can not be instantiated.
+    """
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    @abc.abstractmethod
+    def natural_force(self, obj1: QuantumObject, obj2: QuantumObject, 
+                      r_nat: float, unit_system: UnitSystem) -> float:
+        """The natural force between obj1 and obj2 at natural distance r_nat."""
+    
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} '{self.name}'>"
+
+
+class IntensityLaw(ForceLaw):
+    """
+    The single invariant law in one geometry: F = sign × I₁ × I₂ with
+    I = (count × geometry) / r.
+    
+    geometry is a number, or a function of the unit system for geometries
+    such as gravity's that are measured against a Planck scale. count reads
+    the integer count off an object.
+    """
+    
+    def __init__(self, name: str, geometry: Union[float, Callable[[UnitSystem], float]], 
+                 count: Callable[[QuantumObject, UnitSystem], int], sign: float = 1.0):
+        super().__init__(name)
+        self.geometry = geometry
+        self.count = count
+        self.sign = sign
+    
+    def geometry_for(self, unit_system: UnitSystem) -> float:
+        return self.geometry(unit_system) if callable(self.geometry) else self.geometry
+    
+    def intensity(self, obj: QuantumObject, r_nat: float, unit_system: UnitSystem) -> float:
+        """I = (count × geometry) / r"""
+        return (self.count(obj, unit_system) * self.geometry_for(unit_system)) / r_nat
+    
+    def natural_force(self, obj1: QuantumObject, obj2: QuantumObject, 
+                      r_nat: float, unit_system: UnitSystem) -> float:
+        F_nat = Physics.calculate_force(self.count(obj1, unit_system), self.count(obj2, unit_system),
+                                        self.geometry_for(unit_system), r_nat)
+        return -F_nat if self.sign < 0 else F_nat
+
+
+class InverseSquareLaw(ForceLaw):
+    """A classical law: F = coupling × s₁ × s₂ / r² over a source property s."""
+    
+    def __init__(self, name: str, source: Callable[[QuantumObject, UnitSystem], float], 
+                 coupling: float = 1.0):
+        super().__init__(name)
+        self.source = source
+        self.coupling = coupling
+    
+    def natural_force(self, obj1: QuantumObject, obj2: QuantumObject, 
+                      r_nat: float, unit_system: UnitSystem) -> float:
+        s1 = self.source(obj1, unit_system)
+        s2 = self.source(obj2, unit_system)
+        return self.coupling * (s1 * s2) / (r_nat ** 2)
+
+
+# Four geometries, one engine. EM flips sign: standard convention is attraction = positive.
+FORCE_LAWS: Dict[str, ForceLaw] = {
+    "strong": IntensityLaw("strong", GEOM_STRONG, nucleon_count),
+    "em": IntensityLaw("em", GEOM_EM, charge_count, sign=-1.0),
+    "weak": IntensityLaw("weak", GEOM_WEAK, unit_count),
+    "gravity": IntensityLaw("gravity", gravity_geometry, nucleon_count),
+}
+
+# Newton's law over rest masses and Coulomb's law over charge states
+CLASSICAL_FORCE_LAWS: Dict[str, ForceLaw] = {
+    "gravity": InverseSquareLaw("gravity", rest_mass),
+    "em": InverseSquareLaw("em", charge_count, ALPHA),
+}
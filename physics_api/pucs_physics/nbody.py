@@ -0,0 +1,260 @@
+"""
+N-Body Engine - Every Pair, Every Geometry, One Array Operation per Block
+=========================================================================
+
+PhysicsAPI works on one pair of objects at a time. The engine works on
+whole systems: arrays of positions, nucleon counts and charge states, and
+gives the net force on every particle under every IntensityLaw at once.
+
+Under an IntensityLaw a particle's intensity at distance r is q/r, with
+q = count × geometry, so a pair interacts with F = sign × qᵢqⱼ/r². The
+engine turns the counts into one row of q per law and evaluates all laws
+together, sharing the distances between them.
+
+Pairs are visited in square blocks of block_size × block_size particles,
+so memory grows with block_size² instead of N², and each block only
+touches two short slices of the input. Only blocks on or above the
+diagonal are evaluated: the force of j on i is minus the force of i on j.
+
+Sign convention as in PhysicsAPI: attraction is positive, so a positive
+pair force pulls i towards j.
+"""
+
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .force_laws import FORCE_LAWS, ForceLaw, IntensityLaw, charge_count, nucleon_count, unit_count
+from .objects import QuantumObject
+from .particle_table import ParticleTable
+from .quantities import QuantityArray
+from .units import SI, UnitSystem
+
+# Particles per block side; a block of all four laws takes about 4 × 8 × 1024² bytes per array
+DEFAULT_BLOCK_SIZE = 1024
+
+# Count function -> the per-particle count array it corresponds to, None means every particle counts once
+COUNT_ARRAYS = {
+    nucleon_count: "nucleons",
+    charge_count: "charges",
+    unit_count: None,
+}
+
+
+def pair_forces_natural(positions: np.ndarray, sources: np.ndarray, signs: np.ndarray,
+                        block_size: int = DEFAULT_BLOCK_SIZE,
+                        potential: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Net force on every particle for several laws at once, in natural units.
+
+    Parameters:
+        positions: (N, 3) natural positions.
+        sources: (L, N) source strength q = count × geometry of every particle, one row per law.
+        signs: (L,) sign of each law, +1 where a positive qᵢqⱼ attracts.
+        block_size: Particles per block side.
+        potential: Also sum the potential energy -sign × qᵢqⱼ/r over all pairs.
+
+    Returns:
+        (L, N, 3) net forces, and (L,) potential energies (zeros unless potential).
+        Coincident particles exert no force on each other, as in Physics.calculate_force.
+    """
+    positions = np.asarray(positions, dtype=float)
+    sources = np.asarray(sources, dtype=float)
+    signs = np.asarray(signs, dtype=float)
+    count = len(positions)
+    forces = np.zeros((len(sources), count, 3))
+    energies = np.zeros(len(sources))
+    signed_sources = sources * signs[:, None]
+
+    for i0 in range(0, count, block_size):
+        i1 = min(i0 + block_size, count)
+        origin = positions[i0]  # block-local coordinates keep the matrix products below accurate
+        xi = positions[i0:i1] - origin
+        qi = signed_sources[:, i0:i1]
+        for j0 in range(i0, count, block_size):
+            j1 = min(j0 + block_size, count)
+            xj = positions[j0:j1] - origin
+            r2 = (xj[None, :, 0] - xi[:, None, 0]) ** 2
+            r2 += (xj[None, :, 1] - xi[:, None, 1]) ** 2
+            r2 += (xj[None, :, 2] - xi[:, None, 2]) ** 2
+
+            keep = r2 > 0
+            if j0 == i0:
+                keep &= np.triu(np.ones(r2.shape, dtype=bool), k=1)  # each pair once, no self pairs
+            inv_r = np.zeros_like(r2)
+            np.divide(1.0, np.sqrt(r2, where=keep, out=np.ones_like(r2)), where=keep, out=inv_r)
+
+            pair = qi[:, :, None] * sources[:, None, j0:j1]   # (L, bi, bj): sign × qᵢqⱼ
+            weights = pair * (inv_r ** 3)[None]
+            # Σⱼ wᵢⱼ (xⱼ - xᵢ) on i, and the opposite on j, as matrix products
+            forces[:, i0:i1] += weights @ xj - weights.sum(axis=2)[:, :, None] * xi
+            forces[:, j0:j1] += weights.transpose(0, 2, 1) @ xi - weights.sum(axis=1)[:, :, None] * xj
+            if potential:
+                energies -= np.einsum("lij,ij->l", pair, inv_r)
+
+    return forces, energies
+
+
+class NBodyEngine:
+    """
+    Pairwise forces of whole particle systems under the IntensityLaws of a
+    force law table, by default the four geometries of FORCE_LAWS.
+
+    Methods taking SI inputs (metres) return QuantityArrays in the unit
+    system; the *_natural methods take and return natural units.
+    """
+
+    def __init__(self, unit_system: UnitSystem = SI,
+                 force_laws: Optional[Dict[str, ForceLaw]] = None,
+                 block_size: int = DEFAULT_BLOCK_SIZE):
+        laws = FORCE_LAWS if force_laws is None else force_laws
+        self.unit_system = unit_system
+        self.laws = {name: law for name, law in laws.items() if isinstance(law, IntensityLaw)}
+        self.block_size = block_size
+
+    # ========================================================================
+    # Inputs
+    # ========================================================================
+
+    @staticmethod
+    def counts_from_objects(objects: Sequence[QuantumObject],
+                            unit_system: UnitSystem = SI) -> Dict[str, np.ndarray]:
+        """nucleons and charges count arrays of a sequence of QuantumObjects, or of a ParticleTable"""
+        if isinstance(objects, ParticleTable):
+            return objects.counts(unit_system)
+        return {
+            "nucleons": np.array([nucleon_count(obj, unit_system) for obj in objects], dtype=float),
+            "charges": np.array([charge_count(obj, unit_system) for obj in objects], dtype=float),
+        }
+
+    def sources(self, counts: Dict[str, np.ndarray], count: int,
+                laws: Optional[Sequence[str]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (L, N) source strengths and (L,) signs of the named laws, all by default.
+
+        counts maps "nucleons" and "charges", or a law's own name for a law
+        with another count function, to per-particle count arrays.
+        """
+        names = list(self.laws) if laws is None else list(laws)
+        keys = [name if name in counts else COUNT_ARRAYS.get(self.laws[name].count, name) for name in names]
+        missing = sorted({key for key in keys if key is not None and key not in counts})
+        if missing:
+            needed = [name for name, key in zip(names, keys) if key in missing]
+            raise ValueError(f"No count array for force laws {', '.join(needed)}; "
+                             f"pass {', '.join(f'counts[{key!r}]' for key in missing)}.")
+        sources = np.empty((len(names), count))
+        signs = np.empty(len(names))
+        for row, (name, key) in enumerate(zip(names, keys)):
+            law = self.laws[name]
+            row_counts = 1.0 if key is None else np.asarray(counts[key], dtype=float)
+            sources[row] = row_counts * law.geometry_for(self.unit_system)
+            signs[row] = -1.0 if law.sign < 0 else 1.0
+        return sources, signs
+
+    # ========================================================================
+    # Natural units
+    # ========================================================================
+
+    def forces_natural(self, positions_nat: np.ndarray, sources: np.ndarray,
+                       signs: np.ndarray) -> np.ndarray:
+        """(L, N, 3) natural net forces for rows of sources; every pair, exactly"""
+        forces, _ = pair_forces_natural(positions_nat, sources, signs, self.block_size)
+        return forces
+
+    def net_forces_natural(self, positions_nat: np.ndarray, counts: Dict[str, np.ndarray],
+                           laws: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """law name -> (N, 3) natural net force on every particle"""
+        names = list(self.laws) if laws is None else list(laws)
+        sources, signs = self.sources(counts, len(positions_nat), names)
+        return dict(zip(names, self.forces_natural(positions_nat, sources, signs)))
+
+    def potential_energy_natural(self, positions_nat: np.ndarray, counts: Dict[str, np.ndarray],
+                                 laws: Optional[Sequence[str]] = None) -> Dict[str, float]:
+        """law name -> natural potential energy of the whole system"""
+        names = list(self.laws) if laws is None else list(laws)
+        sources, signs = self.sources(counts, len(positions_nat), names)
+        _, energies = pair_forces_natural(positions_nat, sources, signs, self.block_size, potential=True)
+        return dict(zip(names, energies.tolist()))
+
+    # ========================================================================
+    # SI in, QuantityArray out
+    # ========================================================================
+
+    def _natural_inputs(self, positions_si, nucleon_counts, charge_states, counts):
+        positions_nat = np.asarray(positions_si, dtype=float) / self.unit_system.l_planck
+        all_counts = dict(counts or {})
+        if nucleon_counts is not None:
+            all_counts["nucleons"] = nucleon_counts
+        if charge_states is not None:
+            all_counts["charges"] = charge_states
+        return positions_nat, all_counts
+
+    def net_forces(self, positions_si: np.ndarray, nucleon_counts: Optional[np.ndarray] = None,
+                   charge_states: Optional[np.ndarray] = None,
+                   counts: Optional[Dict[str, np.ndarray]] = None,
+                   laws: Optional[Sequence[str]] = None) -> Dict[str, QuantityArray]:
+        """
+        Net force on every particle under each law.
+
+        Parameters:
+            positions_si: (N, 3) positions in metres.
+            nucleon_counts, charge_states: (N,) integer counts of every particle.
+            counts: Count arrays of laws with other count functions, by law name.
+            laws: Names of the laws to evaluate, all of them by default.
+
+        Returns:
+            law name -> (N, 3) QuantityArray of forces.
+        """
+        positions_nat, all_counts = self._natural_inputs(positions_si, nucleon_counts, charge_states, counts)
+        return {name: QuantityArray(force, "force", self.unit_system)
+                for name, force in self.net_forces_natural(positions_nat, all_counts, laws).items()}
+
+    def total_force(self, positions_si: np.ndarray, nucleon_counts: Optional[np.ndarray] = None,
+                    charge_states: Optional[np.ndarray] = None,
+                    counts: Optional[Dict[str, np.ndarray]] = None,
+                    laws: Optional[Sequence[str]] = None) -> QuantityArray:
+        """(N, 3) net force on every particle, summed over the laws"""
+        positions_nat, all_counts = self._natural_inputs(positions_si, nucleon_counts, charge_states, counts)
+        forces = self.net_forces_natural(positions_nat, all_counts, laws)
+        return QuantityArray(sum(forces.values()), "force", self.unit_system)
+
+    def superposed_force(self, positions_si: np.ndarray, nucleon_counts: Optional[np.ndarray] = None,
+                         charge_states: Optional[np.ndarray] = None,
+                         counts: Optional[Dict[str, np.ndarray]] = None,
+                         laws: Sequence[str] = ("gravity", "em")) -> QuantityArray:
+        """
+        (N, 3) net force when the intensities of the laws superpose before
+        multiplying, PhysicsAPI.net_interaction for every pair at once:
+        F = (Σ qᵢ)(Σ qⱼ)/r², with attraction positive.
+        """
+        positions_nat, all_counts = self._natural_inputs(positions_si, nucleon_counts, charge_states, counts)
+        sources, _ = self.sources(all_counts, len(positions_nat), laws)
+        total = sources.sum(axis=0, keepdims=True)
+        forces = self.forces_natural(positions_nat, total, np.ones(1))
+        return QuantityArray(forces[0], "force", self.unit_system)
+
+    def pair_intensities(self, positions_si: np.ndarray, nucleon_counts: Optional[np.ndarray] = None,
+                         charge_states: Optional[np.ndarray] = None,
+                         counts: Optional[Dict[str, np.ndarray]] = None,
+                         laws: Optional[Sequence[str]] = None
+                         ) -> Iterator[Tuple[slice, slice, Dict[str, np.ndarray]]]:
+        """
+        Yields (rows, columns, intensities) block by block, where intensities
+        maps each law name to the natural intensity qᵢ/rᵢⱼ of particle i at
+        its distance from particle j, for i in rows and j in columns. A pair's
+        force under the law is sign × I[i, j] × I[j, i]. Coincident pairs
+        have intensity 0.
+        """
+        positions_nat, all_counts = self._natural_inputs(positions_si, nucleon_counts, charge_states, counts)
+        names = list(self.laws) if laws is None else list(laws)
+        sources, _ = self.sources(all_counts, len(positions_nat), names)
+        count = len(positions_nat)
+        for i0 in range(0, count, self.block_size):
+            rows = slice(i0, min(i0 + self.block_size, count))
+            for j0 in range(0, count, self.block_size):
+                columns = slice(j0, min(j0 + self.block_size, count))
+                dx = positions_nat[None, columns] - positions_nat[rows, None]
+                r = np.sqrt(np.einsum("ijk,ijk->ij", dx, dx))
+                inv_r = np.divide(1.0, r, out=np.zeros_like(r), where=r > 0)
+                yield rows, columns, {name: sources[row, rows, None] * inv_r
+                                      for row, name in enumerate(names)}
@@ -0,0 +1,95 @@
+"""
+Layer 3: Presentation - Pure Data Objects and the Particle Zoo
+==============================================================
+
+QuantumObjects know their fundamental, dimensionless state and nothing
+about SI units or any measurement system. The particle zoo and composite
+bodies are Layer 2 data: the σ (natural rest mass) and charge state of
+every known object.
+"""
+
+from typing import Dict, NamedTuple
+
+from .physics import Physics
+from .units import SI
+
+
+class ParticleData(NamedTuple):
+    rest_mass_natural: float
+    charge_state: int
+
+
+PARTICLE_ZOO: Dict[str, ParticleData] = {
+    "electron": ParticleData(9.1093837e-31 / SI.m_planck, -1),
+    "proton":   ParticleData(1.6726219e-27 / SI.m_planck, +1),
+    "neutron":  ParticleData(1.6749274e-27 / SI.m_planck,  0),
+}
+
+COMPOSITE_BODIES: Dict[str, ParticleData] = {
+    "earth": ParticleData(5.972e24 / SI.m_planck, 0),
+    "sun":   ParticleData(1.989e30 / SI.m_planck, 0)
+}
+
+
+class QuantumObject:
+    """
+    A pure data object. It knows its fundamental, dimensionless state.
+    It has NO KNOWLEDGE of SI units or any measurement system.
+    """
+    __slots__ = ("momentum_natural",)
+    
+    def __init__(self, momentum_natural: float):
+        self.momentum_natural = momentum_natural
+    
+    @property
+    def charge_state(self) -> int:
+        raise NotImplementedError
+    
+    def total_energy_natural(self) -> float:
+        raise NotImplementedError
+
+
+class Photon(QuantumObject):
+    """The base case. It IS its momentum."""
+    __slots__ = ()
+    
+    @property
+    def charge_state(self) -> int:
+        return 0
+    
+    def total_energy_natural(self) -> float:
+        return self.momentum_natural
+    
+    def __repr__(self) -> str:
+        return f"<Photon p_nat={self.momentum_natural:.2e}>"
+
+
+class MassiveObject(QuantumObject):
+    """An extension that adds an intrinsic identity (rest mass)."""
+    __slots__ = ("_key", "_data_source")
+    
+    def __init__(self, identity_key: str, momentum_natural: float, data_source: Dict):
+        super().__init__(momentum_natural)
+        self._key = identity_key
+        self._data_source = data_source
+    
+    @property
+    def name(self) -> str:
+        return self._key
+    
+    @property
+    def charge_state(self) -> int:
+        return self._data_source[self._key].charge_state
+    
+    @property
+    def rest_mass_natural(self) -> float:
+        return self._data_source[self._key].rest_mass_natural
+    
+    def total_energy_natural(self) -> float:
+        return Physics.relativistic_energy(self.rest_mass_natural, self.momentum_natural)
+    
+    def __repr__(self) -> str:
+        obj_type = "Particle" if self._data_source is PARTICLE_ZOO else "Body"
+        return (f"<{obj_type} name='{self.name}' "
+                f"p_nat={self.momentum_natural:.2e} "
+                f"σ={self.rest_mass_natural:.2e}>")
@@ -0,0 +1,273 @@
+"""
+Particle Table - Many QuantumObjects, One Array per Property
+============================================================
+
+A MassiveObject keeps its name and the whole particle zoo, and looks its
+σ and charge state up there on every access. That is fine for a handful of
+objects and wasteful for millions.
+
+A ParticleTable stores every particle as one row: a species ID and a
+natural momentum, in typed arrays. Each species (electron, proton, earth,
+photon, ...) is resolved once, when it is first used, and its σ and
+charge state are cached in per-species arrays, so a column of a million
+rest masses is one gather.
+
+Rows are handed out as views, PhotonView and MassiveParticleView. They
+are Photons and MassiveObjects, so anything that takes a QuantumObject
+(PhysicsAPI, the force laws, NBodyEngine) takes them too; they hold only
+the table and the row, and read and write the table's arrays.
+"""
+
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .force_laws import gravity_geometry
+from .objects import COMPOSITE_BODIES, PARTICLE_ZOO, MassiveObject, Photon, QuantumObject
+from .physics import Physics
+from .units import SI, UnitSystem
+
+# Species name of the massless photon, which is in neither data source
+PHOTON = "photon"
+
+
+class _RowView:
+    """momentum_natural backed by a ParticleTable row"""
+    __slots__ = ()
+
+    @property
+    def momentum_natural(self) -> float:
+        return float(self._table._momenta[self._row])
+
+    @momentum_natural.setter
+    def momentum_natural(self, value: float) -> None:
+        self._table._momenta[self._row] = value
+
+    @property
+    def table(self) -> 'ParticleTable':
+        return self._table
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+
+class PhotonView(_RowView, Photon):
+    """A Photon stored as a row of a ParticleTable"""
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: 'ParticleTable', row: int):
+        self._table = table
+        self._row = row
+
+
+class MassiveParticleView(_RowView, MassiveObject):
+    """A MassiveObject stored as a row of a ParticleTable"""
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: 'ParticleTable', row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def _species(self) -> int:
+        return int(self._table._ids[self._row])
+
+    @property
+    def _key(self) -> str:
+        return self._table.species_names[self._species]
+
+    @property
+    def _data_source(self) -> Dict:
+        return self._table.species_sources[self._species]
+
+    @property
+    def charge_state(self) -> int:
+        return int(self._table.species_charge[self._species])
+
+    @property
+    def rest_mass_natural(self) -> float:
+        return float(self._table.species_rest_mass[self._species])
+
+
+class ParticleTable:
+    """
+    Particles as rows of typed arrays: an int32 species ID and a float64
+    natural momentum per particle, and the σ, charge state and kind of each
+    species, cached when the species is first used.
+
+    Species names are resolved like PhysicsAPI.create_object: "photon" in
+    any case, then the particle zoo, then the composite bodies.
+
+    Indexing gives a view of one row, a PhotonView or MassiveParticleView;
+    the column methods give arrays over all rows.
+    """
+
+    def __init__(self, particle_zoo: Optional[Dict] = None,
+                 composite_bodies: Optional[Dict] = None, capacity: int = 0):
+        self.particle_zoo = PARTICLE_ZOO if particle_zoo is None else particle_zoo
+        self.composite_bodies = COMPOSITE_BODIES if composite_bodies is None else composite_bodies
+
+        # Per species, by species ID; the source is None for the photon
+        self.species_names: List[str] = []
+        self.species_sources: List[Optional[Dict]] = []
+        self.species_rest_mass = np.zeros(0)
+        self.species_charge = np.zeros(0, dtype=np.int32)
+        self.species_massive = np.zeros(0, dtype=bool)
+        self._species_ids: Dict[str, int] = {}   # every spelling seen -> species ID
+
+        # Per particle, the first _size rows in use
+        self._ids = np.zeros(capacity, dtype=np.int32)
+        self._momenta = np.zeros(capacity)
+        self._size = 0
+
+    # ========================================================================
+    # Species
+    # ========================================================================
+
+    def species_id(self, name: str) -> int:
+        """The species ID of name, resolving and caching the species on first use"""
+        species = self._species_ids.get(name)
+        if species is not None:
+            return species
+
+        if name.lower() == PHOTON:
+            key, source, rest_mass, charge, massive = PHOTON, None, 0.0, 0, False
+        elif name in self.particle_zoo:
+            key, source = name, self.particle_zoo
+        elif name in self.composite_bodies:
+            key, source = name, self.composite_bodies
+        else:
+            raise ValueError(f"Object '{name}' not found.")
+        if source is not None:
+            data = source[key]
+            rest_mass, charge, massive = data.rest_mass_natural, data.charge_state, True
+
+        if key in self.species_names:   # another spelling of "photon"
+            species = self.species_names.index(key)
+        else:
+            species = len(self.species_names)
+            self.species_names.append(key)
+            self.species_sources.append(source)
+            self.species_rest_mass = np.append(self.species_rest_mass, rest_mass)
+            self.species_charge = np.append(self.species_charge, np.int32(charge))
+            self.species_massive = np.append(self.species_massive, massive)
+        self._species_ids[name] = species
+        return species
+
+    def species_ids_of(self, names: Sequence[str]) -> np.ndarray:
+        """(N,) species IDs of names, resolving each distinct name once"""
+        names = np.asarray(names, dtype=str)
+        unique, inverse = np.unique(names, return_inverse=True)
+        ids = np.array([self.species_id(str(name)) for name in unique], dtype=np.int32)
+        return ids[inverse.reshape(names.shape)]
+
+    # ========================================================================
+    # Rows
+    # ========================================================================
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        if needed <= len(self._ids):
+            return
+        capacity = max(needed, 2 * len(self._ids))
+        ids = np.zeros(capacity, dtype=np.int32)
+        momenta = np.zeros(capacity)
+        ids[:self._size] = self._ids[:self._size]
+        momenta[:self._size] = self._momenta[:self._size]
+        self._ids, self._momenta = ids, momenta
+
+    def append(self, name: str, momentum_natural: float = 0.0) -> Union[PhotonView, MassiveParticleView]:
+        """Adds one particle and returns its view"""
+        species = self.species_id(name)
+        self._reserve(1)
+        row = self._size
+        self._ids[row] = species
+        self._momenta[row] = momentum_natural
+        self._size += 1
+        return self[row]
+
+    def extend(self, names: Sequence[str], momenta_natural: Union[float, Sequence[float]] = 0.0) -> slice:
+        """
+        Adds one particle per name, with natural momenta (one per name, or
+        one for all), and returns the slice of the new rows.
+        """
+        ids = self.species_ids_of(names).reshape(-1)
+        momenta = np.broadcast_to(np.asarray(momenta_natural, dtype=float), ids.shape)
+        self._reserve(len(ids))
+        rows = slice(self._size, self._size + len(ids))
+        self._ids[rows] = ids
+        self._momenta[rows] = momenta
+        self._size += len(ids)
+        return rows
+
+    def __getitem__(self, row: int) -> Union[PhotonView, MassiveParticleView]:
+        """The view of one row"""
+        row = int(row)
+        if row < 0:
+            row += self._size
+        if not 0 <= row < self._size:
+            raise IndexError(f"Row {row} out of range for a table of {self._size} particles")
+        if self.species_massive[self._ids[row]]:
+            return MassiveParticleView(self, row)
+        return PhotonView(self, row)
+
+    def __iter__(self) -> Iterator[QuantumObject]:
+        for row in range(self._size):
+            yield self[row]
+
+    # ========================================================================
+    # Columns (natural units)
+    # ========================================================================
+
+    @property
+    def species_ids(self) -> np.ndarray:
+        """(N,) species ID of every particle"""
+        return self._ids[:self._size]
+
+    @property
+    def momenta_natural(self) -> np.ndarray:
+        """(N,) natural momentum of every particle; writing to it updates the table"""
+        return self._momenta[:self._size]
+
+    def names(self) -> np.ndarray:
+        """(N,) species name of every particle"""
+        return np.array(self.species_names, dtype=str)[self.species_ids]
+
+    def massive(self) -> np.ndarray:
+        """(N,) whether each particle is a MassiveObject"""
+        return self.species_massive[self.species_ids]
+
+    def rest_masses_natural(self) -> np.ndarray:
+        """(N,) σ of every particle, 0 for photons"""
+        return self.species_rest_mass[self.species_ids]
+
+    def charge_states(self) -> np.ndarray:
+        """(N,) charge state of every particle"""
+        return self.species_charge[self.species_ids]
+
+    def total_energies_natural(self) -> np.ndarray:
+        """(N,) total_energy_natural of every particle: √(σ² + p²), or p for photons"""
+        momenta = self.momenta_natural
+        energies = Physics.relativistic_energy(self.rest_masses_natural(), momenta)
+        return np.where(self.massive(), energies, momenta)
+
+    def velocities_beta(self) -> np.ndarray:
+        """(N,) β = p/E of every particle"""
+        return Physics.velocity_beta(self.total_energies_natural(), self.momenta_natural)
+
+    def nucleon_counts(self, unit_system: UnitSystem = SI) -> np.ndarray:
+        """(N,) nucleon count of every particle, as force_laws.nucleon_count gives it"""
+        per_species = np.where(self.species_massive,
+                               np.rint(self.species_rest_mass / gravity_geometry(unit_system)), 0.0)
+        return per_species[self.species_ids]
+
+    def counts(self, unit_system: UnitSystem = SI) -> Dict[str, np.ndarray]:
+        """nucleons and charges count arrays, as NBodyEngine.counts_from_objects gives them"""
+        return {
+            "nucleons": self.nucleon_counts(unit_system),
+            "charges": self.charge_states().astype(float),
+        }
@@ -0,0 +1,118 @@
+"""
+Layer 1: Business Logic - The Actual Physics (Natural/Planck Scale)
+===================================================================
+
+All physics happens here in pure dimensionless ratios. No constants are
+needed - this is reality's native coordinate system. Every law works on
+floats and on NumPy arrays alike.
+"""
+
+import math
+
+import numpy as np
+
+
+def _sqrt(value):
+    """
+    math.sqrt for scalars, so they get a float back and a negative raises
+    ValueError; np.sqrt element by element for arrays, with the same check.
+    """
+    if np.ndim(value) == 0:
+        return math.sqrt(value)
+    value = np.asarray(value, dtype=float)
+    if np.any(value < 0):
+        raise ValueError("math domain error")
+    return np.sqrt(value)
+
+
+class Physics:
+    """Pure physics at natural scale. No magic numbers."""
+    
+    @staticmethod
+    def energy_mass_equivalence(m_natural: float) -> float:
+        """E ~ m in natural units. The actual physics is this simple."""
+        return m_natural
+    
+    @staticmethod
+    def energy_frequency_relation(f_natural: float) -> float:
+        """E ~ f in natural units. Pure 1:1 ratio."""
+        return f_natural
+    
+    @staticmethod
+    def gravitational_force(m1_natural: float, m2_natural: float, 
+                           r_natural: float) -> float:
+        """F ~ m1*m2/r² in natural units. Newton's actual physics."""
+        return m1_natural * m2_natural / (r_natural ** 2)
+    
+    @staticmethod
+    def coulomb_force(q1: int, q2: int, r_natural: float, alpha: float) -> float:
+        """F ~ α*q1*q2/r² in natural units, with integer charge states."""
+        return alpha * (q1 * q2) / (r_natural ** 2)
+    
+    @staticmethod
+    def time_dilation_potential(m_natural: float, r_natural: float) -> float:
+        """Dimensionless time field: tf ~ m/r. The substrate coupling."""
+        return m_natural / r_natural
+    
+    @staticmethod
+    def escape_velocity_beta(m_natural: float, r_natural: float) -> float:
+        """β = sqrt(2*m/r). Dimensionless fraction of natural speed scale."""
+        return _sqrt(2 * m_natural / r_natural)
+    
+    @staticmethod
+    def schwarzschild_condition(m_natural: float) -> float:
+        """r = 2*m when β=1. Simple geometric limit in natural units."""
+        return 2 * m_natural
+    
+    @staticmethod
+    def hawking_temperature(m_natural: float) -> float:
+        """T ~ 1/M in natural units. Inverse relationship."""
+        return 1.0 / m_natural
+    
+    @staticmethod
+    def planck_einstein_energy(f_natural: float) -> float:
+        """E ~ f. Same as energy_frequency_relation, showing unity."""
+        return f_natural
+    
+    @staticmethod
+    def de_broglie_wavelength(m_natural: float, v_natural: float) -> float:
+        """λ ~ 1/(m*v) in natural units."""
+        return 1.0 / (m_natural * v_natural)
+    
+    @staticmethod
+    def relativistic_energy(rest_mass_natural: float, momentum_natural: float) -> float:
+        """E² = m² + p² in natural units"""
+        return _sqrt(rest_mass_natural**2 + momentum_natural**2)
+    
+    @staticmethod
+    def velocity_beta(energy_natural: float, momentum_natural: float) -> float:
+        """β = p/E (velocity as fraction of c), 0 where E is 0"""
+        if np.ndim(energy_natural) == 0:
+            if energy_natural == 0:
+                return 0.0
+            return momentum_natural / energy_natural
+        at_rest = energy_natural == 0
+        return np.where(at_rest, 0.0, momentum_natural / np.where(at_rest, 1.0, energy_natural))
+    
+    @staticmethod
+    def calculate_force(count1: int, count2: int, geometry: float, r_nat: float) -> float:
+        """
+        THE SINGLE INVARIANT LAW
+        
+        Force = Intensity_1 × Intensity_2
+        Intensity = (Integer_Count × Geometry) / r
+        
+        This is the only interaction law in the universe. 0 where r is 0.
+        """
+        if np.ndim(r_nat) == 0:
+            if r_nat == 0:
+                return 0.0
+            I1 = (float(count1) * geometry) / r_nat
+            I2 = (float(count2) * geometry) / r_nat
+            return I1 * I2
+        
+        coincident = r_nat == 0
+        r_safe = np.where(coincident, 1.0, r_nat)
+        I1 = (np.asarray(count1, dtype=float) * geometry) / r_safe
+        I2 = (np.asarray(count2, dtype=float) * geometry) / r_safe
+        return np.where(coincident, 0.0, I1 * I2)
@@ -0,0 +1,127 @@
+"""
+Layer 3: Presentation - Human-Readable Quantities
+=================================================
+
+A Quantity is one value in natural coordinates, tagged with its dimension
+and unit system; a QuantityArray is many values of one dimension. Both are
+converted to SI through the dimension's Jacobian only when they are read.
+"""
+
+from typing import Union
+
+import numpy as np
+
+from .units import DIMENSIONS, SI, UnitSystem, jacobian
+
+
+class Quantity:
+    """A physical quantity with value in both natural and SI coordinates."""
+    
+    def __init__(self, natural_value: float, dimension: str, 
+                 unit_system: UnitSystem = SI):
+        self.natural_value = natural_value
+        self.dimension = dimension
+        self.unit_system = unit_system
+    
+    @property
+    def si_value(self) -> float:
+        """Convert natural value to SI via appropriate Jacobian."""
+        return self.natural_value * jacobian(self.dimension, self.unit_system)
+    
+    @property
+    def si_unit(self) -> str:
+        """Return SI unit string."""
+        return DIMENSIONS[self.dimension][1] if self.dimension in DIMENSIONS else "?"
+    
+    @property
+    def unit(self) -> str:
+        """SI unit string, under the name the force API has always used."""
+        return self.si_unit
+    
+    def __str__(self) -> str:
+        if self.dimension == "dimensionless":
+            return f"{self.si_value:.6e} (dimensionless)"
+        return f"{self.si_value:.6e} {self.si_unit}"
+    
+    def __repr__(self) -> str:
+        return f"Quantity({self.si_value:.6e}, '{self.si_unit}')"
+    
+    @classmethod
+    def from_si(cls, si_value: float, dimension: str, 
+                unit_system: UnitSystem = SI) -> 'Quantity':
+        """Create quantity from SI value (converts to natural)."""
+        natural = si_value / jacobian(dimension, unit_system)
+        
+        return cls(natural, dimension, unit_system)
+
+
+class QuantityArray:
+    """
+    Many physical quantities of one dimension, held as a NumPy array of
+    natural values. The Jacobian is looked up once per array, so converting
+    a million values to SI is one multiplication.
+    """
+    
+    def __init__(self, natural_values, dimension: str, 
+                 unit_system: UnitSystem = SI):
+        jacobian(dimension, unit_system)  # rejects unknown dimensions
+        self.natural_values = np.asarray(natural_values, dtype=float)
+        self.dimension = dimension
+        self.unit_system = unit_system
+    
+    @property
+    def si_values(self) -> np.ndarray:
+        """Convert natural values to SI via the dimension's Jacobian."""
+        return self.natural_values * jacobian(self.dimension, self.unit_system)
+    
+    @property
+    def si_unit(self) -> str:
+        """Return SI unit string."""
+        return DIMENSIONS[self.dimension][1]
+    
+    def __len__(self) -> int:
+        return len(self.natural_values)
+    
+    def __getitem__(self, index) -> Union[Quantity, 'QuantityArray']:
+        """An integer index gives a Quantity, anything else a QuantityArray."""
+        value = self.natural_values[index]
+        if np.ndim(value) == 0:
+            return Quantity(float(value), self.dimension, self.unit_system)
+        return QuantityArray(value, self.dimension, self.unit_system)
+    
+    def __iter__(self):
+        for value in self.natural_values.flat:
+            yield Quantity(float(value), self.dimension, self.unit_system)
+    
+    def __repr__(self) -> str:
+        return (f"QuantityArray({self.si_values!r}, '{self.si_unit}')"
+                if self.dimension != "dimensionless"
+                else f"QuantityArray({self.si_values!r}, dimensionless)")
+    
+    @classmethod
+    def from_si(cls, si_values, dimension: str, 
+                unit_system: UnitSystem = SI) -> 'QuantityArray':
+        """Create quantities from SI values (converts to natural)."""
+        natural = np.asarray(si_values, dtype=float) / jacobian(dimension, unit_system)
+        return cls(natural, dimension, unit_system)
+    
+    @classmethod
+    def from_quantities(cls, quantities) -> 'QuantityArray':
+        """Pack Quantity objects, all of one dimension and unit system, into an array."""
+        quantities = list(quantities)
+        if not quantities:
+            raise ValueError("Cannot build a QuantityArray from no quantities")
+        dimension = quantities[0].dimension
+        unit_system = quantities[0].unit_system
+        for quantity in quantities:
+            if quantity.dimension != dimension or quantity.unit_system != unit_system:
+                raise ValueError("All quantities must share one dimension and unit system")
+        return cls([quantity.natural_value for quantity in quantities], 
+                   dimension, unit_system)
+
+
+def _natural(quantity: Union[Quantity, QuantityArray]):
+    """Natural value(s) of a Quantity or QuantityArray, for broadcasting."""
+    if isinstance(quantity, QuantityArray):
+        return quantity.natural_values
+    return quantity.natural_value
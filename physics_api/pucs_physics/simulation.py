@@ -0,0 +1,373 @@
+"""
+Simulation - Stepping Whole Systems Through Time
+================================================
+
+PhysicsAPI and the N-body engines evaluate forces at one instant. A
+Simulation moves a system forward: it holds the state of every object as
+arrays (struct of arrays), natural positions, natural momentum vectors,
+rest masses and counts, and steps it with the kick-drift-kick leapfrog
+(velocity Verlet in momentum form):
+
+    p ← p + F(x)·dt/2        kick
+    x ← x + v(p)·dt          drift,  v = p/E,  E = Physics.relativistic_energy(m, |p|)
+    p ← p + F(x)·dt/2        kick
+
+Forces come from the engine's IntensityLaws, the unified force law. The
+Hamiltonian H = Σ E(p) + U(x) is separable, so the leapfrog is symplectic
+and time reversible: its energy error stays bounded instead of drifting,
+and the energy history shows whether dt is small enough.
+
+In natural units c = 1 and the Planck force is the Planck momentum per
+Planck time, so dp/dt = F needs no constants. The force at the end of a
+step is the force at the start of the next one, so each step costs one
+force evaluation.
+
+Checkpoints are .npz archives of the whole state, the step count, the
+energy history and the engine (exact or Barnes-Hut, with its opening angle
+and leaf size); a simulation loaded from one continues exactly where the
+saved one stopped, under the same engine.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .force_laws import rest_mass
+from .nbody import NBodyEngine
+from .objects import QuantumObject
+from .particle_table import ParticleTable
+from .physics import Physics
+from .quantities import Quantity, QuantityArray
+from .tree import BarnesHutEngine
+from .units import SI, UnitSystem, get_unit_system
+
+# Checkpoint layout version, stored in every checkpoint
+CHECKPOINT_FORMAT = 2
+
+# Engines a checkpoint can rebuild, by the kind stored in it
+ENGINES = {"exact": NBodyEngine, "barnes_hut": BarnesHutEngine}
+
+# With a tree engine the energy is recorded every N // RECORD_PARTICLES
+# steps, so the exact O(N²) potential costs about as much as those steps
+RECORD_PARTICLES = 1000
+
+
+def engine_kind(engine: NBodyEngine) -> str:
+    """The ENGINES kind of engine"""
+    for kind, engine_type in ENGINES.items():
+        if type(engine) is engine_type:
+            return kind
+    raise ValueError(f"Cannot checkpoint a {type(engine).__name__}; use one of {', '.join(ENGINES)}")
+
+
+def default_record_every(engine: NBodyEngine, count: int) -> int:
+    """
+    Every step for the exact engine, whose steps cost as much as the exact
+    potential; every count // RECORD_PARTICLES steps for a tree engine.
+    """
+    if isinstance(engine, BarnesHutEngine):
+        return max(1, count // RECORD_PARTICLES)
+    return 1
+
+
+@dataclass
+class SimulationState:
+    """
+    The state of every object, one array per property, in natural units.
+
+    Attributes:
+        positions: (N, 3) natural positions.
+        momenta: (N, 3) natural momentum vectors; |p| is momentum_natural.
+        rest_masses: (N,) natural rest masses σ, 0 for photons.
+        counts: Count arrays by name ("nucleons", "charges", ...), as NBodyEngine takes them.
+        time: Natural time since the start.
+        step: Steps taken since the start.
+    """
+    positions: np.ndarray
+    momenta: np.ndarray
+    rest_masses: np.ndarray
+    counts: Dict[str, np.ndarray] = field(default_factory=dict)
+    time: float = 0.0
+    step: int = 0
+
+    def __post_init__(self):
+        self.positions = np.array(self.positions, dtype=float).reshape(-1, 3)
+        self.momenta = np.array(self.momenta, dtype=float).reshape(-1, 3)
+        self.rest_masses = np.array(self.rest_masses, dtype=float).reshape(-1)
+        self.counts = {name: np.array(values, dtype=float) for name, values in self.counts.items()}
+        count = len(self.positions)
+        if len(self.momenta) != count or len(self.rest_masses) != count:
+            raise ValueError("positions, momenta and rest_masses must describe the same number of objects")
+        for name, values in self.counts.items():
+            if values.shape != (count,):
+                raise ValueError(f"counts['{name}'] must have one entry per object")
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @classmethod
+    def from_objects(cls, objects: Sequence[QuantumObject], positions_si: np.ndarray,
+                     directions: Optional[np.ndarray] = None,
+                     unit_system: UnitSystem = SI) -> 'SimulationState':
+        """
+        The state of QuantumObjects, e.g. from PhysicsAPI.create_object.
+
+        Parameters:
+            objects: The objects, or a ParticleTable; each one's momentum_natural is the length of its momentum.
+            positions_si: (N, 3) positions in metres.
+            directions: (N, 3) directions of motion, normalised here; +x by default.
+            unit_system: The unit system of positions_si.
+        """
+        count = len(objects)
+        if directions is None:
+            directions = np.zeros((count, 3))
+            directions[:, 0] = 1.0
+        directions = np.asarray(directions, dtype=float).reshape(-1, 3)
+        lengths = np.linalg.norm(directions, axis=1, keepdims=True)
+        units = np.divide(directions, lengths, out=np.zeros_like(directions), where=lengths > 0)
+        if isinstance(objects, ParticleTable):
+            momenta = objects.momenta_natural
+            rest_masses = objects.rest_masses_natural()
+        else:
+            momenta = np.array([obj.momentum_natural for obj in objects], dtype=float)
+            rest_masses = np.array([rest_mass(obj, unit_system) for obj in objects], dtype=float)
+        return cls(
+            positions=np.asarray(positions_si, dtype=float) / unit_system.l_planck,
+            momenta=units * momenta[:, None],
+            rest_masses=rest_masses,
+            counts=NBodyEngine.counts_from_objects(objects, unit_system),
+        )
+
+    def copy(self) -> 'SimulationState':
+        """An independent copy of the state"""
+        return SimulationState(self.positions.copy(), self.momenta.copy(), self.rest_masses.copy(),
+                               {name: values.copy() for name, values in self.counts.items()},
+                               self.time, self.step)
+
+    # ========================================================================
+    # Kinematics
+    # ========================================================================
+
+    def momentum_natural(self) -> np.ndarray:
+        """(N,) |p| of every object"""
+        return np.sqrt(np.einsum("ij,ij->i", self.momenta, self.momenta))
+
+    def energies_natural(self) -> np.ndarray:
+        """(N,) total energy E = √(σ² + p²) of every object"""
+        return Physics.relativistic_energy(self.rest_masses, self.momentum_natural())
+
+    def velocities_natural(self) -> np.ndarray:
+        """(N, 3) velocity v = p/E of every object, as a fraction of c"""
+        energies = self.energies_natural()
+        at_rest = energies == 0
+        return self.momenta / np.where(at_rest, 1.0, energies)[:, None] * ~at_rest[:, None]
+
+    def kinetic_energy_natural(self) -> float:
+        """Σ (E - σ), the energy of motion of the whole system"""
+        return float(np.sum(self.energies_natural() - self.rest_masses))
+
+
+class Simulation:
+    """
+    Steps a SimulationState with the leapfrog under the IntensityLaws of an
+    N-body engine: an NBodyEngine for exact forces, or a BarnesHutEngine
+    for large systems.
+
+    record_every sets how often, in steps, the energy is recorded, and 0
+    records only the start. The potential energy is an exact pairwise sum,
+    so recording costs as much as an exact force evaluation; the default,
+    default_record_every, keeps that from swamping a tree engine's steps.
+    """
+
+    def __init__(self, state: SimulationState, engine: Optional[NBodyEngine] = None,
+                 laws: Optional[Sequence[str]] = None, record_every: Optional[int] = None,
+                 energy_history: Optional[List[Tuple[int, float, float]]] = None):
+        self.state = state
+        self.engine = NBodyEngine() if engine is None else engine
+        self.unit_system = self.engine.unit_system
+        self.laws = list(self.engine.laws) if laws is None else list(laws)
+        self.record_every = default_record_every(self.engine, len(state)) if record_every is None else record_every
+        self._sources, self._signs = self.engine.sources(state.counts, len(state), self.laws)
+        self._forces: Optional[np.ndarray] = None
+
+        # (step, natural time, natural energy Σ(E - σ) + U) every record_every steps
+        self.energy_history: List[Tuple[int, float, float]] = list(energy_history or [])
+        if not self.energy_history:
+            self.record_energy()
+
+    @classmethod
+    def from_objects(cls, objects: Sequence[QuantumObject], positions_si: np.ndarray,
+                     directions: Optional[np.ndarray] = None,
+                     engine: Optional[NBodyEngine] = None,
+                     laws: Optional[Sequence[str]] = None,
+                     record_every: Optional[int] = None) -> 'Simulation':
+        """A simulation of QuantumObjects; see SimulationState.from_objects"""
+        unit_system = SI if engine is None else engine.unit_system
+        state = SimulationState.from_objects(objects, positions_si, directions, unit_system)
+        return cls(state, engine, laws, record_every)
+
+    # ========================================================================
+    # Forces and energy
+    # ========================================================================
+
+    def forces_natural(self) -> np.ndarray:
+        """(N, 3) net natural force on every object, summed over the laws"""
+        if self._forces is None:
+            forces = self.engine.forces_natural(self.state.positions, self._sources, self._signs)
+            self._forces = forces.sum(axis=0)
+        return self._forces
+
+    def potential_energy_natural(self) -> float:
+        """U of the whole system, summed over the laws"""
+        energies = self.engine.potential_energy_natural(self.state.positions, self.state.counts, self.laws)
+        return float(sum(energies.values()))
+
+    def energy_natural(self) -> float:
+        """Σ(E - σ) + U: the conserved energy, without the constant rest energies"""
+        return self.state.kinetic_energy_natural() + self.potential_energy_natural()
+
+    def record_energy(self) -> float:
+        """Appends the current energy to energy_history and returns it"""
+        energy = self.energy_natural()
+        self.energy_history.append((self.state.step, self.state.time, energy))
+        return energy
+
+    def energy_drift(self) -> float:
+        """
+        Change of the energy since the first record, relative to |first
+        record|, or absolute if that is 0. Raises ValueError with fewer
+        than two records, when there is nothing to compare.
+        """
+        if len(self.energy_history) < 2:
+            raise ValueError("Energy drift needs at least two energy records; "
+                             "step past record_every or call record_energy")
+        _, _, initial = self.energy_history[0]
+        _, _, latest = self.energy_history[-1]
+        scale = abs(initial)
+        if scale == 0:
+            return latest - initial
+        return (latest - initial) / scale
+
+    # ========================================================================
+    # Stepping
+    # ========================================================================
+
+    def step_natural(self, dt_natural: float) -> None:
+        """One kick-drift-kick step of natural length dt_natural"""
+        state = self.state
+        state.momenta += 0.5 * dt_natural * self.forces_natural()
+        state.positions += dt_natural * state.velocities_natural()
+        self._forces = None
+        state.momenta += 0.5 * dt_natural * self.forces_natural()
+        state.time += dt_natural
+        state.step += 1
+        if self.record_every and state.step % self.record_every == 0:
+            self.record_energy()
+
+    def run_natural(self, steps: int, dt_natural: float) -> 'Simulation':
+        """steps leapfrog steps of natural length dt_natural"""
+        for _ in range(steps):
+            self.step_natural(dt_natural)
+        return self
+
+    def run(self, steps: int, dt_si: float) -> 'Simulation':
+        """steps leapfrog steps of dt_si seconds"""
+        return self.run_natural(steps, dt_si / self.unit_system.t_planck)
+
+    # ========================================================================
+    # SI out
+    # ========================================================================
+
+    @property
+    def time(self) -> Quantity:
+        """Elapsed time"""
+        return Quantity(self.state.time, "time", self.unit_system)
+
+    def positions(self) -> QuantityArray:
+        """(N, 3) positions"""
+        return QuantityArray(self.state.positions, "length", self.unit_system)
+
+    def momenta(self) -> QuantityArray:
+        """(N, 3) momentum vectors"""
+        return QuantityArray(self.state.momenta, "momentum", self.unit_system)
+
+    def velocities(self) -> QuantityArray:
+        """(N, 3) velocities"""
+        return QuantityArray(self.state.velocities_natural(), "velocity", self.unit_system)
+
+    def total_energies(self) -> QuantityArray:
+        """(N,) total energy of every object, rest energy included"""
+        return QuantityArray(self.state.energies_natural(), "energy", self.unit_system)
+
+    def forces(self) -> QuantityArray:
+        """(N, 3) net force on every object"""
+        return QuantityArray(self.forces_natural(), "force", self.unit_system)
+
+    # ========================================================================
+    # Checkpoints
+    # ========================================================================
+
+    def save_checkpoint(self, path: str) -> None:
+        """Writes the state, the unit system, the engine and the energy history to an .npz archive"""
+        state = self.state
+        engine = self.engine
+        us = self.unit_system
+        history = np.array(self.energy_history, dtype=float).reshape(-1, 3)
+        np.savez(
+            path,
+            format=CHECKPOINT_FORMAT,
+            positions=state.positions,
+            momenta=state.momenta,
+            rest_masses=state.rest_masses,
+            count_names=np.array(list(state.counts), dtype=str),
+            counts=np.array(list(state.counts.values()), dtype=float).reshape(len(state.counts), len(state)),
+            time=state.time,
+            step=state.step,
+            laws=np.array(self.laws, dtype=str),
+            record_every=self.record_every,
+            unit_system=np.array([us.name], dtype=str),
+            constants=np.array([us.c, us.h, us.G, us.k_B]),
+            engine=np.array([engine_kind(engine)], dtype=str),
+            block_size=engine.block_size,
+            theta=getattr(engine, "theta", np.nan),
+            leaf_size=getattr(engine, "leaf_size", 0),
+            energy_history=history,
+        )
+
+    @classmethod
+    def load_checkpoint(cls, path: str, engine: Optional[NBodyEngine] = None) -> 'Simulation':
+        """
+        A simulation continuing from a checkpoint written by save_checkpoint.
+        engine defaults to the checkpoint's engine, rebuilt from its kind,
+        block size, theta and leaf size over FORCE_LAWS; pass one for other
+        force laws. Its unit system, kind, theta and leaf size must match.
+        """
+        with np.load(path) as archive:
+            if int(archive["format"]) != CHECKPOINT_FORMAT:
+                raise ValueError(f"{path} has unsupported checkpoint format {int(archive['format'])}")
+            name = str(archive["unit_system"][0])
+            unit_system = get_unit_system(name, *archive["constants"].tolist())
+            kind = str(archive["engine"][0])
+            # The opening angle and leaf size change the forces; the block size does not
+            tree = {}
+            if kind == "barnes_hut":
+                tree = {"theta": float(archive["theta"]), "leaf_size": int(archive["leaf_size"])}
+            if engine is None:
+                engine = ENGINES[kind](unit_system, block_size=int(archive["block_size"]), **tree)
+            elif engine.unit_system != unit_system:
+                raise ValueError(f"{path} was written in {name}, not {engine.unit_system.name}")
+            elif engine_kind(engine) != kind or any(getattr(engine, key) != value for key, value in tree.items()):
+                raise ValueError(f"{path} was written with a {kind} engine {tree}, not this {engine_kind(engine)} one")
+            state = SimulationState(
+                positions=archive["positions"],
+                momenta=archive["momenta"],
+                rest_masses=archive["rest_masses"],
+                counts=dict(zip(archive["count_names"].tolist(), archive["counts"])),
+                time=float(archive["time"]),
+                step=int(archive["step"]),
+            )
+            laws = archive["laws"].tolist()
+            record_every = int(archive["record_every"])
+            history = [(int(step), time, energy) for step, time, energy in archive["energy_history"].tolist()]
+        return cls(state, engine, laws, record_every, history)
@@ -0,0 +1,450 @@
+"""
+Barnes-Hut Tree Code - Far Cells as One Source
+==============================================
+
+Every IntensityLaw has intensity q/r, so far from a group of particles
+their combined intensity is that of their aggregated counts at one point.
+The tree code puts the particles in an octree, aggregates every cell's
+sources (nucleon counts × geometry, charge counts × geometry, one row per
+law), and lets a particle feel a far enough cell as a whole instead of
+particle by particle: O(N log N) instead of O(N²).
+
+Each cell keeps, per law, its total source Q = Σq, its dipole
+p = Σq·s and its traceless quadrupole Σq(3ssᵀ - |s|²I), s being a
+particle's offset from the centre of the cell's bounding box. The dipole
+matters for EM, where a neutral cell has Q = 0 but still pulls; the
+quadrupole makes the error of a cell shrink with the cube of its
+apparent size instead of the square.
+
+Opening criterion: a cell of particles at most b from its centre is used
+whole for a leaf of target particles at least R from that centre when
+b < θ·R. theta is the opening angle: 0 is exact, larger is faster.
+
+Error bound: the multipole series of one source of strength q at distance
+b from the centre, felt at distance R ≥ b/θ, has terms bounded by
+(n+1)·q·θⁿ/R², and the distance to the source itself is at most R(1+θ),
+so dropping everything past the quadrupole costs at most
+
+    ε(θ) = (1+θ)² (4θ³ - 3θ⁴) / (1-θ)²
+
+of that pair's |qᵢqⱼ|/rᵢⱼ². Summed over pairs, for every particle i
+
+    |F_tree - F_exact|ᵢ ≤ ε(θ) · Σⱼ |qᵢqⱼ|/rᵢⱼ²
+
+ε is below 1, a bound that says something, for θ ≤ MAX_THETA = 0.4, and
+larger opening angles are rejected. At the default θ = 0.3, ε = 0.29.
+It is a worst case; few cells are anywhere near b = θR, and for gravity
+on 2000 particles the largest relative error at θ = 0.3 is about 0.4%.
+Octree.forces can also sum each far cell's own h(b/R) = (4a³ - 3a⁴)/(1-a)²,
+a = b/R, giving a much tighter bound for every particle.
+compare_with_exact checks a system against both.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .force_laws import ForceLaw
+from .nbody import DEFAULT_BLOCK_SIZE, NBodyEngine, pair_forces_natural
+from .units import SI, UnitSystem
+
+# Particles per leaf; leaves that are near each other interact particle by particle
+DEFAULT_LEAF_SIZE = 16
+
+# Default opening angle
+DEFAULT_THETA = 0.3
+
+# Largest opening angle accepted; error_bound is below 1 up to here
+MAX_THETA = 0.4
+
+# Levels of the octree; 21 levels of 3 bits fill a 63-bit Morton key
+MAX_DEPTH = 21
+
+# Target row / cell pairs evaluated per array operation
+CHUNK_PAIRS = 4096
+
+# Rounding allowance of compare_with_exact, as a fraction of Σⱼ |qᵢqⱼ|/rᵢⱼ²
+ROUNDING = 1e-9
+
+
+def _truncation(ratio):
+    # h(a) = Σₙ₌₃ (n+1)aⁿ, the worst case of the multipole terms the cells drop, in units of q/R²
+    return (4 * ratio ** 3 - 3 * ratio ** 4) / (1 - ratio) ** 2
+
+
+def error_bound(theta: float) -> float:
+    """ε(θ): worst-case force error as a fraction of Σⱼ |qᵢqⱼ|/rᵢⱼ² (see module docstring)"""
+    if not 0 <= theta < 1:
+        raise ValueError(f"theta must be in [0, 1), got {theta}")
+    return (1 + theta) ** 2 * _truncation(theta)
+
+
+def check_theta(theta: float) -> float:
+    """Returns theta if its error bound is below 1, that is 0 ≤ theta ≤ MAX_THETA, else raises ValueError"""
+    if not 0 <= theta <= MAX_THETA:
+        bound = f", which allows errors of {error_bound(theta):.3g} × Σⱼ |qᵢqⱼ|/rᵢⱼ²" if 0 <= theta < 1 else ""
+        raise ValueError(f"theta must be in [0, {MAX_THETA}], got {theta}{bound}")
+    return theta
+
+
+def _morton_keys(positions: np.ndarray) -> np.ndarray:
+    # Interleaves the bits of the cell coordinates at MAX_DEPTH, so sorting by key sorts
+    # the particles cell by cell at every level of the octree
+    low = positions.min(axis=0)
+    extent = max(float((positions.max(axis=0) - low).max()), np.finfo(float).tiny)
+    cells = ((positions - low) / extent * ((1 << MAX_DEPTH) - 1)).astype(np.uint64)
+    keys = np.zeros(len(positions), dtype=np.uint64)
+    for bit in range(MAX_DEPTH):
+        for axis in range(3):
+            keys |= ((cells[:, axis] >> np.uint64(bit)) & np.uint64(1)) << np.uint64(3 * bit + axis)
+    return keys
+
+
+def _segment_reduce(ufunc, values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    # ufunc.reduce over values[start:end] for every segment, along axis 0
+    padded = np.concatenate([values, values[:1]])   # lets an end equal to len(values) index the array
+    indices = np.empty(2 * len(starts), dtype=np.intp)
+    indices[0::2] = starts
+    indices[1::2] = ends
+    return ufunc.reduceat(padded, indices, axis=0)[0::2]
+
+
+class Octree:
+    """
+    A linear octree over natural positions, with the aggregated sources of
+    every cell.
+
+    Nodes are stored as arrays, in breadth-first order. Each node covers
+    the particles order[start:end], and its children are the nodes
+    first_child to first_child + child_count.
+
+    Attributes:
+        order: Particle indices sorted by Morton key.
+        start, end, first_child, child_count: Per-node ranges and links.
+        centre: (M, 3) centre of each node's particle bounding box.
+        half: (M, 3) half extents of that box.
+        radius: (M,) distance from the centre to the farthest particle, b.
+        total: (L, M) aggregated source Q = Σq of each law.
+        absolute: (L, M) Σ|q| of each law, for the error bounds.
+        dipole: (L, M, 3) p = Σq(x - centre) of each law.
+        quadrupole: (L, M, 3, 3) traceless Σq(3ssᵀ - |s|²I), s = x - centre, of each law.
+        leaves: Indices of the leaf nodes.
+        leaf_particles: (rows, width) particle indices, padded with N. Each leaf takes
+            ceil(size / leaf_size) rows, so a leaf that MAX_DEPTH kept from splitting
+            does not widen the rows of every other leaf; width ≤ leaf_size.
+        first_row, row_count: Per leaf, its first row of leaf_particles and how many.
+    """
+
+    def __init__(self, positions: np.ndarray, sources: np.ndarray,
+                 leaf_size: int = DEFAULT_LEAF_SIZE):
+        positions = np.asarray(positions, dtype=float)
+        sources = np.asarray(sources, dtype=float)
+        count = len(positions)
+        self.positions = positions
+        self.sources = sources
+        self.leaf_size = leaf_size
+
+        keys = _morton_keys(positions) if count else np.zeros(0, dtype=np.uint64)
+        self.order = np.argsort(keys, kind="stable")
+        keys = keys[self.order]
+
+        # Levels top down: every node with more than leaf_size particles is split by the next 3 key bits
+        starts, ends, firsts, counts = [np.array([0])], [np.array([count])], [], []
+        level_starts, level_ends = starts[0], ends[0]
+        total_nodes = 1
+        for level in range(1, MAX_DEPTH + 1):
+            split = (level_ends - level_starts) > leaf_size
+            first = np.full(len(level_starts), -1)
+            child_count = np.zeros(len(level_starts), dtype=int)
+            if not split.any():
+                firsts.append(first)
+                counts.append(child_count)
+                break
+            parents = np.flatnonzero(split)
+            members = np.concatenate([np.arange(level_starts[p], level_ends[p]) for p in parents])
+            prefix = keys[members] >> np.uint64(3 * (MAX_DEPTH - level))
+            new_child = np.ones(len(members), dtype=bool)
+            new_child[1:] = (prefix[1:] != prefix[:-1]) | (members[1:] != members[:-1] + 1)
+            parent_starts = level_starts[parents]
+            child_starts = members[new_child]
+            child_ends = np.append(child_starts[1:], 0)
+            # a child ends where the next one starts, or where its parent ends
+            owner = np.searchsorted(parent_starts, child_starts, side="right") - 1
+            last_of_parent = np.append(owner[1:] != owner[:-1], True)
+            child_ends[last_of_parent] = level_ends[parents[owner[last_of_parent]]]
+            first[parents] = total_nodes + np.searchsorted(owner, np.arange(len(parents)))
+            child_count[parents] = np.bincount(owner, minlength=len(parents))
+            firsts.append(first)
+            counts.append(child_count)
+            starts.append(child_starts)
+            ends.append(child_ends)
+            total_nodes += len(child_starts)
+            level_starts, level_ends = child_starts, child_ends
+        else:
+            firsts.append(np.full(len(level_starts), -1))
+            counts.append(np.zeros(len(level_starts), dtype=int))
+
+        self.start = np.concatenate(starts)
+        self.end = np.concatenate(ends)
+        self.first_child = np.concatenate(firsts)
+        self.child_count = np.concatenate(counts)
+        self.leaves = np.flatnonzero(self.child_count == 0)
+
+        # Cell geometry and aggregated sources, per node, from the sorted particles
+        sorted_positions = positions[self.order]
+        sorted_sources = sources[:, self.order]
+        if count:
+            low = _segment_reduce(np.minimum, sorted_positions, self.start, self.end)
+            high = _segment_reduce(np.maximum, sorted_positions, self.start, self.end)
+        else:
+            low = high = np.zeros((len(self.start), 3))
+        self.centre = (low + high) / 2
+        self.half = (high - low) / 2
+
+        node_of = np.repeat(np.arange(len(self.start)), self.end - self.start)
+        sorted_rows = np.concatenate([np.arange(s, e) for s, e in zip(self.start, self.end)]) if count else np.zeros(0, int)
+        offsets = sorted_positions[sorted_rows] - self.centre[node_of]
+        distance = np.sqrt(np.einsum("ij,ij->i", offsets, offsets))
+        self.radius = np.zeros(len(self.start))
+        np.maximum.at(self.radius, node_of, distance)
+
+        weights = sorted_sources[:, sorted_rows]
+        self.total = np.stack([np.bincount(node_of, row, minlength=len(self.start)) for row in weights]) \
+            if len(sources) else np.zeros((0, len(self.start)))
+        self.absolute = np.stack([np.bincount(node_of, np.abs(row), minlength=len(self.start))
+                                  for row in weights]) if len(sources) else np.zeros((0, len(self.start)))
+        self.dipole = np.stack([
+            np.stack([np.bincount(node_of, row * offsets[:, axis], minlength=len(self.start))
+                      for axis in range(3)], axis=-1)
+            for row in weights]) if len(sources) else np.zeros((0, len(self.start), 3))
+        self.quadrupole = np.zeros((len(sources), len(self.start), 3, 3))
+        for law, row in enumerate(weights):
+            for a in range(3):
+                for b in range(a, 3):
+                    second = 3 * offsets[:, a] * offsets[:, b] - (distance ** 2 if a == b else 0.0)
+                    moment = np.bincount(node_of, row * second, minlength=len(self.start))
+                    self.quadrupole[law, :, a, b] = moment
+                    self.quadrupole[law, :, b, a] = moment
+
+        # Leaf particle tables, leaf_size particles per row, padded with index count, which has zero source
+        sizes = self.end[self.leaves] - self.start[self.leaves]
+        self.row_count = np.maximum(-(-sizes // leaf_size), 1)
+        self.first_row = np.cumsum(self.row_count) - self.row_count
+        row_leaf, row_within = self._leaf_rows(np.arange(len(self.leaves)))
+        row_start = self.start[self.leaves][row_leaf] + (row_within - self.first_row[row_leaf]) * leaf_size
+        row_end = np.minimum(row_start + leaf_size, self.end[self.leaves][row_leaf])
+        width = int(min(sizes.max(), leaf_size)) if count else 0
+        self.leaf_particles = np.full((len(row_start), width), count)
+        for column in range(width):
+            inside = row_start + column < row_end
+            self.leaf_particles[inside, column] = self.order[row_start[inside] + column]
+
+    def _leaf_rows(self, leaf_positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # (which entry of leaf_positions, row of leaf_particles) for every row of those leaves
+        counts = self.row_count[leaf_positions]
+        entry = np.repeat(np.arange(len(leaf_positions)), counts)
+        within = np.arange(len(entry)) - np.repeat(np.cumsum(counts) - counts, counts)
+        return entry, self.first_row[leaf_positions][entry] + within
+
+    def interaction_lists(self, theta: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Walks the tree for every leaf at once.
+
+        Returns:
+            far: (P, 2) [target leaf position in leaves, node] pairs where the node is used whole.
+            near: (Q, 2) [target leaf position, source leaf position] pairs evaluated particle by particle.
+        """
+        leaf_position = np.full(len(self.start), -1)
+        leaf_position[self.leaves] = np.arange(len(self.leaves))
+        leaf_centre = self.centre[self.leaves]
+        leaf_half = self.half[self.leaves]
+
+        targets = np.arange(len(self.leaves))
+        nodes = np.zeros(len(self.leaves), dtype=int)
+        far, near = [], []
+        while len(targets):
+            # distance from the node's centre to the nearest point of the target leaf's box
+            gap = np.maximum(np.abs(self.centre[nodes] - leaf_centre[targets]) - leaf_half[targets], 0.0)
+            reach = np.sqrt(np.einsum("ij,ij->i", gap, gap))
+            accept = self.radius[nodes] < theta * reach
+            far.append(np.stack([targets[accept], nodes[accept]], axis=1))
+
+            is_leaf = self.child_count[nodes] == 0
+            direct = ~accept & is_leaf
+            near.append(np.stack([targets[direct], leaf_position[nodes[direct]]], axis=1))
+
+            opened = ~accept & ~is_leaf
+            children = self.child_count[nodes[opened]]
+            targets = np.repeat(targets[opened], children)
+            firsts = np.repeat(self.first_child[nodes[opened]], children)
+            offsets = np.arange(len(firsts)) - np.repeat(np.cumsum(children) - children, children)
+            nodes = firsts + offsets
+
+        return np.concatenate(far), np.concatenate(near)
+
+    def forces(self, signs: np.ndarray, theta: float = DEFAULT_THETA,
+               error_bounds: bool = False):
+        """
+        (L, N, 3) net force on every particle, attraction positive, as in pair_forces_natural.
+
+        With error_bounds, also returns (L, N) bounds on |F_tree - F_exact| of every
+        particle: each far cell adds |qᵢ| Σ|q| h(b/R)/R² for its own b/R, which is
+        never more than the θ bound of error_bound.
+        """
+        check_theta(theta)
+        signs = np.asarray(signs, dtype=float)
+        count = len(self.positions)
+        laws = len(self.sources)
+        forces = np.zeros((laws, count + 1, 3))
+        bounds = np.zeros((laws, count + 1))
+        if count == 0:
+            return (forces[:, :count], bounds[:, :count]) if error_bounds else forces[:, :count]
+        far, near = self.interaction_lists(theta)
+
+        # Interaction lists by rows of leaf_particles rather than by leaves
+        entry, rows = self._leaf_rows(far[:, 0])
+        far = np.stack([rows, far[entry, 1]], axis=1)
+        entry, targets = self._leaf_rows(near[:, 0])
+        sources_of = near[entry, 1]
+        entry, rows = self._leaf_rows(sources_of)
+        near = np.stack([targets[entry], rows], axis=1)
+
+        # The padding particle, index count, has no source and its results are dropped.
+        # It is placed on the first particle of its row, so it is never at a far cell's centre.
+        located = np.where(self.leaf_particles < count, self.leaf_particles, self.leaf_particles[:, :1])
+        positions = self.positions
+        sources = np.concatenate([self.sources, np.zeros((laws, 1))], axis=1)
+        signed = sources * signs[:, None]
+
+        # Far cells: monopole, dipole and quadrupole of each cell at every particle of the target leaf.
+        # The field of every law is summed first, and multiplied by each particle's own source at the end.
+        fields = np.zeros((laws, count + 1, 3))
+        for chunk in range(0, len(far), CHUNK_PAIRS):
+            pairs = far[chunk:chunk + CHUNK_PAIRS]
+            cells = pairs[:, 1]
+            particles = self.leaf_particles[pairs[:, 0]]                     # (P, S)
+            flat = particles.ravel()
+            d = self.centre[cells][:, None] - positions[located[pairs[:, 0]]]  # (P, S, 3), towards the cell
+            inv_r2 = 1.0 / np.einsum("psk,psk->ps", d, d)                     # far cells are never at r = 0
+            inv_r3 = inv_r2 * np.sqrt(inv_r2)
+            if error_bounds:
+                ratio = self.radius[cells][:, None] * np.sqrt(inv_r2)         # b/R, below theta
+                truncation = _truncation(ratio) * inv_r2
+            for law in range(laws):
+                dipole = self.dipole[law, cells][:, None]                     # (P, 1, 3)
+                quadrupole_d = np.einsum("pkl,psl->psk", self.quadrupole[law, cells], d)
+                # Q d/r³ + p/r³ - 3 (d·p) d/r⁵ + 5/2 (d·𝐐d) d/r⁷ - 𝐐d/r⁵
+                along_d = (self.total[law, cells][:, None]
+                           - 3 * np.einsum("psk,pak->ps", d, dipole) * inv_r2
+                           + 2.5 * np.einsum("psk,psk->ps", d, quadrupole_d) * inv_r2 * inv_r2) * inv_r3
+                field = (along_d[..., None] * d + inv_r3[..., None] * dipole
+                         - (inv_r3 * inv_r2)[..., None] * quadrupole_d)
+                for axis in range(3):
+                    fields[law, :, axis] += np.bincount(flat, field[..., axis].ravel(), minlength=count + 1)
+                if error_bounds:
+                    error = self.absolute[law, cells][:, None] * truncation
+                    bounds[law] += np.bincount(flat, error.ravel(), minlength=count + 1)
+        forces += signed[:, :, None] * fields
+        bounds *= np.abs(sources)
+
+        # Near leaves: every particle pair
+        for chunk in range(0, len(near), CHUNK_PAIRS):
+            pairs = near[chunk:chunk + CHUNK_PAIRS]
+            target = self.leaf_particles[pairs[:, 0]]                          # (P, S)
+            source = self.leaf_particles[pairs[:, 1]]                          # (P, S)
+            flat = target.ravel()
+            d = positions[located[pairs[:, 1]]][:, None] - positions[located[pairs[:, 0]]][:, :, None]   # (P, S, S, 3)
+            r2 = np.einsum("pijk,pijk->pij", d, d)
+            inv_r = np.divide(1.0, np.sqrt(r2), out=np.zeros_like(r2), where=r2 > 0)
+            inv_r3 = inv_r ** 3
+            for law in range(laws):
+                field = np.einsum("pij,pijk->pik", sources[law, source][:, None] * inv_r3, d)
+                contribution = signed[law, target][..., None] * field
+                for axis in range(3):
+                    forces[law, :, axis] += np.bincount(flat, contribution[..., axis].ravel(),
+                                                        minlength=count + 1)
+
+        if error_bounds:
+            return forces[:, :count], bounds[:, :count]
+        return forces[:, :count]
+
+
+def absolute_force_scale(positions: np.ndarray, sources: np.ndarray,
+                         block_size: int = DEFAULT_BLOCK_SIZE) -> np.ndarray:
+    """(L, N) Σⱼ |qᵢqⱼ|/rᵢⱼ² of every particle, the scale error_bound is relative to"""
+    positions = np.asarray(positions, dtype=float)
+    magnitudes = np.abs(np.asarray(sources, dtype=float))
+    count = len(positions)
+    scale = np.zeros(magnitudes.shape)
+    for i0 in range(0, count, block_size):
+        i1 = min(i0 + block_size, count)
+        for j0 in range(0, count, block_size):
+            j1 = min(j0 + block_size, count)
+            d = positions[None, j0:j1] - positions[i0:i1, None]
+            r2 = np.einsum("ijk,ijk->ij", d, d)
+            inv_r2 = np.divide(1.0, r2, out=np.zeros_like(r2), where=r2 > 0)
+            scale[:, i0:i1] += magnitudes[:, i0:i1] * (inv_r2 @ magnitudes[:, j0:j1].T).T
+    return scale
+
+
+def compare_with_exact(positions: np.ndarray, sources: np.ndarray, signs: np.ndarray,
+                       theta: float = DEFAULT_THETA, leaf_size: int = DEFAULT_LEAF_SIZE,
+                       block_size: int = DEFAULT_BLOCK_SIZE) -> Dict[str, float]:
+    """
+    Evaluates a system with the tree code and exactly, pair by pair, and
+    checks the difference against both error bounds. Both allow ROUNDING
+    of Σⱼ |qᵢqⱼ|/rᵢⱼ² for floating point rounding, which they do not cover.
+
+    Returns:
+        dict: theta_bound, error_bound(theta);
+              max_error, the largest |F_tree - F_exact| of any particle and law
+              as a fraction of its Σⱼ |qᵢqⱼ|/rᵢⱼ²;
+              within_theta_bound, whether max_error ≤ theta_bound;
+              max_bound_use, the largest |F_tree - F_exact| as a fraction of the
+              particle's own bound from Octree.forces;
+              within_particle_bounds, whether every particle is within its own bound;
+              max_relative_error, the largest |F_tree - F_exact| / |F_exact|.
+    """
+    exact, _ = pair_forces_natural(positions, sources, signs, block_size)
+    tree, bounds = Octree(positions, sources, leaf_size).forces(signs, theta, error_bounds=True)
+    error = np.linalg.norm(tree - exact, axis=-1)
+    scale = absolute_force_scale(positions, sources, block_size)
+    magnitude = np.linalg.norm(exact, axis=-1)
+
+    def largest(numerator, denominator):
+        return float(np.max(np.divide(numerator, denominator, out=np.zeros_like(numerator),
+                                      where=denominator > 0), initial=0.0))
+
+    theta_bound = error_bound(theta)
+    max_error = largest(error, scale)
+    return {
+        "theta_bound": theta_bound,
+        "max_error": max_error,
+        "within_theta_bound": max_error <= theta_bound + ROUNDING,
+        "max_bound_use": largest(error, bounds),
+        "within_particle_bounds": bool(np.all(error <= bounds + ROUNDING * scale)),
+        "max_relative_error": largest(error, magnitude),
+    }
+
+
+class BarnesHutEngine(NBodyEngine):
+    """
+    NBodyEngine whose forces come from the tree code: every IntensityLaw is
+    a 1/r intensity, so each cell aggregates its nucleon and charge counts
+    (times their geometries) and far cells act as one source.
+
+    theta is the opening angle; see error_bound for what it costs. The
+    potential energy is still summed exactly.
+    """
+
+    def __init__(self, unit_system: UnitSystem = SI,
+                 force_laws: Optional[Dict[str, ForceLaw]] = None,
+                 block_size: int = DEFAULT_BLOCK_SIZE,
+                 theta: float = DEFAULT_THETA, leaf_size: int = DEFAULT_LEAF_SIZE):
+        super().__init__(unit_system, force_laws, block_size)
+        self.theta = check_theta(theta)
+        self.leaf_size = leaf_size
+
+    def forces_natural(self, positions_nat: np.ndarray, sources: np.ndarray,
+                       signs: np.ndarray) -> np.ndarray:
+        return Octree(positions_nat, sources, self.leaf_size).forces(signs, self.theta)
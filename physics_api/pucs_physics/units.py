@@ -0,0 +1,156 @@
+"""
+Layer 2: Coordinate System - Unit Systems and Jacobians
+=======================================================
+
+A UnitSystem is a measurement coordinate system, defined by its four base
+Jacobians (c, h, G, k_B). Every derived Jacobian and Planck scale is worked
+out once, when the system is built, and get_unit_system() interns systems by
+their constants, so one process keeps one set of tables however many APIs
+use it.
+"""
+
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class UnitSystem:
+    """
+    Defines a measurement coordinate system via its Jacobians.
+    
+    Frozen: the derived Jacobians and Planck scales are worked out once, when
+    the system is built, instead of on every access. They live in __slots__
+    rather than dataclass fields, which dataclass(slots=True) would need
+    Python 3.10 for; only the base Jacobians are compared and hashed.
+
+    UnitSystem used to be a NamedTuple, so it still unpacks, indexes and
+    _replace()s like one over (name, c, h, G, k_B). It is no longer a tuple
+    though: isinstance(system, tuple) is False, and it does not compare
+    equal to a plain tuple of its fields.
+    """
+    __slots__ = {
+        "name": "Name of the unit system",
+        # Base Jacobians (the "constants" - really coordinate scaling factors)
+        "c": "length/time scaling (m/s)",
+        "h": "action scaling (J·s)",
+        "G": "gravitational scaling (m³/(kg·s²))",
+        "k_B": "temperature/energy scaling (J/K)",
+        # Derived Jacobians (composed from base Jacobians)
+        "Hz_kg": "Mass/frequency Jacobian: h/c²",
+        "K_Hz": "Temperature/frequency Jacobian: k_B/h",
+        "G_natural": "G in time² units: G * Hz_kg / c³",
+        # Natural scale references (where all Jacobians = 1)
+        "t_planck": "Planck time: sqrt(G_natural)",
+        "l_planck": "Planck length: c * t_P",
+        "m_planck": "Planck mass: Hz_kg / t_P = sqrt(h*c/G)",
+        "E_planck": "Planck energy: m_P * c²",
+        "p_planck": "Planck momentum: m_P * c",
+        "T_planck": "Planck temperature: 1 / (t_P * K_Hz)",
+        "F_planck": "Planck force: m_P * c / t_P = c⁴/G",
+    }
+
+    name: str
+    c: float
+    h: float
+    G: float
+    k_B: float
+    
+    def __post_init__(self):
+        Hz_kg = self.h / (self.c ** 2)
+        K_Hz = self.k_B / self.h
+        G_natural = self.G * Hz_kg / (self.c ** 3)
+        t_planck = math.sqrt(G_natural)
+        m_planck = Hz_kg / t_planck
+        derived = {
+            "Hz_kg": Hz_kg,
+            "K_Hz": K_Hz,
+            "G_natural": G_natural,
+            "t_planck": t_planck,
+            "l_planck": self.c * t_planck,
+            "m_planck": m_planck,
+            "E_planck": m_planck * (self.c ** 2),
+            "p_planck": m_planck * self.c,
+            "T_planck": 1.0 / (t_planck * K_Hz),
+            "F_planck": m_planck * self.c / t_planck,
+        }
+        for attribute, value in derived.items():
+            object.__setattr__(self, attribute, value)
+
+    def __reduce__(self):
+        # The frozen __setattr__ would refuse the default slot by slot restore
+        return type(self), tuple(self)
+
+    # The NamedTuple interface, for callers written against the old UnitSystem
+    _fields = ("name", "c", "h", "G", "k_B")
+
+    def __iter__(self):
+        return iter((self.name, self.c, self.h, self.G, self.k_B))
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __getitem__(self, index):
+        return tuple(self)[index]
+
+    def _asdict(self) -> Dict[str, object]:
+        return dict(zip(self._fields, self))
+
+    def _replace(self, **changes) -> "UnitSystem":
+        unknown = set(changes) - set(self._fields)
+        if unknown:
+            raise ValueError(f"Got unexpected field names: {sorted(unknown)!r}")
+        return type(self)(**{**self._asdict(), **changes})
+
+
+# (name, c, h, G, k_B) -> UnitSystem, for every system built through get_unit_system
+_UNIT_SYSTEMS: Dict[Tuple[str, float, float, float, float], UnitSystem] = {}
+
+
+def get_unit_system(name: str, c: float, h: float, G: float, k_B: float) -> UnitSystem:
+    """The one UnitSystem of this process with these constants, built on first use."""
+    key = (name, c, h, G, k_B)
+    system = _UNIT_SYSTEMS.get(key)
+    if system is None:
+        system = _UNIT_SYSTEMS.setdefault(key, UnitSystem(name, c, h, G, k_B))
+    return system
+
+
+# Predefined coordinate systems
+SI = get_unit_system(
+    name="SI",
+    c=299792458.0,           # m/s (exact, by definition since 2019)
+    h=6.62607015e-34,        # J·s (exact, by definition since 2019)
+    G=6.67430e-11,           # m³/(kg·s²) (measured)
+    k_B=1.380649e-23         # J/K (exact, by definition since 2019)
+)
+
+
+# Dimension -> (UnitSystem Jacobian attribute, SI unit); None means no scaling
+DIMENSIONS: Dict[str, Tuple[Optional[str], str]] = {
+    "mass": ("m_planck", "kg"),
+    "length": ("l_planck", "m"),
+    "time": ("t_planck", "s"),
+    "energy": ("E_planck", "J"),
+    "momentum": ("p_planck", "kg·m/s"),
+    "temperature": ("T_planck", "K"),
+    "force": ("F_planck", "N"),
+    "velocity": ("c", "m/s"),
+    "dimensionless": (None, ""),
+}
+
+
+@lru_cache(maxsize=None)
+def jacobian_table(unit_system: UnitSystem) -> Dict[str, float]:
+    """Natural-to-SI Jacobian of every dimension, worked out once per unit system."""
+    return {dimension: 1.0 if attribute is None else getattr(unit_system, attribute)
+            for dimension, (attribute, unit) in DIMENSIONS.items()}
+
+
+def jacobian(dimension: str, unit_system: UnitSystem = SI) -> float:
+    """Natural-to-SI Jacobian of one dimension."""
+    try:
+        return jacobian_table(unit_system)[dimension]
+    except KeyError:
+        raise ValueError(f"Unknown dimension: {dimension}") from None
@@ -0,0 +1,48 @@
+"""
+Checks that PhysicsAPI's array getters give what its per-object getters give.
+
+Run from physics_api/ with: python -m pytest tests
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pucs_physics import PhysicsAPI
+
+NAMES = ["electron", "photon", "proton", "earth", "neutron", "sun"]
+MOMENTA_SI = [1e-22, 3e-27, 0.0, 1e20, 2e-19, 0.0]
+
+
+def _inputs():
+    api = PhysicsAPI()
+    objects = [api.create_object(name, momentum) for name, momentum in zip(NAMES, MOMENTA_SI)]
+    return api, objects, api.create_object_array(NAMES, MOMENTA_SI)
+
+
+@pytest.mark.parametrize("getter", ["total_energy", "momentum", "velocity"])
+def test_array_getters_match_the_per_object_getters(getter):
+    api, objects, table = _inputs()
+    expected = [getattr(api, f"get_{getter}")(obj) for obj in objects]
+    for source in (objects, table):
+        values = getattr(api, f"get_{getter}_array")(source)
+        assert values.dimension == expected[0].dimension
+        np.testing.assert_allclose(values.natural_values, [q.natural_value for q in expected], rtol=1e-15)
+        np.testing.assert_allclose(values.si_values, [q.si_value for q in expected], rtol=1e-15)
+
+
+def test_rest_mass_array_matches_and_rejects_photons():
+    api, objects, table = _inputs()
+    massive = [obj for name, obj in zip(NAMES, objects) if name != "photon"]
+    expected = [api.get_rest_mass(obj).natural_value for obj in massive]
+    massive_table = api.create_object_array([name for name in NAMES if name != "photon"])
+    assert api.get_rest_mass_array(massive).natural_values.tolist() == expected
+    assert api.get_rest_mass_array(massive_table).natural_values.tolist() == expected
+
+    for source in (objects, table):
+        with pytest.raises(TypeError):
+            api.get_rest_mass_array(source)
@@ -0,0 +1,32 @@
+"""
+Checks of the pluggable force law base.
+
+Run from physics_api/ with: python -m pytest tests
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pucs_physics import FORCE_LAWS, ForceLaw
+
+
+def test_a_law_without_natural_force_can_not_be_instantiated():
+    class Unfinished(ForceLaw):
+        pass
+
+    for incomplete in (ForceLaw, Unfinished):
+        with pytest.raises(TypeError):
+            incomplete("unfinished")
+
+
+def test_a_law_with_natural_force_can():
+    class Constant(ForceLaw):
+        def natural_force(self, obj1, obj2, r_nat, unit_system):
+            return 1.0
+
+    assert Constant("constant").natural_force(None, None, 1.0, None) == 1.0
+    assert all(isinstance(law, ForceLaw) for law in FORCE_LAWS.values())
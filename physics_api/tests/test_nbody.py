@@ -0,0 +1,21 @@
+"""
+Checks of the exact N-body engine's inputs.
+
+Run from physics_api/ with: python -m pytest tests
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pucs_physics import NBodyEngine
+
+
+def test_missing_count_arrays_are_named():
+    positions = np.array([[0.0, 0.0, 0.0], [1e-10, 0.0, 0.0]])
+    with pytest.raises(ValueError, match=r"em; pass counts\['charges'\]"):
+        NBodyEngine().net_forces(positions, nucleon_counts=np.ones(2))
@@ -0,0 +1,77 @@
+"""
+Checks that ParticleTable rows behave like the objects they stand for, and
+that views and columns share one storage.
+
+Run from physics_api/ with: python -m pytest tests
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pucs_physics import COMPOSITE_BODIES, PARTICLE_ZOO, MassiveObject, ParticleTable, Photon
+
+NAMES = ["electron", "photon", "proton", "earth", "Photon", "neutron", "sun", "electron"]
+MOMENTA = [0.5, 2.0, 0.0, 1e30, 3.0, 1e-3, 0.0, 1e-20]
+
+
+def _objects():
+    objects = []
+    for name, momentum in zip(NAMES, MOMENTA):
+        if name.lower() == "photon":
+            objects.append(Photon(momentum))
+        else:
+            objects.append(MassiveObject(name, momentum, PARTICLE_ZOO if name in PARTICLE_ZOO else COMPOSITE_BODIES))
+    return objects
+
+
+def test_views_match_the_objects_they_stand_for():
+    table = ParticleTable()
+    table.extend(NAMES, MOMENTA)
+    for view, obj in zip(table, _objects()):
+        assert isinstance(view, type(obj))
+        assert view.momentum_natural == obj.momentum_natural
+        assert view.charge_state == obj.charge_state
+        assert view.total_energy_natural() == obj.total_energy_natural()
+        if isinstance(obj, MassiveObject):
+            assert view.name == obj.name and view.rest_mass_natural == obj.rest_mass_natural
+
+
+def test_columns_match_the_views():
+    table = ParticleTable()
+    table.extend(NAMES, MOMENTA)
+    views = list(table)
+    assert table.names().tolist() == [view.name if isinstance(view, MassiveObject) else "photon" for view in views]
+    assert table.charge_states().tolist() == [view.charge_state for view in views]
+    assert table.total_energies_natural().tolist() == [view.total_energy_natural() for view in views]
+    assert table.massive().tolist() == [isinstance(view, MassiveObject) for view in views]
+
+
+def test_views_and_columns_write_through_to_the_table():
+    table = ParticleTable(capacity=1)
+    proton = table.append("proton", 1.0)
+    photon = table.append("photon", 2.0)
+
+    proton.momentum_natural = 5.0
+    table.momenta_natural[1] = 7.0
+    assert table.momenta_natural.tolist() == [5.0, 7.0]
+    assert photon.momentum_natural == 7.0
+
+    # growing the table moves its arrays; views read through the table, not a copy
+    table.extend(["electron"] * 10, 1.0)
+    proton.momentum_natural = 6.0
+    assert table.momenta_natural[0] == 6.0 and table[0].momentum_natural == 6.0
+    assert table[-1].momentum_natural == 1.0 and len(table) == 12
+
+    with pytest.raises(IndexError):
+        table[12]
+
+
+def test_unknown_species_are_rejected():
+    with pytest.raises(ValueError):
+        ParticleTable().append("graviton")
+    assert len(ParticleTable()) == 0 and np.array_equal(ParticleTable().momenta_natural, [])
@@ -0,0 +1,38 @@
+"""
+Checks that the natural scale laws keep their scalar behaviour next to the array one.
+
+Run from physics_api/ with: python -m pytest tests
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pucs_physics import Physics
+
+
+def test_scalar_square_root_laws_return_floats():
+    beta = Physics.escape_velocity_beta(1.0, 8.0)
+    energy = Physics.relativistic_energy(3.0, 4.0)
+    assert type(beta) is float and beta == 0.5
+    assert type(energy) is float and energy == 5.0
+
+
+def test_array_square_root_laws_match_the_scalar_ones():
+    masses = np.array([1.0, 2.0, 3.0])
+    radii = np.array([8.0, 1.0, 6.0])
+    assert Physics.escape_velocity_beta(masses, radii).tolist() == [
+        Physics.escape_velocity_beta(m, r) for m, r in zip(masses.tolist(), radii.tolist())]
+    assert Physics.relativistic_energy(masses, radii).tolist() == [
+        Physics.relativistic_energy(m, p) for m, p in zip(masses.tolist(), radii.tolist())]
+
+
+def test_negative_arguments_raise_for_scalars_and_arrays():
+    with pytest.raises(ValueError):
+        Physics.escape_velocity_beta(-1.0, 2.0)
+    with pytest.raises(ValueError):
+        Physics.escape_velocity_beta(np.array([1.0, -1.0]), 2.0)
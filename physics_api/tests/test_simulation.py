@@ -0,0 +1,48 @@
+"""
+Checks of Simulation checkpoints and energy records.
+
+Run from physics_api/ with: python -m pytest tests
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pucs_physics import BarnesHutEngine, NBodyEngine, PhysicsAPI, Simulation
+
+
+def _protons(engine=None, record_every=None, count=50):
+    api = PhysicsAPI()
+    positions = np.random.default_rng(0).normal(size=(count, 3)) * 1e-10
+    return Simulation.from_objects([api.create_object("proton") for _ in range(count)],
+                                   positions, engine=engine, record_every=record_every)
+
+
+def test_checkpoint_keeps_the_tree_engine(tmp_path):
+    sim = _protons(BarnesHutEngine(theta=0.2, leaf_size=4)).run(3, 1e-18)
+    path = str(tmp_path / "tree.npz")
+    sim.save_checkpoint(path)
+
+    loaded = Simulation.load_checkpoint(path)
+    assert isinstance(loaded.engine, BarnesHutEngine)
+    assert (loaded.engine.theta, loaded.engine.leaf_size) == (0.2, 4)
+    np.testing.assert_array_equal(loaded.forces_natural(), sim.forces_natural())
+    with pytest.raises(ValueError):
+        Simulation.load_checkpoint(path, engine=NBodyEngine())
+
+
+def test_energy_drift_needs_two_records():
+    sim = _protons(record_every=0).run(3, 1e-18)
+    with pytest.raises(ValueError):
+        sim.energy_drift()
+    sim.record_energy()
+    assert np.isfinite(sim.energy_drift())
+
+
+def test_tree_engine_records_less_often_on_large_systems():
+    assert _protons(BarnesHutEngine(), count=3000).record_every == 3
+    assert _protons(NBodyEngine(), count=3000).record_every == 1
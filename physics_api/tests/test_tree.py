@@ -0,0 +1,102 @@
+"""
+Regression checks of the Barnes-Hut tree code against the exact pairwise sum.
+
+Run from physics_api/ with: python -m pytest tests
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pucs_physics import (DEFAULT_THETA, MAX_THETA, BarnesHutEngine, PhysicsAPI,
+                          compare_with_exact, error_bound)
+from pucs_physics.nbody import pair_forces_natural
+from pucs_physics.tree import Octree, absolute_force_scale
+
+
+def _gravity_system(count=2000, seed=0):
+    positions = np.random.default_rng(seed).normal(size=(count, 3))
+    return positions, np.ones((1, count)), np.ones(1)
+
+
+def test_default_theta_gives_sub_percent_gravity_error():
+    positions, sources, signs = _gravity_system()
+    exact, _ = pair_forces_natural(positions, sources, signs)
+    tree = Octree(positions, sources).forces(signs, DEFAULT_THETA)
+    relative = np.linalg.norm(tree - exact, axis=-1) / np.linalg.norm(exact, axis=-1)
+    assert relative.max() < 0.01
+
+
+@pytest.mark.parametrize("theta", [0.0, 0.2, DEFAULT_THETA, MAX_THETA])
+def test_tree_stays_within_its_bounds(theta):
+    rng = np.random.default_rng(1)
+    positions = rng.normal(size=(600, 3))
+    counts = np.stack([rng.integers(1, 5, 600), rng.integers(-2, 3, 600)]).astype(float)
+    result = compare_with_exact(positions, counts, np.array([1.0, -1.0]), theta)
+    assert result["within_theta_bound"]
+    assert result["within_particle_bounds"]
+    assert result["theta_bound"] < 1
+
+
+def test_opening_angles_with_a_useless_bound_are_rejected():
+    assert error_bound(MAX_THETA) < 1
+    assert error_bound(MAX_THETA + 0.01) >= 1
+    with pytest.raises(ValueError):
+        BarnesHutEngine(theta=0.5)
+    with pytest.raises(ValueError):
+        Octree(*_gravity_system(20)[:2]).forces(np.ones(1), 0.5)
+
+
+def test_physics_api_switches_between_exact_and_tree():
+    api = PhysicsAPI()
+    positions = np.random.default_rng(2).normal(size=(300, 3)) * 1e-10
+    nucleons = np.full(300, 1.0)
+    charges = np.zeros(300)
+    exact = api.nbody_engine().net_forces(positions, nucleons, charges, laws=["gravity"])
+    tree = api.nbody_engine(theta=0.0).net_forces(positions, nucleons, charges, laws=["gravity"])
+    assert isinstance(api.nbody_engine(theta=DEFAULT_THETA), BarnesHutEngine)
+    np.testing.assert_allclose(tree["gravity"].si_values, exact["gravity"].si_values, rtol=1e-9)
+
+
+def _direct_forces(positions, sources):
+    # every pair from its own separation, as a reference free of block-local rounding
+    d = positions[None] - positions[:, None]
+    r2 = np.einsum("ijk,ijk->ij", d, d)
+    inv_r3 = np.divide(1.0, r2 * np.sqrt(r2), out=np.zeros_like(r2), where=r2 > 0)
+    return np.einsum("ij,ijk->ik", sources[0][:, None] * sources[0][None] * inv_r3, d)
+
+
+def test_cluster_below_the_depth_limit_keeps_leaf_rows_narrow():
+    rng = np.random.default_rng(3)
+    # the cluster is far below extent / 2**MAX_DEPTH, so it stays one leaf of 150 particles
+    positions = np.concatenate([rng.normal(size=(400, 3)) * 1e6, rng.normal(size=(150, 3)) * 1e-3])
+    sources = np.ones((1, len(positions)))
+    tree = Octree(positions, sources)
+    assert tree.leaf_particles.shape[1] <= tree.leaf_size
+    assert tree.row_count.max() >= 150 // tree.leaf_size
+
+    forces = tree.forces(np.ones(1))[0]
+    exact = _direct_forces(positions, sources)
+    error = np.linalg.norm(forces - exact, axis=-1)
+    assert np.all(error <= error_bound(DEFAULT_THETA) * absolute_force_scale(positions, sources)[0])
+    # the cluster's own pairs are near pairs, summed exactly
+    np.testing.assert_allclose(forces[400:], exact[400:], rtol=1e-9)
+
+
+def test_coincident_particles_exert_no_force():
+    forces = Octree(np.zeros((1000, 3)), np.ones((1, 1000))).forces(np.ones(1))
+    assert not forces.any()
+
+
+def test_cell_centred_on_the_origin_gives_no_warnings():
+    group = np.array([[-1.0, -1.0, -1.0], [1.0, 1.0, 1.0], [-1.0, 1.0, 1.0], [1.0, -1.0, -1.0]]) * 0.1
+    positions = np.concatenate([group, np.random.default_rng(0).normal(size=(21, 3)) * 0.5 + 6])
+    tree = Octree(positions, np.ones((1, len(positions))), leaf_size=4)
+    assert any(not tree.centre[leaf].any() for leaf in tree.leaves)
+    with np.errstate(all="raise"):
+        forces = tree.forces(np.ones(1))
+    assert np.isfinite(forces).all()
@@ -0,0 +1,38 @@
+"""
+Checks that UnitSystem still behaves like the NamedTuple it replaced.
+
+Run from physics_api/ with: python -m pytest tests
+"""
+
+import os
+import pickle
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pucs_physics import SI, UnitSystem
+
+
+def test_unpacks_and_indexes_over_its_base_jacobians():
+    name, c, h, G, k_B = SI
+    assert (name, c, h, G, k_B) == (SI.name, SI.c, SI.h, SI.G, SI.k_B)
+    assert SI[1] == SI.c and SI[-1] == SI.k_B
+    assert SI[1:3] == (SI.c, SI.h)
+    assert len(SI) == len(UnitSystem._fields) == 5
+    assert SI._asdict() == {"name": "SI", "c": SI.c, "h": SI.h, "G": SI.G, "k_B": SI.k_B}
+
+
+def test_replace_builds_a_new_system_with_its_derived_jacobians():
+    doubled = SI._replace(name="2c", c=2 * SI.c)
+    assert doubled == UnitSystem("2c", 2 * SI.c, SI.h, SI.G, SI.k_B)
+    assert doubled.Hz_kg == pytest.approx(SI.Hz_kg / 4)
+    assert SI.name == "SI"
+    with pytest.raises(ValueError):
+        SI._replace(speed=1.0)
+
+
+def test_pickles_to_an_equal_system():
+    loaded = pickle.loads(pickle.dumps(SI))
+    assert loaded == SI and loaded.F_planck == SI.F_planck